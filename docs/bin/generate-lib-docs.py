@@ -267,6 +267,12 @@ class FileParser:
             returns = node.returns.id
         elif type(node.returns) == ast.Constant:
             returns = node.returns.value
+        elif type(node.returns) == ast.Subscript and getattr(node.returns.value, "id", None) not in (
+            "Union",
+            "Optional",
+        ):
+            # Generic types (e.g. Iterator[bytes]) are printed as they are written
+            returns = ast.unparse(node.returns)
         elif type(node.returns) == ast.Subscript:
             slice_obj = node.returns.slice
             if isinstance(slice_obj, ast.Tuple):
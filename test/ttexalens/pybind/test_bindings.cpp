@@ -2,6 +2,9 @@
 //
 // SPDX-License-Identifier: Apache-2.0
 
+#include <chrono>
+#include <thread>
+
 #include "bindings.h"
 
 class bindings_implementation : public tt::exalens::ttexalens_implementation {
@@ -90,6 +93,36 @@ void set_ttexalens_test_implementation() {
     set_ttexalens_implementation(std::move(std::make_unique<bindings_implementation>()));
 }
 
+// Implementation that simulates device latency of every read, used to check that Python threads run in parallel.
+class latency_implementation : public tt::exalens::ttexalens_implementation {
+   private:
+    std::chrono::milliseconds latency;
+
+   public:
+    latency_implementation(int latency_ms) : latency(latency_ms) {}
+
+    std::optional<uint32_t> pci_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address) override {
+        std::this_thread::sleep_for(latency);
+        return chip_id;
+    }
+
+    std::optional<std::vector<uint8_t>> pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                                 uint32_t size) override {
+        std::this_thread::sleep_for(latency);
+        return std::vector<uint8_t>(size, chip_id);
+    }
+
+    std::optional<uint32_t> jtag_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address) override {
+        std::this_thread::sleep_for(latency);
+        return chip_id;
+    }
+};
+
+void set_ttexalens_test_latency_implementation(int latency_ms) {
+    set_ttexalens_implementation(std::make_unique<latency_implementation>(latency_ms));
+}
+
 PYBIND11_MODULE(ttexalens_pybind_unit_tests, n) {
     n.def("set_ttexalens_test_implementation", &set_ttexalens_test_implementation);
+    n.def("set_ttexalens_test_latency_implementation", &set_ttexalens_test_latency_implementation);
 }
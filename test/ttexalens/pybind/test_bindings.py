@@ -5,6 +5,10 @@
 import unittest
 import sys
 import os
+import struct
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import Union
 
@@ -20,7 +24,7 @@ if not os.path.isfile(os.path.join(ttexalens_pybind_path, "ttexalens_pybind_unit
     sys.exit(1)
 
 import ttexalens_pybind as pb
-from ttexalens_pybind_unit_tests import set_ttexalens_test_implementation
+from ttexalens_pybind_unit_tests import set_ttexalens_test_implementation, set_ttexalens_test_latency_implementation
 
 
 class TestBindings(unittest.TestCase):
@@ -52,6 +56,87 @@ class TestBindings(unittest.TestCase):
         for x, y in zip(data, rlist):
             assert x == y, "Error: pci_read should return the data written."
 
+    def test_pci_read_into(self):
+        buffer = bytearray(4)
+        assert pb.pci_read_into(4, 4, 4, 4, buffer) is None, "Error: pci_read_into should return None before writing."
+        pb.pci_write(4, 4, 4, 4, bytes([7, 8, 9, 10]), 4)
+        assert pb.pci_read_into(4, 4, 4, 4, buffer) == 4, "Error: pci_read_into should return number of bytes read."
+        assert buffer == bytearray([7, 8, 9, 10]), "Error: pci_read_into should fill the buffer with data written."
+
+        # Reading into part of the larger buffer
+        buffer = bytearray(8)
+        assert pb.pci_read_into(4, 4, 4, 4, memoryview(buffer)[2:6]) == 4, "Error: pci_read_into should read 4 bytes."
+        assert buffer == bytearray([0, 0, 7, 8, 9, 10, 0, 0]), "Error: pci_read_into should fill only memoryview."
+
+        with self.assertRaises(Exception):
+            pb.pci_read_into(4, 4, 4, 4, bytes(4))
+
+    def test_pci_poll32(self):
+        assert pb.pci_poll32(6, 6, 6, 6, 0xFF, 0, 10, 0) is None, "Error: pci_poll32 should return None before writing."
+        pb.pci_write32(6, 6, 6, 6, 0x1234)
+        assert pb.pci_poll32(6, 6, 6, 6, 0xFF, 0x34, 1000, 0) == (
+            0x1234,
+            1,
+        ), "Error: pci_poll32 should stop after first read that matches expected value."
+        value, iterations = pb.pci_poll32(6, 6, 6, 6, 0xFF, 0x12, 10, 100)
+        assert value == 0x1234 and iterations >= 1, "Error: pci_poll32 should return last value read on timeout."
+
+    def test_pci_poll32_raw(self):
+        assert (
+            pb.pci_poll32_raw(7, 7, 0xFF, 0, 10, 0) is None
+        ), "Error: pci_poll32_raw should return None before writing."
+        pb.pci_write32_raw(7, 7, 0x1234)
+        assert pb.pci_poll32_raw(7, 7, 0xFF, 0x34, 1000, 0) == (
+            0x1234,
+            1,
+        ), "Error: pci_poll32_raw should stop after first read that matches expected value."
+        value, iterations = pb.pci_poll32_raw(7, 7, 0xFF, 0x12, 10, 100)
+        assert value == 0x1234 and iterations >= 1, "Error: pci_poll32_raw should return last value read on timeout."
+
+    def test_pci_sample32(self):
+        assert (
+            pb.pci_sample32(10, 10, 10, 10, 10, 0, 16) is None
+        ), "Error: pci_sample32 should return None before writing."
+        pb.pci_write32(10, 10, 10, 10, 0x1234)
+        result = pb.pci_sample32(10, 10, 10, 10, 10, 100, 16)
+        samples, elapsed_us, dropped, count = struct.unpack_from("<QQQI", result)
+        assert samples >= 1 and dropped == 0 and count == 1, "Error: pci_sample32 should count every read."
+        value, value_count, first_us, last_us = struct.unpack_from("<IQQQ", result, struct.calcsize("<QQQI"))
+        assert (value, value_count) == (0x1234, samples), "Error: pci_sample32 should return histogram of values."
+        assert first_us <= last_us <= elapsed_us, "Error: pci_sample32 should return timestamps within sampling time."
+
+    def test_pci_read_gather(self):
+        cores = [(5, 5), (6, 6)]
+        assert pb.pci_read_gather(5, cores, 4, 2) is None, "Error: pci_read_gather should return None before writing."
+        pb.pci_write(5, 5, 5, 4, bytes([1, 2]), 2)
+        pb.pci_write(5, 6, 6, 4, bytes([3, 4]), 2)
+        assert pb.pci_read_gather(5, cores, 4, 2) == [
+            bytes([1, 2]),
+            bytes([3, 4]),
+        ], "Error: pci_read_gather should return data of every core in order of cores."
+        assert pb.pci_read_gather(5, [], 4, 2) == [], "Error: pci_read_gather should return empty list for no cores."
+
+    def test_pci_write_scatter(self):
+        cores = [(8, 8), (9, 9)]
+        assert pb.pci_write_scatter(8, cores, 4, bytes([1, 2]), 2) == 2, "Error: pci_write_scatter should return size."
+        assert pb.pci_read(8, 8, 8, 4, 2) == bytes([1, 2]), "Error: pci_write_scatter should write to first core."
+        assert pb.pci_read(8, 9, 9, 4, 2) == bytes([1, 2]), "Error: pci_write_scatter should write to second core."
+
+    def test_submit_batch(self):
+        assert pb.submit_batch([("pci_read32", 7, 7, 7, 7), ("pci_write32", 7, 7, 7, 7, 11)]) == [
+            None,
+            11,
+        ], "Error: submit_batch should return None for failed operation and results of the others."
+        results = pb.submit_batch(
+            [
+                ("pci_write32", 7, 7, 7, 7, 11),
+                ("pci_read32", 7, 7, 7, 7),
+                ("pci_write", 7, 7, 7, 8, bytes([1, 2, 3])),
+                ("pci_read", 7, 7, 7, 8, 3),
+            ]
+        )
+        assert results == [11, 11, 3, bytes([1, 2, 3])], "Error: submit_batch should return results of all operations."
+
     def pci_write_negative(self, data: list = [1, 2, -3], size=3):
         assert (
             pb.pci_write(5, 5, 5, 5, data, 3) is None
@@ -99,6 +184,38 @@ class TestBindings(unittest.TestCase):
             4,
         ), "Error: convert_from_noc0() should return (3, 4)."
 
+    def test_device_calls_run_in_parallel(self, latency_ms: int = 50, threads: int = 8):
+        set_ttexalens_test_latency_implementation(latency_ms)
+        try:
+            start = time.perf_counter()
+            results = [pb.pci_read32(chip_id, 0, 0, 0) for chip_id in range(threads)]
+            sequential_time = time.perf_counter() - start
+            assert results == list(range(threads)), "Error: pci_read32 should return chip id."
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                start = time.perf_counter()
+                results = list(executor.map(lambda chip_id: pb.pci_read32(chip_id, 0, 0, 0), range(threads)))
+                parallel_time = time.perf_counter() - start
+                assert results == list(range(threads)), "Error: pci_read32 should return chip id."
+
+                start = time.perf_counter()
+                results = list(executor.map(lambda chip_id: pb.pci_read(chip_id, 0, 0, 0, 4), range(threads)))
+                parallel_read_time = time.perf_counter() - start
+                assert results == [bytes([chip_id] * 4) for chip_id in range(threads)], "Error: pci_read failed."
+
+                start = time.perf_counter()
+                results = list(executor.map(lambda chip_id: pb.jtag_read32(chip_id, 0, 0, 0), range(threads)))
+                parallel_jtag_time = time.perf_counter() - start
+                assert results == list(range(threads)), "Error: jtag_read32 should return chip id."
+        finally:
+            set_ttexalens_test_implementation()
+
+        assert parallel_time < sequential_time / 2, "Error: pci_read32 should release GIL while waiting for device."
+        assert parallel_read_time < sequential_time / 2, "Error: pci_read should release GIL while waiting for device."
+        assert (
+            parallel_jtag_time >= threads * latency_ms / 1000
+        ), "Error: jtag_read32 calls should not use JTAG adapter in parallel."
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,9 @@
 //
 // SPDX-License-Identifier: Apache-2.0
 #include <gtest/gtest.h>
+#include <zlib.h>
 
+#include <map>
 #include <memory>
 #include <string>
 #include <zmq.hpp>
@@ -218,3 +220,290 @@ TEST(ttexalens_communication, jtag_write32_axi) {
     test_yaml_request(req, "- type: " + std::to_string(static_cast<int>(tt::exalens::request_type::jtag_write32_axi)) +
                                "\n  chip_id: 1\n  address: 123456\n  data: 987654");
 }
+
+TEST(ttexalens_communication, batch) {
+    // Batch request contains one pci_read32 sub-request prefixed with its size
+    std::string expected_response =
+        "- type: 22\n  count: 1\n  size: 16\n  data: [12, 0, 0, 0, 10, 1, 2, 3, 64, 226, 1, 0, 0, 0, 0, 0]";
+    auto sub_request = tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, 1, 2, 3, 123456};
+    uint32_t sub_request_size = sizeof(sub_request);
+    std::array<uint8_t, sizeof(tt::exalens::batch_request) + sizeof(sub_request_size) + sizeof(sub_request)>
+        request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::batch_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::batch;
+    request->count = 1;
+    request->size = sizeof(sub_request_size) + sizeof(sub_request);
+    memcpy(request->data, &sub_request_size, sizeof(sub_request_size));
+    memcpy(request->data + sizeof(sub_request_size), &sub_request, sizeof(sub_request));
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, expected_response);
+}
+
+TEST(ttexalens_communication, batch_bad_sub_request) {
+    // Only pci read/write requests are allowed inside of batch
+    auto sub_request = tt::exalens::request{tt::exalens::request_type::ping};
+    uint32_t sub_request_size = sizeof(sub_request);
+    std::array<uint8_t, sizeof(tt::exalens::batch_request) + sizeof(sub_request_size) + sizeof(sub_request)>
+        request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::batch_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::batch;
+    request->count = 1;
+    request->size = sizeof(sub_request_size) + sizeof(sub_request);
+    memcpy(request->data, &sub_request_size, sizeof(sub_request_size));
+    memcpy(request->data + sizeof(sub_request_size), &sub_request, sizeof(sub_request));
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, std::string("BAD_REQUEST"));
+}
+
+TEST(ttexalens_communication, pci_read_gather) {
+    std::string expected_response =
+        "- type: 23\n  chip_id: 1\n  address: 123456\n  size: 4\n  core_count: 2\n  data: [2, 3, 4, 5]";
+    std::array<uint8_t, sizeof(tt::exalens::pci_read_gather_request) + 4> request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::pci_read_gather_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::pci_read_gather;
+    request->chip_id = 1;
+    request->address = 123456;
+    request->size = 4;
+    request->core_count = 2;
+    request->data[0] = 2;
+    request->data[1] = 3;
+    request->data[2] = 4;
+    request->data[3] = 5;
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, expected_response);
+}
+
+TEST(ttexalens_communication, pci_read_gather_bad_core_count) {
+    // Request says it contains three cores, but coordinates of only two cores are sent
+    std::array<uint8_t, sizeof(tt::exalens::pci_read_gather_request) + 4> request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::pci_read_gather_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::pci_read_gather;
+    request->core_count = 3;
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, std::string("BAD_REQUEST"));
+}
+
+TEST(ttexalens_communication, pci_poll32) {
+    test_yaml_request(
+        tt::exalens::pci_poll32_request{tt::exalens::request_type::pci_poll32, 1, 2, 3, 123456, 16, 16, 1000, 10},
+        "- type: 24\n  chip_id: 1\n  noc_x: 2\n  noc_y: 3\n  address: 123456\n  mask: 16\n  expected: 16\n  "
+        "timeout_ms: 1000\n  interval_us: 10");
+}
+
+TEST(ttexalens_communication, pci_poll32_raw) {
+    test_yaml_request(
+        tt::exalens::pci_poll32_raw_request{tt::exalens::request_type::pci_poll32_raw, 1, 123456, 16, 16, 1000, 10},
+        "- type: 27\n  chip_id: 1\n  address: 123456\n  mask: 16\n  expected: 16\n  timeout_ms: 1000\n  "
+        "interval_us: 10");
+}
+
+TEST(ttexalens_communication, pci_sample32) {
+    test_yaml_request(
+        tt::exalens::pci_sample32_request{tt::exalens::request_type::pci_sample32, 1, 2, 3, 123456, 1000, 10, 256},
+        "- type: 26\n  chip_id: 1\n  noc_x: 2\n  noc_y: 3\n  address: 123456\n  duration_ms: 1000\n  "
+        "interval_us: 10\n  max_values: 256");
+}
+
+TEST(ttexalens_communication, pci_write_scatter) {
+    std::string expected_response =
+        "- type: 25\n  chip_id: 1\n  address: 123456\n  size: 2\n  core_count: 2\n  data: [2, 3, 4, 5, 10, 11]";
+    std::array<uint8_t, sizeof(tt::exalens::pci_write_scatter_request) + 6> request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::pci_write_scatter_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::pci_write_scatter;
+    request->chip_id = 1;
+    request->address = 123456;
+    request->size = 2;
+    request->core_count = 2;
+    request->data[0] = 2;
+    request->data[1] = 3;
+    request->data[2] = 4;
+    request->data[3] = 5;
+    request->data[4] = 10;
+    request->data[5] = 11;
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, expected_response);
+}
+
+TEST(ttexalens_communication, pci_write_scatter_bad_size) {
+    // Request says it writes two bytes, but only coordinates of cores are sent
+    std::array<uint8_t, sizeof(tt::exalens::pci_write_scatter_request) + 4> request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::pci_write_scatter_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::pci_write_scatter;
+    request->size = 2;
+    request->core_count = 2;
+
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+    auto response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+    ASSERT_EQ(response, std::string("BAD_REQUEST"));
+}
+
+TEST(ttexalens_communication, dealer_pipelined_requests) {
+    // DEALER client sends multiple requests tagged with request id before receiving responses. Server returns request
+    // id together with the response.
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::dealer);
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+
+    auto ping = tt::exalens::request{tt::exalens::request_type::ping};
+    auto get_device_ids = tt::exalens::request{tt::exalens::request_type::get_device_ids};
+    uint32_t ping_id = 1;
+    uint32_t get_device_ids_id = 2;
+    auto send_result = socket.send(zmq::const_buffer(&ping_id, sizeof(ping_id)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(&ping, sizeof(ping)));
+    send_result =
+        socket.send(zmq::const_buffer(&get_device_ids_id, sizeof(get_device_ids_id)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(&get_device_ids, sizeof(get_device_ids)));
+
+    std::map<uint32_t, std::string> responses;
+    for (int i = 0; i < 2; i++) {
+        zmq::message_t id, delimiter, response;
+        auto receive_result = socket.recv(id);
+        ASSERT_TRUE(id.more());
+        ASSERT_EQ(id.size(), sizeof(uint32_t));
+        receive_result = socket.recv(delimiter);
+        ASSERT_TRUE(delimiter.more());
+        ASSERT_EQ(delimiter.size(), 0);
+        receive_result = socket.recv(response);
+        ASSERT_FALSE(response.more());
+        responses[*id.data<uint32_t>()] = response.to_string();
+    }
+    ASSERT_EQ(responses[ping_id], "- type: 1");
+    ASSERT_EQ(responses[get_device_ids_id], "- type: 18");
+}
+
+TEST(ttexalens_communication, set_compression) {
+    // Server only confirms that it supports compression and doesn't change how it responds to the client
+    test_yaml_request(tt::exalens::set_compression_request{tt::exalens::request_type::set_compression, 1, 0}, "OK");
+}
+
+TEST(ttexalens_communication, compression_frame) {
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::req);
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+
+    // Request compression of response regardless of its size. Short response doesn't shrink when compressed, so it is
+    // sent uncompressed
+    zmq::message_t response, payload;
+    auto compression = tt::exalens::compression_frame{1, 0};
+    auto ping = tt::exalens::request{tt::exalens::request_type::ping};
+    auto send_result = socket.send(zmq::const_buffer(&compression, sizeof(compression)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(&ping, sizeof(ping)));
+    auto receive_result = socket.recv(response);
+    ASSERT_TRUE(response.more());
+    ASSERT_EQ(*response.data<tt::exalens::compression_codec>(), tt::exalens::compression_codec::none);
+    receive_result = socket.recv(payload);
+    ASSERT_FALSE(payload.more());
+    ASSERT_EQ(payload.to_string(), "- type: 1");
+
+    // Long repetitive response is compressed
+    constexpr uint32_t data_size = 1000;
+    std::array<uint8_t, sizeof(tt::exalens::pci_write_request) + data_size> request_data = {0};
+    auto request = reinterpret_cast<tt::exalens::pci_write_request*>(&request_data[0]);
+    request->type = tt::exalens::request_type::pci_write;
+    request->size = data_size;
+    auto expected_response = send_message(zmq::const_buffer(request_data.data(), request_data.size())).to_string();
+
+    send_result = socket.send(zmq::const_buffer(&compression, sizeof(compression)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(request_data.data(), request_data.size()));
+    receive_result = socket.recv(response);
+    ASSERT_TRUE(response.more());
+    ASSERT_EQ(*response.data<tt::exalens::compression_codec>(), tt::exalens::compression_codec::zlib);
+    receive_result = socket.recv(payload);
+    ASSERT_FALSE(payload.more());
+    ASSERT_LT(payload.size(), expected_response.size());
+
+    std::string uncompressed(expected_response.size(), '\0');
+    uLongf uncompressed_size = uncompressed.size();
+    ASSERT_EQ(uncompress(reinterpret_cast<Bytef*>(uncompressed.data()), &uncompressed_size, payload.data<Bytef>(),
+                         payload.size()),
+              Z_OK);
+    ASSERT_EQ(uncompressed_size, expected_response.size());
+    ASSERT_EQ(uncompressed, expected_response);
+
+    // Server keeps no compression state, so request without compression frame gets plain response
+    send_result = socket.send(zmq::const_buffer(&ping, sizeof(ping)));
+    receive_result = socket.recv(response);
+    ASSERT_FALSE(response.more());
+    ASSERT_EQ(response.to_string(), "- type: 1");
+}
+
+TEST(ttexalens_communication, compression_frame_pipelined) {
+    // DEALER client sends compression frame after request id and empty delimiter. Response is sent by worker thread.
+    auto server = std::make_unique<yaml_communication>();
+    server->start(DEFAULT_TEST_SERVER_PORT, true);
+    ASSERT_TRUE(server->is_connected());
+
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::dealer);
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+
+    uint32_t request_id = 7;
+    auto compression = tt::exalens::compression_frame{1, 0};
+    auto ping = tt::exalens::request{tt::exalens::request_type::ping};
+    auto send_result = socket.send(zmq::const_buffer(&request_id, sizeof(request_id)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(&compression, sizeof(compression)), zmq::send_flags::sndmore);
+    send_result = socket.send(zmq::const_buffer(&ping, sizeof(ping)));
+
+    zmq::message_t id, delimiter, codec, response;
+    auto receive_result = socket.recv(id);
+    ASSERT_TRUE(id.more());
+    ASSERT_EQ(*id.data<uint32_t>(), request_id);
+    receive_result = socket.recv(delimiter);
+    ASSERT_TRUE(delimiter.more());
+    ASSERT_EQ(delimiter.size(), 0);
+    receive_result = socket.recv(codec);
+    ASSERT_TRUE(codec.more());
+    ASSERT_EQ(*codec.data<tt::exalens::compression_codec>(), tt::exalens::compression_codec::none);
+    receive_result = socket.recv(response);
+    ASSERT_FALSE(response.more());
+    ASSERT_EQ(response.to_string(), "- type: 1");
+}
+
+TEST(ttexalens_communication, set_compression_bad_size) {
+    test_yaml_request(tt::exalens::request{tt::exalens::request_type::set_compression}, "BAD_REQUEST");
+}
+
+TEST(ttexalens_communication, get_statistics) {
+    auto server = start_yaml_server();
+    ASSERT_TRUE(server->is_connected());
+
+    send_message_yaml(tt::exalens::request{tt::exalens::request_type::ping});
+    send_message_yaml(tt::exalens::request{tt::exalens::request_type::ping});
+    send_message_yaml(tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, 1, 2, 3, 123456});
+
+    // Latencies depend on the machine, so only counters are checked
+    auto response =
+        send_message_yaml(tt::exalens::get_statistics_request{tt::exalens::request_type::get_statistics, 1});
+    ASSERT_NE(response.find("- chip_id: -1\n  type: 1\n  count: 2\n  request_bytes: 2\n  response_bytes: 18\n"),
+              std::string::npos);
+    ASSERT_NE(response.find("- chip_id: 1\n  type: 10\n  count: 1\n  request_bytes: 12\n"), std::string::npos);
+
+    // Statistics were reset by previous request
+    response = send_message_yaml(tt::exalens::get_statistics_request{tt::exalens::request_type::get_statistics, 0});
+    ASSERT_EQ(response, "[]");
+}
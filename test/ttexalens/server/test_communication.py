@@ -162,6 +162,25 @@ def jtag_write32_axi():
     )
 
 
+def pipelined_requests():
+    global server_port
+    communication = ttexalens_server_communication("localhost", server_port, pipelined=True)
+    ping = communication.request_async(bytes([1]))
+    get_device_ids = communication.request_async(bytes([18]))
+    check_response(get_device_ids.result(), "- type: 18")
+    check_response(ping.result(), "- type: 1")
+
+
+def set_compression():
+    global server_port
+    communication = ttexalens_server_communication("localhost", server_port)
+    check_response(communication.set_compression(1, 0), "OK")
+    check_response(
+        communication.pci_write(1, 2, 3, 123456, bytes(4)),
+        "- type: 13\n  chip_id: 1\n  noc_x: 2\n  noc_y: 3\n  address: 123456\n  size: 4\n  data: [0, 0, 0, 0]",
+    )
+
+
 def main():
     # Check if at least two arguments are provided (script name + function name)
     if len(sys.argv) < 3:
@@ -128,3 +128,13 @@ TEST(ttexalens_python_communication, jtag_read32_axi) {
 TEST(ttexalens_python_communication, jtag_write32_axi) {
     call_python("jtag_write32_axi", "- type: 53\n  chip_id: 1\n  address: 123456\n  data: 987654\n");
 }
+
+TEST(ttexalens_python_communication, pipelined_requests) {
+    call_python("pipelined_requests", "- type: 18\n- type: 1\n");
+}
+
+TEST(ttexalens_python_communication, set_compression) {
+    call_python("set_compression",
+                "OK\n- type: 13\n  chip_id: 1\n  noc_x: 2\n  noc_y: 3\n  address: 123456\n  size: 4\n  data: [0, 0, 0, "
+                "0]\n");
+}
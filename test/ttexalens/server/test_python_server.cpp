@@ -172,12 +172,44 @@ TEST(ttexalens_python_empty_server, pci_write) { call_python_empty_server("empty
 
 TEST(ttexalens_python_empty_server, get_file) { call_python_empty_server("empty_get_file"); }
 
+TEST(ttexalens_python_empty_server, batch) { call_python_empty_server("empty_batch"); }
+
+TEST(ttexalens_python_empty_server, pci_read_gather) { call_python_empty_server("empty_pci_read_gather"); }
+
+TEST(ttexalens_python_empty_server, pci_write_scatter) { call_python_empty_server("empty_pci_write_scatter"); }
+
+TEST(ttexalens_python_empty_server, pci_poll32) { call_python_empty_server("empty_pci_poll32"); }
+
+TEST(ttexalens_python_empty_server, pci_poll32_raw) { call_python_empty_server("empty_pci_poll32_raw"); }
+
+TEST(ttexalens_python_empty_server, pci_sample32) { call_python_empty_server("empty_pci_sample32"); }
+
 TEST(ttexalens_python_server, pci_write32_pci_read32) { call_python_server("pci_write32_pci_read32"); }
 
 TEST(ttexalens_python_server, pci_write_pci_read) { call_python_server("pci_write_pci_read"); }
 
+TEST(ttexalens_python_server, batch_pci_write_pci_read) { call_python_server("batch_pci_write_pci_read"); }
+
+TEST(ttexalens_python_server, pci_write_pci_read_gather) { call_python_server("pci_write_pci_read_gather"); }
+
+TEST(ttexalens_python_server, pci_write_scatter_pci_read) { call_python_server("pci_write_scatter_pci_read"); }
+
+TEST(ttexalens_python_server, pci_write_pci_read_stream) { call_python_server("pci_write_pci_read_stream"); }
+
+TEST(ttexalens_python_server, pci_write_pci_read_compressed) { call_python_server("pci_write_pci_read_compressed"); }
+
+TEST(ttexalens_python_server, pci_write32_pci_poll32) { call_python_server("pci_write32_pci_poll32"); }
+
+TEST(ttexalens_python_server, pci_write32_pci_sample32) { call_python_server("pci_write32_pci_sample32"); }
+
+TEST(ttexalens_python_server, pci_write32_long_pci_sample32) { call_python_server("pci_write32_long_pci_sample32"); }
+
+TEST(ttexalens_python_server, get_server_statistics) { call_python_server("get_server_statistics"); }
+
 TEST(ttexalens_python_server, pci_write32_raw_pci_read32_raw) { call_python_server("pci_write32_raw_pci_read32_raw"); }
 
+TEST(ttexalens_python_server, pci_write32_raw_pci_poll32_raw) { call_python_server("pci_write32_raw_pci_poll32_raw"); }
+
 TEST(ttexalens_python_server, dma_buffer_read32) { call_python_server("dma_buffer_read32"); }
 
 TEST(ttexalens_python_server, pci_read_tile) { call_python_server("pci_read_tile"); }
@@ -28,7 +28,7 @@ class yaml_not_implemented_server : public server {
             // not allowed in REP/REQ pattern in ZMQ, we receive one more message from the test and ignore it.
             communication::respond(yaml_response);
             zmq::message_t ignored_message;
-            auto receive_result = zmq_socket.recv(ignored_message);
+            auto receive_result = receive(ignored_message);
         }
     }
 
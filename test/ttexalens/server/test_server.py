@@ -4,7 +4,9 @@
 import sys
 from typing import Any, Callable
 
-from ttexalens.tt_exalens_ifc import ttexalens_client, ttexalens_server_not_supported
+from ttexalens import tt_exalens_ifc
+from ttexalens.tt_exalens_ifc import ttexalens_client, ttexalens_server_not_supported, ttexalens_server_request_type
+from ttexalens.tt_exalens_ifc_base import SampleResult
 
 server_port = 0
 server = None
@@ -93,6 +95,37 @@ def empty_get_file():
     check_not_implemented_response(lambda: server.get_file("file_name"))
 
 
+def empty_batch():
+    global server
+    results = server.submit_batch([("pci_read32", 1, 2, 3, 123456), ("pci_write32", 1, 2, 3, 123456, 987654)])
+    print("pass" if results == [None, None] else "fail")
+
+
+def empty_pci_read_gather():
+    global server
+    check_not_implemented_response(lambda: server.pci_read_gather(1, [(2, 3), (4, 5)], 123456, 3))
+
+
+def empty_pci_write_scatter():
+    global server
+    check_not_implemented_response(lambda: server.pci_write_scatter(1, [(2, 3), (4, 5)], 123456, b"abc"))
+
+
+def empty_pci_poll32():
+    global server
+    check_not_implemented_response(lambda: server.pci_poll32(1, 2, 3, 123456, 0xFF, 0x10, 10))
+
+
+def empty_pci_poll32_raw():
+    global server
+    check_not_implemented_response(lambda: server.pci_poll32_raw(1, 123456, 0xFF, 0x10, 10))
+
+
+def empty_pci_sample32():
+    global server
+    check_not_implemented_response(lambda: server.pci_sample32(1, 2, 3, 123456, 10))
+
+
 def pci_write32_pci_read32():
     global server
     server.pci_write32(1, 2, 3, 123456, 987654)
@@ -107,6 +140,125 @@ def pci_write_pci_read():
     print("pass" if read == b"987654" else "fail")
 
 
+def batch_pci_write_pci_read():
+    global server
+    results = server.submit_batch(
+        [
+            ("pci_write32", 1, 2, 3, 123456, 987654),
+            ("pci_read32", 1, 2, 3, 123456),
+            ("pci_write", 1, 2, 3, 234567, b"abc"),
+            ("pci_read", 1, 2, 3, 234567, 3),
+        ]
+    )
+    print("pass" if results == [4, 987654, 3, b"abc"] else "fail")
+
+
+def pci_write_pci_read_gather():
+    global server
+    server.pci_write(1, 2, 3, 123456, b"abc")
+    server.pci_write(1, 4, 5, 123456, b"def")
+    read = server.pci_read_gather(1, [(2, 3), (4, 5)], 123456, 3)
+    print("pass" if read == [b"abc", b"def"] else "fail")
+
+
+def pci_write_scatter_pci_read():
+    global server
+    written = server.pci_write_scatter(1, [(2, 3), (4, 5)], 456789, b"abc")
+    read = [server.pci_read(1, 2, 3, 456789, 3), server.pci_read(1, 4, 5, 456789, 3)]
+    print("pass" if written == 3 and read == [b"abc", b"abc"] else "fail")
+
+
+def pci_write_pci_read_stream():
+    global server, server_port
+    for offset, data in ((0, b"abc"), (3, b"def"), (6, b"gh")):
+        server.pci_write(1, 2, 3, 345678 + offset, data)
+    chunks = list(server.pci_read_stream(1, 2, 3, 345678, 8, chunk_size=3))
+    pipelined_server = ttexalens_client("localhost", server_port, pipelined=True)
+    pipelined_chunks = list(pipelined_server.pci_read_stream(1, 2, 3, 345678, 8, chunk_size=3, window=2))
+    print("pass" if chunks == [b"abc", b"def", b"gh"] and pipelined_chunks == chunks else "fail")
+
+
+def pci_write_pci_read_compressed():
+    global server_port
+    # Large repetitive response is compressed, short responses are sent uncompressed
+    data = b"0123456789abcdef" * 1024
+    compressed_server = ttexalens_client("localhost", server_port, compression=True)
+    compressed_server.pci_write(1, 2, 3, 456789, data)
+    read = compressed_server.pci_read(1, 2, 3, 456789, len(data))
+    view = compressed_server._communication.pci_read_view(1, 2, 3, 456789, len(data))
+    pipelined_server = ttexalens_client("localhost", server_port, pipelined=True, compression=True)
+    pipelined_read = pipelined_server.pci_read_async(1, 2, 3, 456789, len(data)).result()
+    pipelined_server.pci_write32(1, 2, 3, 456789, 987654)
+    read32 = pipelined_server.pci_read32(1, 2, 3, 456789)
+    print("pass" if read == data and bytes(view) == data and pipelined_read == data and read32 == 987654 else "fail")
+
+
+def pci_write32_pci_poll32():
+    global server
+    server.pci_write32(1, 2, 3, 123456, 0x1234)
+    matched = server.pci_poll32(1, 2, 3, 123456, 0xFF, 0x34, 1000)
+    timed_out = server.pci_poll32(1, 2, 3, 123456, 0xFF, 0x12, 10)
+    print("pass" if matched == (0x1234, 1) and timed_out[0] == 0x1234 and timed_out[1] >= 1 else "fail")
+
+
+def pci_write32_pci_sample32():
+    global server
+    server.pci_write32(1, 2, 3, 123456, 0x1234)
+    result = server.pci_sample32(1, 2, 3, 123456, 10, 100, 16)
+    print(
+        "pass"
+        if result.samples >= 1
+        and result.dropped == 0
+        and len(result.values) == 1
+        and result.values[0][:2] == (0x1234, result.samples)
+        else "fail"
+    )
+
+
+def pci_write32_long_pci_sample32():
+    global server
+    server.pci_write32(1, 2, 3, 123456, 0x1234)
+    tt_exalens_ifc.SAMPLE_REQUEST_MAX_DURATION_MS = 5
+    result = server.pci_sample32(1, 2, 3, 123456, 12, 1000, 16)
+    tt_exalens_ifc.SAMPLE_REQUEST_MAX_DURATION_MS = 1000
+
+    # Server limits duration of a single request
+    limited = SampleResult.parse(server._communication.pci_sample32(1, 2, 3, 123456, 60000, 100000, 16))
+    print(
+        "pass"
+        if result.samples >= 3
+        and result.elapsed_us >= 12000
+        and result.values[0][:2] == (0x1234, result.samples)
+        and result.values[0][3] >= 10000
+        and limited.elapsed_us < 10000000
+        else "fail"
+    )
+
+
+def get_server_statistics():
+    global server
+    server.get_server_statistics(reset=True)
+    server.statistics.enabled = True
+    server.pci_write32(1, 2, 3, 123456, 987654)
+    server.pci_read32(1, 2, 3, 123456)
+    server.pci_read32(1, 2, 3, 123456)
+    entries = {(entry["chip_id"], entry["type"]): entry for entry in server.get_server_statistics()}
+    write32 = entries[(1, ttexalens_server_request_type.pci_write32.value)]
+    read32 = entries[(1, ttexalens_server_request_type.pci_read32.value)]
+    counters = {counter["operation"]: counter for counter in server.statistics.snapshot()}
+    print(
+        "pass"
+        if len(entries) == 2
+        and write32["count"] == 1
+        and read32["count"] == 2
+        and read32["response_bytes"] == 8
+        and read32["p50_latency_us"] <= read32["p99_latency_us"]
+        and counters["pci_read32"]["count"] == 2
+        and counters["pci_read32"]["caller"] == "<other>"
+        else "fail"
+    )
+
+
 def pci_write32_raw_pci_read32_raw():
     global server
     server.pci_write32_raw(1, 123456, 987654)
@@ -114,6 +266,14 @@ def pci_write32_raw_pci_read32_raw():
     print("pass" if read == 987654 else "fail")
 
 
+def pci_write32_raw_pci_poll32_raw():
+    global server
+    server.pci_write32_raw(1, 123456, 0x1234)
+    matched = server.pci_poll32_raw(1, 123456, 0xFF, 0x34, 1000)
+    timed_out = server.pci_poll32_raw(1, 123456, 0xFF, 0x12, 10)
+    print("pass" if matched == (0x1234, 1) and timed_out[0] == 0x1234 and timed_out[1] >= 1 else "fail")
+
+
 def dma_buffer_read32():
     global server
     server.pci_write32_raw(1, 123456, 987654)
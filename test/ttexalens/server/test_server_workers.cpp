@@ -0,0 +1,184 @@
+// SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+//
+// SPDX-License-Identifier: Apache-2.0
+#include <gtest/gtest.h>
+#include <ttexalensserver/server.h>
+#include <ttexalensserver/ttexalens_implementation.h>
+
+#include <chrono>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <tuple>
+#include <vector>
+#include <zmq.hpp>
+
+#include "ttexalensserver/requests.h"
+
+constexpr int DEFAULT_TEST_SERVER_PORT = 6670;
+constexpr auto SLOW_CHIP_LATENCY = std::chrono::milliseconds(500);
+
+// Implementation where every request to chip 0 is slow (like ethernet-remote read) and other chips respond immediately.
+class slow_chip_implementation : public tt::exalens::ttexalens_implementation {
+   private:
+    std::mutex mutex;
+    std::map<std::tuple<uint8_t, uint8_t, uint8_t, uint64_t>, uint32_t> memory;
+
+   public:
+    std::optional<uint32_t> pci_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address) override {
+        if (chip_id == 0) {
+            std::this_thread::sleep_for(SLOW_CHIP_LATENCY);
+        }
+        std::lock_guard<std::mutex> lock(mutex);
+        return memory[std::make_tuple(chip_id, noc_x, noc_y, address)];
+    }
+    std::optional<uint32_t> pci_write32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                        uint32_t data) override {
+        if (chip_id == 0) {
+            std::this_thread::sleep_for(SLOW_CHIP_LATENCY);
+        }
+        std::lock_guard<std::mutex> lock(mutex);
+        memory[std::make_tuple(chip_id, noc_x, noc_y, address)] = data;
+        return 4;
+    }
+};
+
+static std::unique_ptr<tt::exalens::server> start_server(bool use_worker_threads) {
+    auto server = std::make_unique<tt::exalens::server>(std::make_unique<slow_chip_implementation>());
+
+    server->start(DEFAULT_TEST_SERVER_PORT, use_worker_threads);
+    return server;
+}
+
+static uint32_t send_pci_read32(uint8_t chip_id, uint64_t address) {
+    zmq::message_t response;
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::req);
+    auto request = tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, chip_id, 1, 1, address};
+
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+    auto send_result = socket.send(zmq::const_buffer(&request, sizeof(request)));
+    auto receive_result = socket.recv(response);
+    EXPECT_EQ(response.size(), sizeof(uint32_t));
+    return *response.data<uint32_t>();
+}
+
+// Measures how long it takes to read from fast chip while other client is reading from slow chip.
+static std::chrono::milliseconds measure_fast_chip_latency(bool use_worker_threads) {
+    auto server = start_server(use_worker_threads);
+    EXPECT_TRUE(server->is_connected());
+
+    std::thread slow_client([] { send_pci_read32(0, 0); });
+
+    // Give slow client time to reach the server before fast client sends its request
+    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    auto start = std::chrono::steady_clock::now();
+    send_pci_read32(1, 0);
+    auto latency = std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::steady_clock::now() - start);
+
+    slow_client.join();
+    return latency;
+}
+
+TEST(ttexalens_server_workers, slow_chip_blocks_single_threaded_server) {
+    auto latency = measure_fast_chip_latency(false);
+    ASSERT_GE(latency, SLOW_CHIP_LATENCY / 2);
+}
+
+TEST(ttexalens_server_workers, slow_chip_does_not_block_other_chips) {
+    auto latency = measure_fast_chip_latency(true);
+    ASSERT_LT(latency, SLOW_CHIP_LATENCY / 2);
+}
+
+TEST(ttexalens_server_workers, pipelined_requests_to_same_chip_are_ordered) {
+    auto server = start_server(true);
+    ASSERT_TRUE(server->is_connected());
+
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::dealer);
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+
+    // Send write and read to every chip before receiving any response
+    constexpr uint8_t chip_count = 4;
+    for (uint8_t chip_id = 0; chip_id < chip_count; chip_id++) {
+        auto write = tt::exalens::pci_write32_request{tt::exalens::request_type::pci_write32, chip_id, 1, 1, 0x100,
+                                                      static_cast<uint32_t>(chip_id + 10)};
+        auto read = tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, chip_id, 1, 1, 0x100};
+        uint32_t write_id = chip_id * 2;
+        uint32_t read_id = chip_id * 2 + 1;
+
+        auto send_result = socket.send(zmq::const_buffer(&write_id, sizeof(write_id)), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(&write, sizeof(write)));
+        send_result = socket.send(zmq::const_buffer(&read_id, sizeof(read_id)), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(&read, sizeof(read)));
+    }
+
+    std::map<uint32_t, uint32_t> responses;
+    for (int i = 0; i < chip_count * 2; i++) {
+        zmq::message_t id, delimiter, response;
+        auto receive_result = socket.recv(id);
+        receive_result = socket.recv(delimiter);
+        receive_result = socket.recv(response);
+        ASSERT_EQ(response.size(), sizeof(uint32_t));
+        responses[*id.data<uint32_t>()] = *response.data<uint32_t>();
+    }
+    for (uint8_t chip_id = 0; chip_id < chip_count; chip_id++) {
+        ASSERT_EQ(responses[chip_id * 2], 4);
+        ASSERT_EQ(responses[chip_id * 2 + 1], chip_id + 10);
+    }
+}
+
+TEST(ttexalens_server_workers, pipelined_requests_are_not_reordered_with_multi_chip_requests) {
+    auto server = start_server(true);
+    ASSERT_TRUE(server->is_connected());
+
+    zmq::context_t context;
+    zmq::socket_t socket(context, zmq::socket_type::dealer);
+    socket.connect("tcp://127.0.0.1:" + std::to_string(DEFAULT_TEST_SERVER_PORT));
+    auto send_request = [&](uint32_t id, const void* data, size_t size) {
+        auto send_result = socket.send(zmq::const_buffer(&id, sizeof(id)), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(nullptr, 0), zmq::send_flags::sndmore);
+        send_result = socket.send(zmq::const_buffer(data, size));
+    };
+
+    // Slow read keeps chip 0 busy, so batch that writes to both chips has to wait for it. Read from chip 1 that was
+    // sent after the batch must still see data written by the batch.
+    auto slow_read = tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, 0, 1, 1, 0x200};
+    send_request(0, &slow_read, sizeof(slow_read));
+
+    std::vector<tt::exalens::pci_write32_request> writes = {
+        {tt::exalens::request_type::pci_write32, 0, 1, 1, 0x100, 10},
+        {tt::exalens::request_type::pci_write32, 1, 1, 1, 0x100, 20},
+    };
+    std::vector<uint8_t> batch_data(sizeof(tt::exalens::batch_request));
+    for (auto& write : writes) {
+        uint32_t size = sizeof(write);
+        batch_data.insert(batch_data.end(), reinterpret_cast<uint8_t*>(&size),
+                          reinterpret_cast<uint8_t*>(&size) + sizeof(size));
+        batch_data.insert(batch_data.end(), reinterpret_cast<uint8_t*>(&write),
+                          reinterpret_cast<uint8_t*>(&write) + sizeof(write));
+    }
+    auto batch = reinterpret_cast<tt::exalens::batch_request*>(batch_data.data());
+    batch->type = tt::exalens::request_type::batch;
+    batch->count = writes.size();
+    batch->size = batch_data.size() - sizeof(tt::exalens::batch_request);
+    send_request(1, batch_data.data(), batch_data.size());
+
+    auto read = tt::exalens::pci_read32_request{tt::exalens::request_type::pci_read32, 1, 1, 1, 0x100};
+    send_request(2, &read, sizeof(read));
+
+    std::map<uint32_t, std::string> responses;
+    for (int i = 0; i < 3; i++) {
+        zmq::message_t id, delimiter, response;
+        auto receive_result = socket.recv(id);
+        receive_result = socket.recv(delimiter);
+        receive_result = socket.recv(response);
+        responses[*id.data<uint32_t>()] = response.to_string();
+    }
+    ASSERT_EQ(responses[2].size(), sizeof(uint32_t));
+    ASSERT_EQ(*reinterpret_cast<const uint32_t*>(responses[2].data()), 20);
+}
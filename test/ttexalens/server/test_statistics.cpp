@@ -0,0 +1,42 @@
+// SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+//
+// SPDX-License-Identifier: Apache-2.0
+#include <gtest/gtest.h>
+#include <ttexalensserver/statistics.h>
+
+#include <chrono>
+#include <string>
+
+using namespace std::chrono_literals;
+
+TEST(ttexalens_statistics, empty) {
+    tt::exalens::statistics statistics;
+    ASSERT_EQ(statistics.to_yaml(), "[]");
+}
+
+TEST(ttexalens_statistics, record) {
+    tt::exalens::statistics statistics;
+
+    // 98 fast reads, one slower and one very slow read
+    for (int i = 0; i < 98; i++) {
+        statistics.record(tt::exalens::request_type::pci_read, 1, 25, 1024, 3us);
+    }
+    statistics.record(tt::exalens::request_type::pci_read, 1, 25, 1024, 20us);
+    statistics.record(tt::exalens::request_type::pci_read, 1, 25, 1024, 1000us);
+    statistics.record(tt::exalens::request_type::get_device_ids, {}, 1, 8, 500ns);
+
+    ASSERT_EQ(
+        statistics.to_yaml(),
+        "- chip_id: -1\n  type: 18\n  count: 1\n  request_bytes: 1\n  response_bytes: 8\n  total_latency_us: 0\n  "
+        "p50_latency_us: 1\n  p99_latency_us: 1\n"
+        "- chip_id: 1\n  type: 12\n  count: 100\n  request_bytes: 2500\n  response_bytes: 102400\n  "
+        "total_latency_us: 1314\n  p50_latency_us: 4\n  p99_latency_us: 32");
+}
+
+TEST(ttexalens_statistics, reset) {
+    tt::exalens::statistics statistics;
+
+    statistics.record(tt::exalens::request_type::pci_read32, 0, 12, 4, 10us);
+    statistics.reset();
+    ASSERT_EQ(statistics.to_yaml(), "[]");
+}
@@ -66,6 +66,24 @@ void yaml_communication::process(const tt::exalens::request& request) {
         case tt::exalens::request_type::jtag_write32_axi:
             respond(serialize(static_cast<const tt::exalens::jtag_write32_axi_request&>(request)));
             break;
+        case tt::exalens::request_type::batch:
+            respond(serialize(static_cast<const tt::exalens::batch_request&>(request)));
+            break;
+        case tt::exalens::request_type::pci_read_gather:
+            respond(serialize(static_cast<const tt::exalens::pci_read_gather_request&>(request)));
+            break;
+        case tt::exalens::request_type::pci_poll32:
+            respond(serialize(static_cast<const tt::exalens::pci_poll32_request&>(request)));
+            break;
+        case tt::exalens::request_type::pci_poll32_raw:
+            respond(serialize(static_cast<const tt::exalens::pci_poll32_raw_request&>(request)));
+            break;
+        case tt::exalens::request_type::pci_write_scatter:
+            respond(serialize(static_cast<const tt::exalens::pci_write_scatter_request&>(request)));
+            break;
+        case tt::exalens::request_type::pci_sample32:
+            respond(serialize(static_cast<const tt::exalens::pci_sample32_request&>(request)));
+            break;
         default:
             respond("NOT_IMPLEMENTED_YAML_SERIALIZATION for " + std::to_string(static_cast<int>(request.type)));
             break;
@@ -182,6 +200,51 @@ std::string yaml_communication::serialize(const tt::exalens::jtag_write32_axi_re
            "\n  data: " + std::to_string(request.data);
 }
 
+std::string yaml_communication::serialize(const tt::exalens::batch_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) + "\n  count: " + std::to_string(request.count) +
+           "\n  size: " + std::to_string(request.size) + "\n  data: " + serialize_bytes(request.data, request.size);
+}
+
+std::string yaml_communication::serialize(const tt::exalens::pci_read_gather_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) +
+           "\n  chip_id: " + std::to_string(request.chip_id) + "\n  address: " + std::to_string(request.address) +
+           "\n  size: " + std::to_string(request.size) + "\n  core_count: " + std::to_string(request.core_count) +
+           "\n  data: " + serialize_bytes(request.data, 2 * request.core_count);
+}
+
+std::string yaml_communication::serialize(const tt::exalens::pci_poll32_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) +
+           "\n  chip_id: " + std::to_string(request.chip_id) + "\n  noc_x: " + std::to_string(request.noc_x) +
+           "\n  noc_y: " + std::to_string(request.noc_y) + "\n  address: " + std::to_string(request.address) +
+           "\n  mask: " + std::to_string(request.mask) + "\n  expected: " + std::to_string(request.expected) +
+           "\n  timeout_ms: " + std::to_string(request.timeout_ms) +
+           "\n  interval_us: " + std::to_string(request.interval_us);
+}
+
+std::string yaml_communication::serialize(const tt::exalens::pci_poll32_raw_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) +
+           "\n  chip_id: " + std::to_string(request.chip_id) + "\n  address: " + std::to_string(request.address) +
+           "\n  mask: " + std::to_string(request.mask) + "\n  expected: " + std::to_string(request.expected) +
+           "\n  timeout_ms: " + std::to_string(request.timeout_ms) +
+           "\n  interval_us: " + std::to_string(request.interval_us);
+}
+
+std::string yaml_communication::serialize(const tt::exalens::pci_write_scatter_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) +
+           "\n  chip_id: " + std::to_string(request.chip_id) + "\n  address: " + std::to_string(request.address) +
+           "\n  size: " + std::to_string(request.size) + "\n  core_count: " + std::to_string(request.core_count) +
+           "\n  data: " + serialize_bytes(request.data, 2 * request.core_count + request.size);
+}
+
+std::string yaml_communication::serialize(const tt::exalens::pci_sample32_request& request) {
+    return "- type: " + std::to_string(static_cast<int>(request.type)) +
+           "\n  chip_id: " + std::to_string(request.chip_id) + "\n  noc_x: " + std::to_string(request.noc_x) +
+           "\n  noc_y: " + std::to_string(request.noc_y) + "\n  address: " + std::to_string(request.address) +
+           "\n  duration_ms: " + std::to_string(request.duration_ms) +
+           "\n  interval_us: " + std::to_string(request.interval_us) +
+           "\n  max_values: " + std::to_string(request.max_values);
+}
+
 std::string yaml_communication::serialize_bytes(const uint8_t* data, size_t size) {
     std::string bytes;
 
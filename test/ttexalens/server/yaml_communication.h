@@ -34,5 +34,11 @@ class yaml_communication : public tt::exalens::communication {
     std::string serialize(const tt::exalens::jtag_write32_request& request);
     std::string serialize(const tt::exalens::jtag_read32_axi_request& request);
     std::string serialize(const tt::exalens::jtag_write32_axi_request& request);
+    std::string serialize(const tt::exalens::batch_request& request);
+    std::string serialize(const tt::exalens::pci_read_gather_request& request);
+    std::string serialize(const tt::exalens::pci_poll32_request& request);
+    std::string serialize(const tt::exalens::pci_poll32_raw_request& request);
+    std::string serialize(const tt::exalens::pci_write_scatter_request& request);
+    std::string serialize(const tt::exalens::pci_sample32_request& request);
     std::string serialize_bytes(const uint8_t* data, size_t size);
 };
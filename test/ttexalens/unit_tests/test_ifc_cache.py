@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import io
+import os
+import pickle
+import tempfile
+import time
+import unittest
+
+from ttexalens.tt_exalens_ifc_cache import ReadCache, TTExaLensCacheReader, TTExaLensCacheThrough
+from ttexalens.util import TTException
+
+
+class MemoryCommunicator:
+    """Communicator that returns data from memory, used as device behind the cache."""
+
+    def __init__(self):
+        self.memory = {}
+
+    def pci_read32(self, chip_id, noc_x, noc_y, address):
+        return int.from_bytes(self.pci_read(chip_id, noc_x, noc_y, address, 4), "little")
+
+    def pci_write32(self, chip_id, noc_x, noc_y, address, data):
+        return self.pci_write(chip_id, noc_x, noc_y, address, data.to_bytes(4, "little"))
+
+    def pci_read(self, chip_id, noc_x, noc_y, address, size):
+        return bytes(self.memory.get((chip_id, noc_x, noc_y, address + i), 0) for i in range(size))
+
+    def pci_write(self, chip_id, noc_x, noc_y, address, data):
+        for i, byte in enumerate(data):
+            self.memory[(chip_id, noc_x, noc_y, address + i)] = byte
+        return len(data)
+
+    def get_binary(self, binary_path):
+        return io.BytesIO(b"binary " + binary_path.encode())
+
+    def get_file(self, file_path):
+        return "file " + file_path * 2000
+
+
+class IndirectRegisterCommunicator(MemoryCommunicator):
+    """Device with debug bus like registers: value read from data register depends on the written control register."""
+
+    CONTROL_ADDRESS = 0xFFB12000
+    DATA_ADDRESS = 0xFFB12004
+
+    def pci_read(self, chip_id, noc_x, noc_y, address, size):
+        if address == self.DATA_ADDRESS:
+            control = int.from_bytes(super().pci_read(chip_id, noc_x, noc_y, self.CONTROL_ADDRESS, 4), "little")
+            return (control * 10).to_bytes(4, "little")
+        return super().pci_read(chip_id, noc_x, noc_y, address, size)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "cache.pkl")
+        self.device = MemoryCommunicator()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, save=True):
+        cache = TTExaLensCacheThrough(self.device, self.file_name)
+        cache.pci_write32(0, 1, 2, 0x100, 0x1234)
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x100), 0x1234)
+        cache.pci_write(0, 1, 2, 0x200, b"abcd")
+        self.assertEqual(cache.pci_read(0, 1, 2, 0x200, 4), b"abcd")
+        cache.pci_write32(0, 1, 2, 0x100, 0x5678)
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x100), 0x5678)
+        self.assertEqual(cache.get_binary("a.elf").read(), b"binary a.elf")
+        if save:
+            cache.save()
+        return cache
+
+    def test_record_replay(self):
+        """Test record calls to cache file -- replay them, last recorded result of a call wins."""
+        self.record()
+        self.assertTrue(os.path.exists(self.file_name + ".idx"))
+
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(len(reader.cache), 3)
+        self.assertEqual(reader.pci_read32(0, 1, 2, 0x100), 0x5678)
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x200, 4), b"abcd")
+        self.assertEqual(reader.get_binary("a.elf").read(), b"binary a.elf")
+        with self.assertRaises(TTException):
+            reader.pci_read32(0, 1, 2, 0x104)
+        with self.assertRaises(TTException):
+            reader.pci_write32(0, 1, 2, 0x100, 0)
+
+    def test_records_are_flushed(self):
+        """Test read cache file while it is being recorded -- all recorded calls are there, index is rebuilt."""
+        cache = self.record(save=False)
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(reader.pci_read32(0, 1, 2, 0x100), 0x5678)
+        self.assertTrue(os.path.exists(self.file_name + ".idx"))
+        reader.cache.close()
+        cache.save()
+
+    def test_truncated_record(self):
+        """Test cache file with incomplete last record -- complete records are still available."""
+        self.record()
+        with open(self.file_name, "ab") as f:
+            f.write(b"\x10\x00\x00\x00\x10\x00\x00\x00partial")
+
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x200, 4), b"abcd")
+
+    def test_read_covered_range(self):
+        """Test reads that were not recorded with the same arguments -- they are served from recorded reads."""
+        cache = TTExaLensCacheThrough(self.device, self.file_name)
+        self.device.pci_write(0, 1, 2, 0x100, bytes(range(16)))
+        cache.pci_read(0, 1, 2, 0x100, 8)
+        cache.pci_read(0, 1, 2, 0x108, 8)
+        self.device.pci_write(0, 1, 2, 0x104, b"abcd")
+        cache.pci_read32(0, 1, 2, 0x104)
+        cache.pci_read(0, 3, 4, 0x100, 32)
+        cache.save()
+
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(reader.pci_read(0, 3, 4, 0x110, 4), bytes(4))
+        self.assertEqual(reader.pci_read32(0, 1, 2, 0x108), int.from_bytes(bytes([8, 9, 10, 11]), "little"))
+
+        # Read spans two recorded reads and later recorded read overwrites older data
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x102, 4), b"\x02\x03ab")
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x100, 16), bytes(range(4)) + b"abcd" + bytes(range(8, 16)))
+
+        # Exactly the same read as recorded returns recorded result
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x100, 8), bytes(range(8)))
+
+        with self.assertRaises(TTException):
+            reader.pci_read(0, 1, 2, 0x10C, 8)
+        with self.assertRaises(TTException):
+            reader.pci_read(1, 1, 2, 0x100, 4)
+        reader.cache.close()
+
+    def test_large_results_are_stored_once(self):
+        """Test record the same large data many times -- it is stored once and compressed, every call returns it."""
+        cache = TTExaLensCacheThrough(self.device, self.file_name)
+        for x in range(10):
+            self.assertEqual(cache.pci_read(0, x, 0, 0, 64 * 1024), bytes(64 * 1024))
+        self.device.pci_write(0, 1, 2, 0x100, b"abcd")
+        cache.pci_read(0, 1, 2, 0, 64 * 1024)
+        file = cache.get_file("a.yaml")
+        cache.save()
+        self.assertLess(os.path.getsize(self.file_name), 64 * 1024)
+
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(len(reader.cache), 12)
+        self.assertEqual(reader.pci_read(0, 9, 0, 0, 64 * 1024), bytes(64 * 1024))
+        self.assertEqual(reader.pci_read(0, 1, 2, 0xFE, 8), b"\x00\x00abcd\x00\x00")
+        self.assertEqual(reader.pci_read32(0, 5, 0, 0x1000), 0)
+        self.assertEqual(reader.get_file("a.yaml"), file)
+        reader.cache.close()
+
+    def test_replay_timing(self):
+        """Test record calls with timing -- reader replays them at full speed or with recorded latency."""
+        cache = TTExaLensCacheThrough(self.device, self.file_name, record_timing=True)
+        self.device.pci_read = lambda *args: time.sleep(0.05) or bytes(args[4])
+        cache.pci_read(0, 1, 2, 0x100, 8)
+        cache.pci_read(0, 1, 2, 0x100, 64 * 1024)
+        cache.get_binary("a.elf")
+        cache.save()
+
+        reader = TTExaLensCacheReader(self.file_name)
+        timings = list(reader.cache.timings())
+        self.assertEqual(
+            [key for key, _, _ in timings],
+            [("pci_read", (0, 1, 2, 0x100, 8)), ("pci_read", (0, 1, 2, 0x100, 64 * 1024)), ("get_binary", ("a.elf",))],
+        )
+        self.assertLess(timings[0][1], timings[1][1])
+        self.assertGreaterEqual(timings[0][2], 0.05)
+
+        start = time.perf_counter()
+        reader.pci_read(0, 1, 2, 0x100, 8)
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertEqual(reader.replayed_calls, 1)
+        self.assertGreaterEqual(reader.device_time, 0.05)
+        reader.cache.close()
+
+        reader = TTExaLensCacheReader(self.file_name, replay_latency=True)
+        start = time.perf_counter()
+        self.assertEqual(reader.pci_read(0, 1, 2, 0x100, 64 * 1024), bytes(64 * 1024))
+        self.assertGreaterEqual(time.perf_counter() - start, timings[1][2])
+        reader.get_binary("a.elf")
+        self.assertEqual(reader.replayed_calls, 2)
+        reader.cache.close()
+
+    def test_cache_reads(self):
+        """Test serve repeated reads from cache -- writes invalidate overlapping reads, volatile regions are not cached."""
+        cache = TTExaLensCacheThrough(self.device, self.file_name, cache_reads=True)
+        cache.add_memory_region(0, 0x2000)
+        cache.add_volatile_region(0x1000, 0x10, (0, 1, 2))
+        cache.pci_write(0, 1, 2, 0x100, b"abcdefgh")
+        self.assertEqual(cache.pci_read(0, 1, 2, 0x100, 8), b"abcdefgh")
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x104), int.from_bytes(b"efgh", "little"))
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x1008), 0)
+
+        # Device changes memory by itself: cached reads are served, volatile region is read from the device
+        self.device.pci_write(0, 1, 2, 0x100, b"12345678")
+        self.device.pci_write32(0, 1, 2, 0x1008, 42)
+        self.assertEqual(cache.pci_read(0, 1, 2, 0x100, 8), b"abcdefgh")
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x1008), 42)
+
+        # Write invalidates only reads it overlaps
+        cache.pci_write32(0, 1, 2, 0x104, 0x5678)
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x104), 0x5678)
+        self.assertEqual(cache.pci_read(0, 1, 2, 0x100, 8), b"1234" + (0x5678).to_bytes(4, "little"))
+        cache.pci_write(0, 3, 4, 0x100, b"abcd")
+        self.assertEqual(cache.pci_read(0, 1, 2, 0x100, 8), b"1234" + (0x5678).to_bytes(4, "little"))
+
+        # Polled value is always read from the device
+        self.device.pci_write32(0, 1, 2, 0x104, 1)
+        cache.invalidate_reads()
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x104), 1)
+        self.device.pci_write32(0, 1, 2, 0x104, 2)
+        self.assertEqual(cache.pci_poll32(0, 1, 2, 0x104, 0xFFFFFFFF, 2, 100)[0], 2)
+        self.device.pci_write32(0, 1, 2, 0x104, 3)
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x104), 3)
+        cache.save()
+
+    def test_cache_reads_of_registers(self):
+        """Test serve repeated reads from cache -- only memory regions are cached, register space never is."""
+        device = IndirectRegisterCommunicator()
+        cache = TTExaLensCacheThrough(device, None, cache_reads=True)
+        cache.add_memory_region(0, 0x1000, (0, 1, 2))
+        cache.add_memory_region(0, 0x100000000, (0, 3, 4))
+
+        # Data register depends on control register, even if whole address space of the core is memory
+        for core in [(0, 1, 2), (0, 3, 4)]:
+            cache.pci_write32(*core, device.CONTROL_ADDRESS, 1)
+            self.assertEqual(cache.pci_read32(*core, device.DATA_ADDRESS), 10)
+            cache.pci_write32(*core, device.CONTROL_ADDRESS, 2)
+            self.assertEqual(cache.pci_read32(*core, device.DATA_ADDRESS), 20)
+
+        # Reads outside of memory regions are not cached
+        cache.pci_read32(0, 1, 2, 0x2000)
+        cache.pci_read32(0, 5, 6, 0x100)
+        self.assertEqual(len(cache.read_cache), 0)
+        cache.pci_read32(0, 1, 2, 0x100)
+        self.assertEqual(len(cache.read_cache), 1)
+
+        # Register write can start a core that changes its own memory
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x10), 0)
+        cache.pci_write32(0, 1, 2, 0xFFB121B0, 0)
+        device.pci_write32(0, 1, 2, 0x10, 7)
+        self.assertEqual(cache.pci_read32(0, 1, 2, 0x10), 7)
+
+        # Nothing is recorded without cache file
+        cache.save()
+        self.assertFalse(os.path.exists(self.file_name))
+
+    def test_submit_batch(self):
+        """Test batch with failing operation -- it returns None, other operations are still executed."""
+
+        def failing_read(chip_id, noc_x, noc_y, address, size):
+            raise TTException("Device read failed.")
+
+        self.device.pci_read = failing_read
+        cache = TTExaLensCacheThrough(self.device, None)
+        results = cache.submit_batch([("pci_read32", 0, 1, 2, 0x100), ("pci_write32", 0, 1, 2, 0x100, 0x1234)])
+        self.assertEqual(results, [None, 4])
+        self.assertEqual(self.device.memory[(0, 1, 2, 0x100)], 0x34)
+
+    def test_read_cache_size(self):
+        """Test read cache with limited size -- least recently used reads are dropped."""
+        cache = ReadCache(max_size=16)
+        cache.add_memory_region(0, 0x10000)
+        for address in range(0, 16, 4):
+            cache.put(("pci_read32", (0, 1, 2, address)), address, cache.generation)
+        cache.get(("pci_read32", (0, 1, 2, 0)))
+        cache.put(("pci_read", (0, 1, 2, 0x100, 4)), b"abcd", cache.generation)
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache.get(("pci_read32", (0, 1, 2, 0))), 0)
+        with self.assertRaises(KeyError):
+            cache.get(("pci_read32", (0, 1, 2, 4)))
+
+        # Read that was started before a write is not cached
+        generation = cache.generation
+        cache.invalidate(0, 1, 2, 0x1000, 4)
+        cache.put(("pci_read32", (0, 1, 2, 0x2000)), 0, generation)
+        with self.assertRaises(KeyError):
+            cache.get(("pci_read32", (0, 1, 2, 0x2000)))
+
+    def test_old_cache_file(self):
+        """Test cache file with pickled dictionary -- it is still readable."""
+        with open(self.file_name, "wb") as f:
+            pickle.dump({("pci_read32", (0, 1, 2, 0x100)): 42}, f)
+
+        reader = TTExaLensCacheReader(self.file_name)
+        self.assertEqual(reader.pci_read32(0, 1, 2, 0x100), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
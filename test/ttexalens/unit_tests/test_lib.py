@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import io
 import struct
 import unittest
 
@@ -97,6 +98,209 @@ class TestReadWrite(unittest.TestCase):
         ret = lib.read_from_device(core_loc, address, num_bytes=len(data))
         self.assertEqual(ret, data)
 
+    def test_write_read_bytes_into(self):
+        """Test write bytes -- read bytes into preallocated buffer."""
+        core_loc = "1,0"
+        address = 0x100
+
+        data = bytes([i % 256 for i in range(1024)])
+        ret = lib.write_to_device(core_loc, address, data)
+        self.assertEqual(ret, len(data))
+
+        buffer = bytearray(len(data) + 8)
+        ret = lib.read_from_device_into(core_loc, address, memoryview(buffer)[8:])
+        self.assertEqual(ret, len(data))
+        self.assertEqual(bytes(buffer[8:]), data)
+        self.assertEqual(bytes(buffer[:8]), bytes(8))
+
+    def test_write_read_stream(self):
+        """Test write bytes -- read them in chunks and stream them to file."""
+        core_loc = "ch0"
+        address = 0x100
+
+        data = bytes([i % 256 for i in range(10000)])
+        ret = lib.write_to_device(core_loc, address, data)
+        self.assertEqual(ret, len(data))
+
+        chunks = list(lib.read_from_device_stream(core_loc, address, len(data), chunk_size=4096))
+        self.assertEqual([len(chunk) for chunk in chunks], [4096, 4096, 1808])
+        self.assertEqual(b"".join(chunks), data)
+
+        file = io.BytesIO()
+        ret = lib.read_from_device_to_file(core_loc, address, len(data), file, chunk_size=4096)
+        self.assertEqual(ret, len(data))
+        self.assertEqual(file.getvalue(), data)
+
+    def test_core_handle(self):
+        """Test reads and writes through pre-resolved core handle."""
+        core_loc = "1,0"
+        address = 0x100
+
+        core = lib.CoreHandle(core_loc, context=self.context)
+        self.assertEqual(core.write32(address, 0x12345678), 4)
+        self.assertEqual(core.read32(address), 0x12345678)
+        self.assertEqual(lib.read_word_from_device(core_loc, address, context=self.context), 0x12345678)
+
+        data = bytes(range(16))
+        self.assertEqual(core.write(address, data), len(data))
+        self.assertEqual(core.read(address, len(data)), data)
+        self.assertEqual(lib.read_from_device(core_loc, address, num_bytes=len(data), context=self.context), data)
+
+    @parameterized.expand(
+        [
+            ("abcd", 0),  # Invalid core_loc string
+            ("0,0", -1),  # Invalid device_id
+            ("0,0", 112),  # Invalid device_id (too high)
+        ]
+    )
+    def test_invalid_core_handle(self, core_loc, device_id):
+        """Test creating core handle with invalid arguments."""
+        with self.assertRaises((util.TTException, ValueError)):
+            lib.CoreHandle(core_loc, device_id, context=self.context)
+
+    def test_transaction_statistics(self):
+        """Test that transactions are attributed to library function that issued them."""
+        core_loc = "0,0"
+        address = 0x100
+
+        statistics = self.context.server_ifc.statistics
+        statistics.reset()
+        statistics.enabled = True
+        try:
+            lib.write_to_device(core_loc, address, b"abcd", context=self.context)
+            lib.read_from_device(core_loc, address, num_bytes=4, context=self.context)
+            lib.read_word_from_device(core_loc, address, context=self.context)
+        finally:
+            statistics.enabled = False
+
+        counters = {(counter["caller"], counter["operation"]): counter for counter in statistics.snapshot()}
+        self.assertEqual(counters[("write_to_device", "pci_write")]["count"], 1)
+        self.assertEqual(counters[("write_to_device", "pci_write")]["bytes"], 4)
+        self.assertEqual(counters[("read_from_device", "pci_read")]["bytes"], 4)
+        self.assertEqual(counters[("read_word_from_device", "pci_read32")]["count"], 1)
+        statistics.reset()
+        self.assertEqual(statistics.snapshot(), [])
+
+    def test_write_read_async(self):
+        """Test write bytes to multiple cores -- read them back with asynchronous requests."""
+        core_locs = ["0,0", "1,0", "0,1"]
+        address = 0x100
+
+        data = [b"abcd", b"efgh", b"ijkl"]
+        futures = [
+            lib.write_to_device_async(core_loc, address, core_data) for core_loc, core_data in zip(core_locs, data)
+        ]
+        self.assertEqual([future.result() for future in futures], [len(core_data) for core_data in data])
+
+        futures = [lib.read_from_device_async(core_loc, address, num_bytes=4) for core_loc in core_locs]
+        self.assertEqual([future.result() for future in futures], data)
+
+        # Errors are raised when result is requested
+        future = lib.read_from_device_async("1,0", address, num_bytes=0)
+        with self.assertRaises(util.TTException):
+            future.result()
+
+    def test_write_read_from_cores(self):
+        """Test write bytes to multiple cores -- read them with a single request."""
+        core_locs = ["0,0", "1,0"]
+        address = 0x100
+
+        data = [b"abcd", b"efgh"]
+        for core_loc, core_data in zip(core_locs, data):
+            ret = lib.write_to_device(core_loc, address, core_data)
+            self.assertEqual(ret, len(core_data))
+
+        ret = lib.read_from_cores(core_locs, address, num_bytes=4)
+        self.assertEqual(ret, data)
+
+    def test_write_to_cores(self):
+        """Test write the same bytes to multiple cores with a single request -- read them back."""
+        core_locs = ["0,0", "1,0"]
+        address = 0x100
+        data = b"abcd"
+
+        ret = lib.write_to_cores(core_locs, address, data)
+        self.assertEqual(ret, len(data))
+
+        ret = lib.read_from_cores(core_locs, address, num_bytes=len(data))
+        self.assertEqual(ret, [data, data])
+
+        with self.assertRaises(util.TTException):
+            lib.write_to_cores(core_locs, address, [])
+
+    def test_l1_snapshot(self):
+        """Test capture L1 of all cores to snapshot file -- compare it with data read from device."""
+        import tempfile
+
+        core_loc = "1,0"
+        address = 0x100
+        lib.write_to_device(core_loc, address, b"snap", context=self.context)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "l1.bin")
+            with lib.save_l1_snapshot(file_name, [0], context=self.context) as snapshot:
+                device = self.context.devices[0]
+                cores = len(device.get_block_locations("functional_workers")) + len(device.get_block_locations("eth"))
+                self.assertEqual(len(snapshot.entries), cores)
+
+                loc = OnChipCoordinate.create(core_loc, device)
+                self.assertEqual(bytes(snapshot.read(0, loc)[address : address + 4]), b"snap")
+                self.assertEqual(snapshot.get_entry(0, loc).size, device.get_l1_size("functional_workers"))
+
+            with lib.load_l1_snapshot(file_name) as snapshot:
+                words = snapshot.as_numpy(0, loc)
+                self.assertEqual(int(words[address // 4]), int.from_bytes(b"snap", "little"))
+                del words
+
+    def test_write_poll_word(self):
+        """Test write word -- poll word until condition is met."""
+        core_loc = "1,0"
+        address = 0x100
+
+        lib.write_words_to_device(core_loc, address, 0x1234)
+        ret = lib.poll_word_from_device(core_loc, address, 0xFF, 0x34)
+        self.assertEqual(ret, 0x1234)
+
+        with self.assertRaises(util.TTException):
+            lib.poll_word_from_device(core_loc, address, 0xFF, 0x12, timeout_ms=10)
+
+    def test_write_batch(self):
+        """Test write words in write batch -- they are merged and flushed before overlapping read and at exit."""
+        core_loc = "1,0"
+        address = 0x100
+
+        lib.write_words_to_device(core_loc, address, [0, 0, 0, 0], context=self.context)
+        with self.context.write_batch() as batch:
+            for i in range(3):
+                self.assertEqual(lib.write_words_to_device(core_loc, address + 4 * i, i + 1, context=self.context), 4)
+            lib.write_to_device(core_loc, address + 12, b"\x04\x00\x00\x00", context=self.context)
+            self.assertEqual(len(batch.writes), 1)
+
+            # Read of other address doesn't flush the batch, read of written address does
+            lib.read_word_from_device(core_loc, address + 16, context=self.context)
+            self.assertEqual(len(batch.writes), 1)
+            self.assertEqual(
+                lib.read_words_from_device(core_loc, address, word_count=4, context=self.context), [1, 2, 3, 4]
+            )
+            self.assertEqual(len(batch.writes), 0)
+
+            lib.write_words_to_device(core_loc, address, 5, context=self.context)
+        self.assertEqual(lib.read_word_from_device(core_loc, address, context=self.context), 5)
+
+    def test_write_sample_word(self):
+        """Test write word -- sample word and check that every read returned it."""
+        core_loc = "1,0"
+        address = 0x100
+
+        lib.write_words_to_device(core_loc, address, 0x1234)
+        ret = lib.sample_word_from_device(core_loc, address, duration_ms=10)
+        self.assertGreaterEqual(ret.samples, 1)
+        self.assertEqual(ret.dropped, 0)
+        self.assertEqual([value[:2] for value in ret.values], [(0x1234, ret.samples)])
+
+        with self.assertRaises(util.TTException):
+            lib.sample_word_from_device(core_loc, address, duration_ms=-1)
+
     @parameterized.expand(
         [
             ("1,0", 1024, 0x100, 0),  # 1KB from device 0 at location 1,0
@@ -175,6 +379,28 @@ class TestReadWrite(unittest.TestCase):
         ret = lib.read_words_from_device(core_loc, address[2], word_count=2)
         self.assertEqual(ret, data[2:])
 
+    def test_write_read_words_numpy(self):
+        """Test write words -- read words as numpy array -- write numpy array."""
+        import numpy
+
+        core_loc = "1,0"
+        address = 0x100
+        data = [i * 0x01010101 for i in range(256)]
+
+        lib.write_words_to_device(core_loc, address, data)
+
+        ret = lib.read_words_from_device(core_loc, address, word_count=len(data), as_numpy=True)
+        self.assertIsInstance(ret, numpy.ndarray)
+        self.assertEqual(ret.dtype, numpy.uint32)
+        self.assertEqual(ret.tolist(), data)
+        self.assertEqual(ret.tolist(), lib.read_words_from_device(core_loc, address, word_count=len(data)))
+
+        # Write numpy array back in reverse order
+        ret = lib.write_words_to_device(core_loc, address, numpy.array(data[::-1], dtype=numpy.uint32))
+        self.assertEqual(ret, 4 * len(data))
+        ret = lib.read_words_from_device(core_loc, address, word_count=len(data))
+        self.assertEqual(ret, data[::-1])
+
     def test_write_bytes_read_words(self):
         """Test write bytes -- read words."""
         core_loc = "1,0"
@@ -349,6 +575,30 @@ class TestRunElf(unittest.TestCase):
         ret = lib.read_words_from_device(core_loc, addr, context=self.context)
         self.assertEqual(ret[0], 0x12345678)
 
+    @parameterized.expand(
+        [
+            (0),  # Load private sections on BRISC
+            (1),  # Load private sections on TRISC0
+            (4),  # Load private sections on NCRISC
+        ]
+    )
+    def test_run_elf_multiple_cores(self, risc_id: int):
+        """Test running an ELF file on multiple cores with a single parse of the ELF."""
+        core_locs = ["0,0", "1,0", "0,1"]
+        addr = 0x0
+
+        # Reset memory at addr
+        lib.write_to_cores(core_locs, addr, bytes(4), context=self.context)
+        for ret in lib.read_from_cores(core_locs, addr, context=self.context):
+            self.assertEqual(ret, bytes(4))
+
+        # Run an ELF that writes to the addr on every core and check if it executed correctly
+        elf_path = self.get_elf_path("run_elf_test", risc_id)
+        lib.run_elf(elf_path, core_locs, risc_id, context=self.context)
+        for core_loc in core_locs:
+            ret = lib.read_words_from_device(core_loc, addr, context=self.context)
+            self.assertEqual(ret[0], 0x12345678)
+
     @parameterized.expand(
         [
             ("", "0,0", 0, 0),  # Invalid ELF path
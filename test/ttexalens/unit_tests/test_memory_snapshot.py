@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import os
+import tempfile
+import unittest
+
+from ttexalens.memory_snapshot import (
+    MemorySnapshot,
+    SNAPSHOT_ALIGNMENT,
+    diff_memory,
+    diff_snapshots,
+    write_snapshot_index,
+)
+from ttexalens.util import TTException
+
+
+class TestMemorySnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "snapshot.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_snapshot(self, regions, data, file_name=None):
+        with open(file_name or self.file_name, "wb") as file:
+            entries = write_snapshot_index(file, regions)
+            for entry, entry_data in zip(entries, data):
+                file.seek(entry.offset)
+                file.write(entry_data)
+        return entries
+
+    def test_write_read(self):
+        """Test write snapshot index and data -- read them back through mmap."""
+        regions = [(0, (1, 2), "functional_workers", 0, 16), (1, (9, 0), "eth", 0x100, 8)]
+        data = [bytes(range(16)), b"abcdefgh"]
+        entries = self.write_snapshot(regions, data)
+        for entry in entries:
+            self.assertEqual(entry.offset % SNAPSHOT_ALIGNMENT, 0)
+
+        with MemorySnapshot(self.file_name) as snapshot:
+            self.assertEqual(snapshot.entries, entries)
+            self.assertEqual(bytes(snapshot.read(0, (1, 2))), data[0])
+            self.assertEqual(bytes(snapshot.read(1, (9, 0))), data[1])
+            self.assertEqual(snapshot.get_entry(1, (9, 0)).block_type, "eth")
+            self.assertEqual(snapshot.get_entry(1, (9, 0)).address, 0x100)
+            with self.assertRaises(TTException):
+                snapshot.read(0, (9, 0))
+
+    def test_as_numpy(self):
+        """Test snapshot data is available as uint32 NumPy array."""
+        regions = [(0, (1, 1), "functional_workers", 0, 8)]
+        self.write_snapshot(regions, [b"\x01\x00\x00\x00\x02\x00\x00\x00"])
+
+        snapshot = MemorySnapshot(self.file_name)
+        array = snapshot.as_numpy(0, (1, 1))
+        self.assertEqual(array.tolist(), [1, 2])
+        self.assertFalse(array.flags.writeable)
+        del array
+        snapshot.close()
+
+    def test_invalid_file(self):
+        """Test opening a file that is not a snapshot fails."""
+        with open(self.file_name, "wb") as file:
+            file.write(b"not a snapshot file")
+        with self.assertRaises(TTException):
+            MemorySnapshot(self.file_name)
+
+    def test_diff_memory(self):
+        """Test changed words are reported as ranges of consecutive words."""
+        old = bytes(32)
+        new = bytearray(old)
+        new[0] = 1  # word 0
+        new[9] = 1  # word 2
+        new[15] = 1  # word 3
+        new[28] = 1  # word 7
+        self.assertEqual(diff_memory(old, new, 0x100), [(0x100, 0x104), (0x108, 0x110), (0x11C, 0x120)])
+        self.assertEqual(diff_memory(old, old), [])
+        self.assertEqual(diff_memory(b"abc", b"abd"), [(2, 3)])
+        with self.assertRaises(TTException):
+            diff_memory(b"abcd", b"abc")
+
+    def test_diff_snapshots(self):
+        """Test compare two snapshots -- only changed cores are reported, with summary of comparison."""
+        old_file = os.path.join(self.directory.name, "old.bin")
+        new_file = os.path.join(self.directory.name, "new.bin")
+        regions = [(0, (1, 1), "functional_workers", 0, 16), (0, (2, 1), "functional_workers", 0, 16)]
+        self.write_snapshot(regions, [bytes(16), bytes(16)], old_file)
+        self.write_snapshot(
+            regions + [(0, (3, 1), "functional_workers", 0, 16)], [bytes(16), bytes(12) + b"\x01\x00\x00\x00"], new_file
+        )
+
+        with MemorySnapshot(old_file) as old, MemorySnapshot(new_file) as new:
+            diff = diff_snapshots(old, new)
+        self.assertEqual(diff.compared_cores, 2)
+        self.assertEqual(diff.compared_bytes, 32)
+        self.assertEqual(diff.missing_cores, [(0, (3, 1))])
+        self.assertEqual(len(diff.cores), 1)
+        self.assertEqual(diff.cores[0].core, (2, 1))
+        self.assertEqual(diff.cores[0].ranges, [(12, 16)])
+        self.assertEqual(diff.cores[0].total_words, 4)
+        self.assertEqual(diff.changed_words, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from ttexalens.context import Context
+from ttexalens.write_batch import WriteBatch
+
+
+class Core:
+    """Core location that is only converted to noc0 coordinates, enough for buffering writes."""
+
+    def __init__(self, x: int, y: int) -> None:
+        self.noc0 = (x, y)
+
+    def to(self, coord_type: str):
+        return self.noc0
+
+
+class RecordingWriteBatch(WriteBatch):
+    """Write batch that records flushed writes instead of writing them to the device."""
+
+    def __init__(self, context) -> None:
+        super().__init__(context)
+        self.flushed = []
+
+    def flush(self) -> None:
+        writes, self.writes = self.writes, []
+        self.flushed.extend((write.device_id, write.core, write.address, bytes(write.data)) for write in writes)
+
+
+class TestWriteBatch(unittest.TestCase):
+    def setUp(self):
+        self.batch = RecordingWriteBatch(None)
+        self.core = Core(1, 2)
+
+    def test_merge_adjacent(self):
+        """Test consecutive writes to contiguous addresses -- they are merged into a single write."""
+        for i in range(4):
+            self.batch.write(0, self.core, 0x100 + 4 * i, (i + 1).to_bytes(4, "little"))
+        self.batch.flush()
+        self.assertEqual(self.batch.flushed, [(0, (1, 2), 0x100, b"\x01\0\0\0\x02\0\0\0\x03\0\0\0\x04\0\0\0")])
+
+    def test_merge_overlapping(self):
+        """Test overlapping writes -- data written later wins and range grows in both directions."""
+        self.batch.write(0, self.core, 0x104, b"abcd")
+        self.batch.write(0, self.core, 0x106, b"XYZW")
+        self.batch.write(0, self.core, 0x100, b"0123")
+        self.batch.flush()
+        self.assertEqual(self.batch.flushed, [(0, (1, 2), 0x100, b"0123abXYZW")])
+
+    def test_keep_order(self):
+        """Test writes to other cores, devices and distant addresses -- they are not merged and keep their order."""
+        other_core = Core(3, 4)
+        self.batch.write(0, self.core, 0x100, b"a")
+        self.batch.write(0, other_core, 0x101, b"b")
+        self.batch.write(0, self.core, 0x101, b"c")
+        self.batch.write(1, self.core, 0x102, b"d")
+        self.batch.write(1, self.core, 0x200, b"e")
+        self.batch.flush()
+        self.assertEqual(
+            self.batch.flushed,
+            [
+                (0, (1, 2), 0x100, b"a"),
+                (0, (3, 4), 0x101, b"b"),
+                (0, (1, 2), 0x101, b"c"),
+                (1, (1, 2), 0x102, b"d"),
+                (1, (1, 2), 0x200, b"e"),
+            ],
+        )
+
+    def test_flush_overlapping(self):
+        """Test reads of buffered writes -- only reads that overlap buffered data flush the batch."""
+        self.batch.write(0, self.core, 0x100, b"abcd")
+        self.batch.flush_overlapping(0, self.core, 0x104, 4)
+        self.batch.flush_overlapping(0, Core(3, 4), 0x100, 4)
+        self.batch.flush_overlapping(1, self.core, 0x100, 4)
+        self.assertEqual(self.batch.flushed, [])
+        self.batch.flush_overlapping(0, self.core, 0xFE, 3)
+        self.assertEqual(self.batch.flushed, [(0, (1, 2), 0x100, b"abcd")])
+        self.assertEqual(self.batch.writes, [])
+
+    def test_context_scope(self):
+        """Test context write batch scope -- nested scopes share the batch and unbatched writes suspend it."""
+        context = Context(None, None, "test")
+        self.assertIsNone(context.active_write_batch)
+        with context.write_batch() as batch:
+            self.assertIs(context.active_write_batch, batch)
+            with context.write_batch() as nested:
+                self.assertIs(nested, batch)
+            with context.unbatched_writes():
+                self.assertIsNone(context.active_write_batch)
+            self.assertIs(context.active_write_batch, batch)
+        self.assertIsNone(context.active_write_batch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,10 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Usage:
-  tt-exalens [--commands=<cmds>] [--write-cache] [--cache-path=<path>] [--start-gdb=<gdb_port>] [--devices=<devices>] [--verbosity=<verbosity>] [--test] [--jtag] [--use-noc1]
+  tt-exalens [--commands=<cmds>] [--write-cache] [--cache-path=<path>] [--record-timing] [--cache-reads] [--volatile-regions=<regions>] [--start-gdb=<gdb_port>] [--devices=<devices>] [--verbosity=<verbosity>] [--test] [--jtag] [--use-noc1]
   tt-exalens --server [--port=<port>] [--devices=<devices>] [--test] [--jtag] [-s=<simulation_directory>] [--background] [--use-noc1]
-  tt-exalens --remote [--remote-address=<ip:port>] [--commands=<cmds>] [--write-cache] [--cache-path=<path>] [--start-gdb=<gdb_port>] [--verbosity=<verbosity>] [--test]
-  tt-exalens --cached [--cache-path=<path>] [--commands=<cmds>] [--verbosity=<verbosity>] [--test]
+  tt-exalens --remote [--remote-address=<ip:port>] [--compress] [--commands=<cmds>] [--write-cache] [--cache-path=<path>] [--record-timing] [--cache-reads] [--volatile-regions=<regions>] [--start-gdb=<gdb_port>] [--verbosity=<verbosity>] [--test]
+  tt-exalens --cached [--cache-path=<path>] [--replay-latency] [--commands=<cmds>] [--verbosity=<verbosity>] [--test]
   tt-exalens -h | --help
 
 Options:
@@ -17,10 +17,16 @@ Options:
   --cached                        Use the cache from previous TTExaLens run to simulate device communication.
   --port=<port>                   Port of the TTExaLens server. If not specified, defaults to 5555.  [default: 5555]
   --remote-address=<ip:port>      Address of the remote TTExaLens server, in the form of ip:port, or just :port, if ip is localhost. If not specified, defaults to localhost:5555. [default: localhost:5555]
+  --compress                      Ask the remote TTExaLens server to compress large responses. Useful on slow links.
   --commands=<cmds>               Execute a list of semicolon-separated commands.
   --start-gdb=<gdb_port>          Start a gdb server on the specified port.
   --write-cache                   Write the cache to disk.
   --cache-path=<path>             If running in --cached mode, this is the path to the cache file. If writing cache, this is the path for output. [default: ttexalens_cache.pkl]
+  --record-timing                 When writing cache, also record time and latency of every device call.
+  --cache-reads                   Serve repeated reads of L1 memory from memory until a write overlaps them. Can be used without --write-cache.
+                                  Writes to register space (e.g. starting cores) drop all cached reads. Changes made by already running cores are not seen.
+  --volatile-regions=<regions>    Comma-separated list of address:size L1 ranges of every core (e.g. firmware mailboxes) that --cache-reads never caches.
+  --replay-latency                In --cached mode, make every cached call take as long as recorded with --record-timing.
   --devices=<devices>             Comma-separated list of devices to load. If not supplied, all devices will be loaded.
   --background                    Start the server in the background detached from console (doesn't require ENTER button for exit, but exit.server file to be created).
   -s=<simulation_directory>       Specifies build output directory of the simulator.
@@ -412,6 +418,17 @@ def main():
     cache_path = None
     if args["--write-cache"]:
         cache_path = args["--cache-path"]
+    elif args["--record-timing"]:
+        util.WARN("--record-timing has no effect without --write-cache.")
+
+    volatile_regions = None
+    if args["--volatile-regions"]:
+        if not args["--cache-reads"]:
+            util.WARN("--volatile-regions has no effect without --cache-reads.")
+        volatile_regions = []
+        for region in args["--volatile-regions"].split(","):
+            address, size = region.split(":")
+            volatile_regions.append((int(address, 0), int(size, 0)))
 
     # Try to start the server. If already running, exit with error.
     if args["--server"]:
@@ -433,19 +450,41 @@ def main():
 
     if args["--cached"]:
         util.INFO(f"Starting TTExaLens from cache.")
-        context = tt_exalens_init.init_ttexalens_cached(args["--cache-path"])
+        context = tt_exalens_init.init_ttexalens_cached(args["--cache-path"], args["--replay-latency"])
     elif args["--remote"]:
         address = args["--remote-address"].split(":")
         server_ip = address[0] if address[0] != "" else "localhost"
         server_port = address[-1]
         util.INFO(f"Connecting to TTExaLens server at {server_ip}:{server_port}")
-        context = tt_exalens_init.init_ttexalens_remote(server_ip, int(server_port), cache_path)
+        context = tt_exalens_init.init_ttexalens_remote(
+            server_ip,
+            int(server_port),
+            cache_path,
+            compression=args["--compress"],
+            record_timing=args["--record-timing"],
+            cache_reads=args["--cache-reads"],
+            volatile_regions=volatile_regions,
+        )
     else:
-        context = tt_exalens_init.init_ttexalens(wanted_devices, cache_path, args["--jtag"], args["--use-noc1"])
+        context = tt_exalens_init.init_ttexalens(
+            wanted_devices,
+            cache_path,
+            args["--jtag"],
+            args["--use-noc1"],
+            args["--record-timing"],
+            args["--cache-reads"],
+            volatile_regions,
+        )
 
     # Main function
     exit_code = main_loop(args, context)
 
+    if args["--cached"] and context.server_ifc.replayed_calls > 0:
+        util.INFO(
+            f"Replayed {context.server_ifc.replayed_calls} calls with {context.server_ifc.device_time:.3f}s of "
+            "recorded device time"
+        )
+
     util.VERBOSE(f"Exiting with code {exit_code} ")
     sys.exit(exit_code)
 
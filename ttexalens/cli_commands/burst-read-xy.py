@@ -34,13 +34,12 @@ command_metadata = {
     "context": ["limited", "metal"],
 }
 
-import time
 from docopt import docopt
 
 from ttexalens.uistate import UIState
 
 from ttexalens.coordinate import OnChipCoordinate
-from ttexalens.tt_exalens_lib import read_words_from_device, read_from_device
+from ttexalens.tt_exalens_lib import read_words_from_device, sample_word_from_device
 from ttexalens.firmware import ELF
 from ttexalens.object import DataArray
 from ttexalens import util as util
@@ -126,14 +125,13 @@ def print_a_pci_burst_read(
         print(formated)
     else:
         for i in range(word_count):
-            values = {}
             print(f"Sampling for {sample / word_count} second{'s' if sample != 1 else ''}...")
-            t_end = time.time() + sample / word_count
-            while time.time() < t_end:
-                val = read_from_device(core_loc, addr, device_id, context=context)
-                val = int.from_bytes(val, byteorder="little")
-                if val not in values:
-                    values[val] = 0
-                values[val] += 1
-            for val in values.keys():
-                print_a_pci_read(core_loc_str, addr + 4 * i, val, f"- {values[val]} times")
+            result = sample_word_from_device(
+                core_loc, addr + 4 * i, device_id, int(sample / word_count * 1000), context=context
+            )
+            for val, count, _, _ in result.values:
+                print_a_pci_read(core_loc_str, addr + 4 * i, val, f"- {count} times")
+            if result.dropped > 0:
+                util.WARN(f"{result.dropped} reads of other values were not counted")
+            rate = result.samples / (result.elapsed_us / 1e6) if result.elapsed_us > 0 else 0
+            print(f"{result.samples} reads in {result.elapsed_us / 1e6:.3f}s ({rate:.0f} reads/s)")
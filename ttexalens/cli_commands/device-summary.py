@@ -43,7 +43,7 @@ from ttexalens import command_parser, util as util
 from ttexalens.device import Device
 from ttexalens.coordinate import VALID_COORDINATE_TYPES
 from ttexalens.context import LimitedContext
-from ttexalens.tt_exalens_lib import read_words_from_device
+from ttexalens.tt_exalens_lib import read_from_cores
 
 
 def color_block(text: str, block_type: str):
@@ -108,6 +108,23 @@ def run(cmd_text, context, ui_state=None):
         # What to render in each cell
         cell_contents_array = [s.strip() for s in cell_contents.split(",")]
 
+        # Read device values of all rendered cells at once instead of sending one request per cell
+        locs = []
+        for block_type in device.block_types:
+            for loc in device.get_block_locations(block_type):
+                try:
+                    loc.to(axis_coordinate)
+                    locs.append(loc)
+                except:
+                    pass
+        riscv_statuses = device.get_riscv_run_statuses(locs) if "riscv" in cell_contents_array else {}
+        noc_node_ids = {}
+        if "noc_id" in cell_contents_array:
+            noc_id_locs = [loc for loc in locs if device.get_block_type(loc) != "pcie"]
+            noc_node_id_address = device.get_tensix_register_address("NOC_NODE_ID")
+            data = read_from_cores(noc_id_locs, noc_node_id_address, device._id, 4, context)
+            noc_node_ids = {loc: int.from_bytes(value, byteorder="little") for loc, value in zip(noc_id_locs, data)}
+
         def cell_render_function(loc):
             # One string for each of cell_contents_array elements
             cell_contents_str = []
@@ -117,12 +134,11 @@ def run(cmd_text, context, ui_state=None):
                 if ct == "block":
                     cell_contents_str.append(color_block(block_type, block_type))
                 elif ct == "riscv":
-                    text = device.get_riscv_run_status(loc)
+                    text = riscv_statuses[loc]
                     cell_contents_str.append(color_block(text, block_type))
                 elif ct == "noc_id":
                     if block_type is not None and block_type != "pcie":
-                        noc_node_id_address = device.get_tensix_register_address("NOC_NODE_ID")
-                        data = read_words_from_device(loc, noc_node_id_address, device._id, 1, context)[0]
+                        data = noc_node_ids[loc]
                         x = data & 0x3F
                         y = (data >> 6) & 0x3F
                         cell_contents_str.append(f"{x:02}-{y:02}")
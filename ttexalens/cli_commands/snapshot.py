@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  snapshot diff <old-file> <new-file> [--max-ranges=<N>]
+  snapshot <file> [-d <D>...] [--no-eth]
+
+Arguments:
+  file              Path of the snapshot file
+  old-file          Path of the older snapshot file to compare
+  new-file          Path of the newer snapshot file to compare
+
+Options:
+  -d <D>            Device ID. Optional and repeatable. Default: all devices
+  --no-eth          Capture only Tensix cores, without Ethernet cores.
+  --max-ranges=<N>  Maximum number of changed ranges printed for every core. [default: 10]
+
+Description:
+  Captures L1 memory of every Tensix and Ethernet core into a single binary file with an index of cores.
+  Snapshot can be opened with tt_exalens_lib.load_l1_snapshot and read as NumPy arrays.
+  With 'diff', compares two snapshots and prints changed address ranges of every core.
+
+Examples:
+  snapshot l1.bin               # Capture L1 of all cores on all devices
+  snapshot l1.bin -d 0          # Capture L1 of all cores on device 0
+  snapshot l1.bin --no-eth      # Capture L1 of Tensix cores on all devices
+  snapshot diff a.bin b.bin     # Print memory that changed between two snapshots
+"""  # Note: Limit the above comment to 100 characters in width
+
+command_metadata = {
+    "short": "snapshot",
+    "type": "high-level",
+    "description": __doc__,
+    "context": ["limited", "metal"],
+}
+
+import time
+
+from docopt import docopt
+
+from ttexalens import util as util
+from ttexalens.memory_snapshot import diff_snapshots
+from ttexalens.tt_exalens_lib import load_l1_snapshot, save_l1_snapshot
+
+
+def print_diff(old_file: str, new_file: str, max_ranges: int):
+    with load_l1_snapshot(old_file) as old, load_l1_snapshot(new_file) as new:
+        diff = diff_snapshots(old, new)
+
+    for core in diff.cores:
+        print(
+            f"Device {core.device_id} core {core.core[0]}-{core.core[1]}: {core.changed_words} of {core.total_words} "
+            f"words changed in {len(core.ranges)} ranges"
+        )
+        for start, end in core.ranges[:max_ranges]:
+            print(f"  0x{start:08x} - 0x{end:08x} ({end - start} bytes)")
+        if len(core.ranges) > max_ranges:
+            print(f"  ... {len(core.ranges) - max_ranges} more ranges")
+
+    for device_id, core in diff.missing_cores:
+        util.WARN(f"Device {device_id} core {core[0]}-{core[1]} is only in one of the snapshots")
+    util.INFO(
+        f"Compared {diff.compared_cores} cores ({diff.compared_bytes} bytes): {len(diff.cores)} changed, "
+        f"{diff.changed_words} words changed in total"
+    )
+
+
+def run(cmd_text, context, ui_state=None):
+    args = docopt(__doc__, argv=cmd_text.split()[1:])
+
+    if args["diff"]:
+        print_diff(args["<old-file>"], args["<new-file>"], int(args["--max-ranges"]))
+        return []
+
+    device_ids = [int(device_id, 0) for device_id in args["-d"]] if args["-d"] else None
+    start = time.time()
+    with save_l1_snapshot(args["<file>"], device_ids, not args["--no-eth"], context) as snapshot:
+        size = sum(entry.size for entry in snapshot.entries)
+        util.INFO(
+            f"Captured {len(snapshot.entries)} cores ({size} bytes) to {args['<file>']} in {time.time() - start:.2f}s"
+        )
+
+    return []
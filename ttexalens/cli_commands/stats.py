@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  stats [--reset] [--enable | --disable]
+
+Options:
+  --reset       Clear statistics after printing them.
+  --enable      Start counting transactions issued by this client.
+  --disable     Stop counting transactions issued by this client.
+
+Description:
+  Prints transaction statistics. Server statistics are available when connected to TTExaLens server
+  and show request count, bytes received and sent and p50/p99 latency for every chip and request type.
+  Client statistics show transactions grouped by tt_exalens_lib function that issued them. They are
+  collected only after counting is enabled, since finding the caller slows down every transaction.
+
+Examples:
+  stats --enable                # Start counting client transactions
+  stats                         # Print server and client statistics
+  stats --reset                 # Print statistics and start counting from zero
+"""  # Note: Limit the above comment to 100 characters in width
+
+command_metadata = {
+    "short": "stats",
+    "type": "low-level",
+    "description": __doc__,
+    "context": ["limited", "metal"],
+}
+
+from docopt import docopt
+from tabulate import tabulate
+
+from ttexalens import util as util
+from ttexalens.tt_exalens_ifc import ttexalens_server_request_type
+
+
+def request_type_name(type: int) -> str:
+    try:
+        return ttexalens_server_request_type(type).name
+    except ValueError:
+        return str(type)
+
+
+def print_server_statistics(entries: "list[dict]"):
+    rows = [
+        [
+            entry["chip_id"] if entry["chip_id"] >= 0 else "-",
+            request_type_name(entry["type"]),
+            entry["count"],
+            entry["request_bytes"],
+            entry["response_bytes"],
+            entry["total_latency_us"] // entry["count"] if entry["count"] > 0 else 0,
+            entry["p50_latency_us"],
+            entry["p99_latency_us"],
+        ]
+        for entry in entries
+    ]
+    headers = ["Chip", "Request", "Count", "Bytes in", "Bytes out", "Avg us", "p50 us", "p99 us"]
+    print("Server statistics:")
+    print(tabulate(rows, headers=headers, disable_numparse=True))
+
+
+def print_client_statistics(counters: "list[dict]"):
+    rows = [
+        [
+            counter["caller"],
+            counter["operation"],
+            counter["count"],
+            counter["bytes"],
+            f"{counter['time'] * 1000:.3f}",
+        ]
+        for counter in counters
+    ]
+    headers = ["Caller", "Operation", "Count", "Bytes", "Time ms"]
+    print("Client statistics:")
+    print(tabulate(rows, headers=headers, disable_numparse=True))
+
+
+def run(cmd_text, context, ui_state=None):
+    args = docopt(__doc__, argv=cmd_text.split()[1:])
+    statistics = context.server_ifc.statistics
+
+    server_entries = context.server_ifc.get_server_statistics(args["--reset"])
+    if server_entries is None:
+        util.INFO("Server statistics are available only when connected to TTExaLens server.")
+    else:
+        print_server_statistics(server_entries)
+
+    if statistics.enabled or statistics.snapshot():
+        print_client_statistics(statistics.snapshot())
+    else:
+        util.INFO("Counting of client transactions is disabled. Use 'stats --enable' to enable it.")
+
+    if args["--reset"]:
+        statistics.reset()
+    if args["--enable"]:
+        statistics.enabled = True
+    if args["--disable"]:
+        statistics.enabled = False
+
+    return []
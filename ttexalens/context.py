@@ -1,13 +1,21 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import threading
+
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import cached_property
 from typing import Dict, Optional, Set
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens import util as util
 from ttexalens.firmware import ELF
 
+# Number of threads that run asynchronous tt_exalens_lib requests of one context
+EXECUTOR_WORKERS = 8
+
+
 # All-encompassing structure representing a TTExaLens context
 class Context:
     def __init__(self, server_ifc, cluster_desc, short_name, use_noc1=False):
@@ -15,6 +23,7 @@ class Context:
         self._cluster_desc = cluster_desc
         self.short_name = short_name
         self.use_noc1 = use_noc1
+        self._write_batches = threading.local()  # Write batch entered by every thread, see write_batch
 
     def filter_commands(self, commands):
         self.commands = []
@@ -40,6 +49,55 @@ class Context:
             )
         return devices
 
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        # Runs asynchronous tt_exalens_lib requests (read_from_device_async, write_to_device_async...)
+        return ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix=f"ttexalens-{self.short_name}")
+
+    @property
+    def active_write_batch(self) -> Optional["WriteBatch"]:
+        return getattr(self._write_batches, "batch", None)
+
+    @contextmanager
+    def write_batch(self):
+        """
+        Buffers write_to_device and write_words_to_device calls of the current thread and merges consecutive writes
+        to adjacent or overlapping addresses of the same core into a single bulk write. Buffered writes are flushed in
+        order at exit and before any tt_exalens_lib read that overlaps them. Nested scopes join the outer one.
+        """
+        from ttexalens.write_batch import WriteBatch
+
+        batch = self.active_write_batch
+        if batch is not None:
+            yield batch
+            return
+
+        batch = WriteBatch(self)
+        self._write_batches.batch = batch
+        try:
+            yield batch
+        finally:
+            self._write_batches.batch = None
+            batch.flush()
+
+    @contextmanager
+    def unbatched_writes(self):
+        """
+        Flushes active write batch and writes directly to the device until exit. Use it for registers with side
+        effects, where writes must not be merged and must reach the device before other addresses are read.
+        """
+        batch = self.active_write_batch
+        if batch is None:
+            yield
+            return
+
+        batch.flush()
+        self._write_batches.batch = None
+        try:
+            yield
+        finally:
+            self._write_batches.batch = batch
+
     @cached_property
     def cluster_desc(self):
         return self._cluster_desc
@@ -8,7 +8,14 @@ from typing import Union
 from ttexalens.context import Context
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.parse_elf import read_elf
-from ttexalens.tt_exalens_lib import read_word_from_device, write_words_to_device, read_from_device, write_to_device
+from ttexalens.tt_exalens_lib import (
+    read_word_from_device,
+    write_words_to_device,
+    read_from_device,
+    write_to_device,
+    write_to_cores,
+    read_from_cores,
+)
 from ttexalens import util as util
 import os
 
@@ -267,7 +274,9 @@ class RiscDebug:
             self.assert_not_in_reset()
         if self.verbose:
             util.DEBUG(f"{self.get_reg_name_for_address(addr)} <- WR   0x{data:08x}")
-        write_words_to_device(self.location.loc, addr, data, self.location.loc._device._id, self.context)
+        # Debug registers have side effects, so writes to them must not be merged by write batch
+        with self.context.unbatched_writes():
+            write_words_to_device(self.location.loc, addr, data, self.location.loc._device._id, self.context)
 
     def __read(self, addr):
         if self.enable_asserts:
@@ -417,9 +426,11 @@ class RiscDebug:
             self.location.loc, self.RISC_DBG_SOFT_RESET0, self.location.loc._device.id(), self.context
         )
         reset_reg = (reset_reg & ~(1 << shift)) | (value << shift)
-        write_words_to_device(
-            self.location.loc, self.RISC_DBG_SOFT_RESET0, reset_reg, self.location.loc._device.id(), self.context
-        )
+        # Memory written in write batch must be on the device before core is taken out of reset
+        with self.context.unbatched_writes():
+            write_words_to_device(
+                self.location.loc, self.RISC_DBG_SOFT_RESET0, reset_reg, self.location.loc._device.id(), self.context
+            )
         new_reset_reg = read_word_from_device(
             self.location.loc, self.RISC_DBG_SOFT_RESET0, self.location.loc._device.id(), self.context
         )
@@ -556,6 +567,33 @@ class RiscDebug:
 from elftools.elf.elffile import ELFFile
 
 
+@dataclass(frozen=True)
+class ElfSection:
+    name: str
+    address: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class ElfLoadPlan:
+    """
+    Sections of an ELF file with their load addresses, parsed once by RiscLoader.create_load_plan and shared by all
+    cores the ELF is loaded to.
+    """
+
+    elf_path: str
+    sections: "tuple[ElfSection, ...]"
+    init_section_address: "int | None"
+
+    @property
+    def noc_sections(self) -> "list[ElfSection]":
+        return [section for section in self.sections if not RiscLoader.is_private_address(section.address)]
+
+    @property
+    def private_sections(self) -> "list[ElfSection]":
+        return [section for section in self.sections if RiscLoader.is_private_address(section.address)]
+
+
 class RiscLoader:
     """
     This class is used to load elf file to a RISC-V core.
@@ -800,15 +838,22 @@ class RiscLoader:
 
         return data
 
+    @staticmethod
+    def is_private_address(address: int) -> bool:
+        """
+        Returns True if address is in one of the sections not accessible through NOC (0xFFB00000 or 0xFFC00000).
+        """
+        return (
+            address & RiscLoader.PRIVATE_MEMORY_BASE == RiscLoader.PRIVATE_MEMORY_BASE
+            or address & RiscLoader.PRIVATE_CODE_BASE == RiscLoader.PRIVATE_CODE_BASE
+        )
+
     def write_block(self, address, data: bytes):
         """
         Writes a block of bytes to a given address. Knows about the sections not accessible through NOC (0xFFB00000 or 0xFFC00000), and uses
         the debug interface to write them.
         """
-        if (
-            address & self.PRIVATE_MEMORY_BASE == self.PRIVATE_MEMORY_BASE
-            or address & self.PRIVATE_CODE_BASE == self.PRIVATE_CODE_BASE
-        ):
+        if self.is_private_address(address):
             # Use debug interface
             self.write_block_through_debug(address, data)
         else:
@@ -821,10 +866,7 @@ class RiscLoader:
         Reads a block of bytes from a given address. Knows about the sections not accessible through NOC (0xFFB00000 or 0xFFC00000), and uses
         the debug interface to read them.
         """
-        if (
-            address & self.PRIVATE_MEMORY_BASE == self.PRIVATE_MEMORY_BASE
-            or address & self.PRIVATE_CODE_BASE == self.PRIVATE_CODE_BASE
-        ):
+        if self.is_private_address(address):
             # Use debug interface
             return self.read_block_through_debug(address, byte_count)
         else:
@@ -836,32 +878,35 @@ class RiscLoader:
                 self.context,
             )
 
-    def remap_address(self, address: int, loader_data: int, loader_code: int):
-        if address & self.PRIVATE_MEMORY_BASE == self.PRIVATE_MEMORY_BASE:
+    @staticmethod
+    def remap_address(address: int, loader_data: int, loader_code: int):
+        if address & RiscLoader.PRIVATE_MEMORY_BASE == RiscLoader.PRIVATE_MEMORY_BASE:
             if loader_data is not None and isinstance(loader_data, int):
-                return address - self.PRIVATE_MEMORY_BASE + loader_data
+                return address - RiscLoader.PRIVATE_MEMORY_BASE + loader_data
             return address
-        if address & self.PRIVATE_CODE_BASE == self.PRIVATE_CODE_BASE:
+        if address & RiscLoader.PRIVATE_CODE_BASE == RiscLoader.PRIVATE_CODE_BASE:
             if loader_code is not None and isinstance(loader_code, int):
-                return address - self.PRIVATE_CODE_BASE + loader_code
+                return address - RiscLoader.PRIVATE_CODE_BASE + loader_code
             return address
         return address
 
-    def load_elf_sections(self, elf_path, loader_data: Union[str, int], loader_code: Union[str, int]):
+    @staticmethod
+    def create_load_plan(
+        elf_path: str,
+        context: Context,
+        loader_data: Union[str, int] = ".loader_init",
+        loader_code: Union[str, int] = ".loader_code",
+    ) -> ElfLoadPlan:
         """
-        Given an ELF file, this function loads the sections specified in SECTIONS_TO_LOAD to the
-        memory of the RISC-V core. It also loads (into location 0) the jump instruction to the
-        address of the .init section.
+        Parses the ELF file once and returns the sections in SECTIONS_TO_LOAD with their load addresses. Addresses of
+        private sections are remapped to loader_data and loader_code sections when ELF file contains them.
+        The same plan can be applied to any number of cores.
         """
         if not os.path.exists(elf_path):
             raise FileNotFoundError(f"File {elf_path} not found")
 
-        # Remember the .init section address to jump to after loading
-        init_section_address = None
-
         try:
-            elf_file = self.context.server_ifc.get_binary(elf_path)
-            elf_file = ELFFile(elf_file)
+            elf_file = ELFFile(context.server_ifc.get_binary(elf_path))
 
             # Try to find address mapping for loader_data and loader_code
             for section in elf_file.iter_sections():
@@ -873,53 +918,111 @@ class RiscLoader:
                     elif name == loader_code:
                         loader_code = address
 
-            # Load section into memory
+            sections = []
+            init_section_address = None
             for section in elf_file.iter_sections():
                 if section.data() and hasattr(section.header, "sh_addr"):
                     name = section.name
-                    if name in self.SECTIONS_TO_LOAD:
+                    if name in RiscLoader.SECTIONS_TO_LOAD:
                         address = section.header.sh_addr
                         if address % 4 != 0:
                             raise ValueError(f"Section address 0x{address:08x} is not 32-bit aligned")
 
-                        address = self.remap_address(address, loader_data, loader_code)
-                        data = section.data()
-
+                        address = RiscLoader.remap_address(address, loader_data, loader_code)
                         if name == ".init":
                             init_section_address = address
+                        sections.append(ElfSection(name, address, section.data()))
+        except Exception as e:
+            util.ERROR(e)
+            raise util.TTException(f"Error loading elf file {elf_path}")
+
+        return ElfLoadPlan(elf_path, tuple(sections), init_section_address)
 
-                        util.VERBOSE(f"Writing section {name} to address 0x{address:08x}. Size: {len(data)} bytes")
-                        self.write_block(address, data)
+    @staticmethod
+    def write_load_plan_to_cores(load_plan: ElfLoadPlan, locations: "list[OnChipCoordinate]", context: Context):
+        """
+        Writes sections of the load plan that are accessible through NOC to all locations at once and verifies them
+        with a single read of all locations. Private sections still have to be written by load_elf of every core,
+        which should be called with noc_sections_written=True. All locations must be on the same device and their
+        RISC cores must be in reset.
+        """
+        device_id = locations[0]._device.id()
+        try:
+            for section in load_plan.noc_sections:
+                util.VERBOSE(
+                    f"Writing section {section.name} to address 0x{section.address:08x} on {len(locations)} cores. Size: {len(section.data)} bytes"
+                )
+                write_to_cores(locations, section.address, section.data, device_id, context)
 
             # Check that what we have written is correct
-            for section in elf_file.iter_sections():
-                if section.data() and hasattr(section.header, "sh_addr"):
-                    name = section.name
-                    if name in self.SECTIONS_TO_LOAD:
-                        address = section.header.sh_addr
-                        data = section.data()
-                        address = self.remap_address(address, loader_data, loader_code)
-                        read_data = self.read_block(address, len(data))
-                        if read_data != data:
-                            util.ERROR(f"Error writing section {name} to address 0x{address:08x}.")
-                            continue
-                        else:
-                            util.VERBOSE(
-                                f"Section {name} loaded successfully to address 0x{address:08x}. Size: {len(data)} bytes"
-                            )
+            for section in load_plan.noc_sections:
+                read_data = read_from_cores(locations, section.address, device_id, len(section.data), context)
+                for location, core_data in zip(locations, read_data):
+                    if core_data != section.data:
+                        util.ERROR(
+                            f"Error writing section {section.name} to address 0x{section.address:08x} on {location}."
+                        )
+        except Exception as e:
+            util.ERROR(e)
+            raise util.TTException(f"Error loading elf file {load_plan.elf_path}")
+
+    def load_elf_sections(
+        self,
+        elf_path,
+        loader_data: Union[str, int],
+        loader_code: Union[str, int],
+        noc_sections_written: bool = False,
+        load_plan: ElfLoadPlan = None,
+    ):
+        """
+        Given an ELF file, this function loads the sections specified in SECTIONS_TO_LOAD to the
+        memory of the RISC-V core. It also loads (into location 0) the jump instruction to the
+        address of the .init section. If load_plan is given, ELF file is not parsed again. If
+        noc_sections_written is True, sections accessible through NOC were already written and
+        verified by write_load_plan_to_cores, so only private sections are loaded.
+        """
+        if load_plan is None:
+            load_plan = self.create_load_plan(elf_path, self.context, loader_data, loader_code)
+
+        sections = load_plan.private_sections if noc_sections_written else load_plan.sections
+        try:
+            # Load section into memory; adjacent sections are combined into a single write
+            with self.context.write_batch():
+                for section in sections:
+                    util.VERBOSE(
+                        f"Writing section {section.name} to address 0x{section.address:08x}. Size: {len(section.data)} bytes"
+                    )
+                    self.write_block(section.address, section.data)
+
+            # Check that what we have written is correct
+            for section in sections:
+                read_data = self.read_block(section.address, len(section.data))
+                if read_data != section.data:
+                    util.ERROR(f"Error writing section {section.name} to address 0x{section.address:08x}.")
+                    continue
+                else:
+                    util.VERBOSE(
+                        f"Section {section.name} loaded successfully to address 0x{section.address:08x}. Size: {len(section.data)} bytes"
+                    )
         except Exception as e:
             util.ERROR(e)
             raise util.TTException(f"Error loading elf file {elf_path}")
 
         self.context.elf_loaded(self.risc_debug.location.loc, self.risc_debug.location.risc_id, elf_path)
-        return init_section_address
+        return load_plan.init_section_address
 
-    def load_elf(self, elf_path: str):
+    def load_elf(self, elf_path: str, noc_sections_written: bool = False, load_plan: ElfLoadPlan = None):
         # Risc must be in reset
         assert self.risc_debug.is_in_reset(), f"RISC at location {self.risc_debug.location} is not in reset."
 
         # Load elf file to the L1 memory; avoid writing to private sections
-        init_section_address = self.load_elf_sections(elf_path, loader_data=".loader_init", loader_code=".loader_code")
+        init_section_address = self.load_elf_sections(
+            elf_path,
+            loader_data=".loader_init",
+            loader_code=".loader_code",
+            noc_sections_written=noc_sections_written,
+            load_plan=load_plan,
+        )
         assert init_section_address is not None, "No .init section found in the ELF file"
 
         # Change core start address to the start of the .init section
@@ -940,12 +1043,12 @@ class RiscLoader:
             # Change core start address
             self.set_risc_start_address(init_section_address)
 
-    def run_elf(self, elf_path: str):
+    def run_elf(self, elf_path: str, noc_sections_written: bool = False, load_plan: ElfLoadPlan = None):
         # Make sure risc is in reset
         if not self.risc_debug.is_in_reset():
             self.risc_debug.set_reset_signal(1)
 
-        self.load_elf(elf_path)
+        self.load_elf(elf_path, noc_sections_written, load_plan)
 
         # Take risc out of reset
         self.risc_debug.set_reset_signal(0)
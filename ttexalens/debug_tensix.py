@@ -6,7 +6,13 @@ from enum import Enum
 
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.context import Context
-from ttexalens.tt_exalens_lib import check_context, validate_device_id, read_word_from_device, write_words_to_device
+from ttexalens.tt_exalens_lib import (
+    check_context,
+    validate_device_id,
+    poll_word_from_device,
+    read_word_from_device,
+    write_words_to_device,
+)
 from ttexalens.util import TTException
 from ttexalens.device import Device, ConfigurationRegisterDescription, TensixRegisterDescription
 from ttexalens.unpack_regfile import unpack_data
@@ -74,6 +80,17 @@ class TensixDebug:
             self.context,
         )
 
+    def wait_dbg_buff_status(self, mask: int) -> int:
+        """Waits until all bits of mask are set in DBG_INSTRN_BUF_STATUS. Polling is done without round trip per read."""
+        return poll_word_from_device(
+            self.core_loc,
+            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_STATUS"),
+            mask,
+            mask,
+            self.device_id,
+            context=self.context,
+        )
+
     def inject_instruction(
         self,
         instruction: Union[bytearray, int],
@@ -91,55 +108,55 @@ class TensixDebug:
             instruction = instruction.to_bytes(4, byteorder="little")
         validate_instruction(instruction, self.context)
 
-        # 1. Wait for buffer ready signal (poll bit 0 of DBG_INSTRN_BUF_STATUS until it’s 1)
-        while (self.dbg_buff_status() & 1) == 0:
-            pass
+        # Debug registers have side effects, so writes to them must not be merged by write batch
+        with self.context.unbatched_writes():
+            # 1. Wait for buffer ready signal (poll bit 0 of DBG_INSTRN_BUF_STATUS until it’s 1)
+            self.wait_dbg_buff_status(0x1)
 
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
-            0x07,
-            self.device_id,
-            self.context,
-        )
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
+                0x07,
+                self.device_id,
+                self.context,
+            )
 
-        # 2. Assemble 32-bit instruction and write it to DBG_INSTRN_BUF_CTRL1
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL1"),
-            int.from_bytes(instruction, byteorder="little"),
-            self.device_id,
-            self.context,
-        )
+            # 2. Assemble 32-bit instruction and write it to DBG_INSTRN_BUF_CTRL1
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL1"),
+                int.from_bytes(instruction, byteorder="little"),
+                self.device_id,
+                self.context,
+            )
 
-        # 3. Set bit 0(trigger) and bit 4 (override en) to 1 in DBG_INSTRN_BUF_CTRL0 to inject instruction.
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
-            0x7 | (0x10 << trisc_id),
-            self.device_id,
-            self.context,
-        )
+            # 3. Set bit 0(trigger) and bit 4 (override en) to 1 in DBG_INSTRN_BUF_CTRL0 to inject instruction.
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
+                0x7 | (0x10 << trisc_id),
+                self.device_id,
+                self.context,
+            )
 
-        # 4. Clear DBG_INSTRN_BUF_CTRL0 register
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
-            0x07,
-            self.device_id,
-            self.context,
-        )
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
-            0x00,
-            self.device_id,
-            self.context,
-        )
+            # 4. Clear DBG_INSTRN_BUF_CTRL0 register
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
+                0x07,
+                self.device_id,
+                self.context,
+            )
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_INSTRN_BUF_CTRL0"),
+                0x00,
+                self.device_id,
+                self.context,
+            )
 
-        # 5. Wait for buffer empty signal to make sure instruction completed (poll bit 4 of DBG_INSTRN_BUF_STATUS until it’s 1)
-        while (self.dbg_buff_status() & 0x10) == 0:
-            pass
+            # 5. Wait for buffer empty signal to make sure instruction completed (poll bit 4 of DBG_INSTRN_BUF_STATUS until it’s 1)
+            self.wait_dbg_buff_status(0x10)
 
     def read_tensix_register(self, register: Union[str, TensixRegisterDescription]) -> int:
         """Reads the value of a configuration or debug register from the tensix core.
@@ -177,13 +194,15 @@ class TensixDebug:
             raise ValueError(f"Invalid shift value {register.shift}. Shift must be between 0 and 31.")
 
         if isinstance(register, ConfigurationRegisterDescription):
-            write_words_to_device(
-                self.core_loc,
-                device.get_tensix_register_address("RISCV_DEBUG_REG_CFGREG_RD_CNTL"),
-                register.index,
-                self.device_id,
-                self.context,
-            )
+            # RDDATA depends on RD_CNTL, so RD_CNTL must be written before RDDATA is read
+            with self.context.unbatched_writes():
+                write_words_to_device(
+                    self.core_loc,
+                    device.get_tensix_register_address("RISCV_DEBUG_REG_CFGREG_RD_CNTL"),
+                    register.index,
+                    self.device_id,
+                    self.context,
+                )
             a = read_word_from_device(
                 self.core_loc,
                 device.get_tensix_register_address("RISCV_DEBUG_REG_CFGREG_RDDATA"),
@@ -280,74 +299,75 @@ class TensixDebug:
         if self.device._arch != "wormhole_b0" and self.device._arch != "blackhole":
             raise TTException("Not supported for this architecture: ")
 
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_EN"),
-            0x1,
-            self.device_id,
-            self.context,
-        )
-        data = []
-
-        for row in range(64):
-            row_addr = row if regfile != REGFILE.SRCA else 0
-            regfile_id = 2 if regfile == REGFILE.SRCA else regfile.value
-
-            if regfile == REGFILE.SRCA:
-                self.inject_instruction(ops.TT_OP_SFPLOAD(3, 0, 0, 0), trisc_id)
-                self.inject_instruction(ops.TT_OP_SFPLOAD(3, 0, 0, 2), trisc_id)
-
-                self.inject_instruction(ops.TT_OP_STALLWAIT(0x40, 0x4000), trisc_id)
-
-                self.inject_instruction(ops.TT_OP_MOVDBGA2D(0, row & 0xF, 0, 0, 0), trisc_id)
-            elif regfile == REGFILE.SRCB:
-                self.inject_instruction(ops.TT_OP_SETRWC(0, 0, 0, 0, 0, 0xF), trisc_id)
-
-                self.inject_instruction(ops.TT_OP_SETDVALID(0b10), trisc_id)
-                self.inject_instruction(ops.TT_OP_CLEARDVALID(0b10, 0), trisc_id)
-
-                self.inject_instruction(ops.TT_OP_SETDVALID(0b10), trisc_id)
-                self.inject_instruction(ops.TT_OP_SHIFTXB(7, 0, row_addr), trisc_id)
-                self.inject_instruction(ops.TT_OP_CLEARDVALID(0b10, 0), trisc_id)
-
-            for i in range(8):
-                dbg_array_rd_cmd = (row_addr) + (i << 12) + (regfile_id << 16)
-                write_words_to_device(
-                    self.core_loc,
-                    self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_CMD"),
-                    dbg_array_rd_cmd,
-                    self.device_id,
-                    self.context,
-                )
-                rd_data = read_word_from_device(
-                    self.core_loc,
-                    self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_DATA"),
-                    self.device_id,
-                    self.context,
-                )
-                data += list(int.to_bytes(rd_data, 4, byteorder="big"))
-
-            if regfile == REGFILE.SRCA:
-                self.inject_instruction(ops.TT_OP_SFPSTORE(3, 0, 0, 0), trisc_id)
-                self.inject_instruction(ops.TT_OP_SFPSTORE(3, 0, 0, 2), trisc_id)
-                if row % 16 == 15:
-                    self.inject_instruction(ops.TT_OP_SETRWC(3, 0, 0, 0, 0, 0xF), trisc_id)
+        with self.context.unbatched_writes():
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_EN"),
+                0x1,
+                self.device_id,
+                self.context,
+            )
+            data = []
+
+            for row in range(64):
+                row_addr = row if regfile != REGFILE.SRCA else 0
+                regfile_id = 2 if regfile == REGFILE.SRCA else regfile.value
+
+                if regfile == REGFILE.SRCA:
+                    self.inject_instruction(ops.TT_OP_SFPLOAD(3, 0, 0, 0), trisc_id)
+                    self.inject_instruction(ops.TT_OP_SFPLOAD(3, 0, 0, 2), trisc_id)
+
+                    self.inject_instruction(ops.TT_OP_STALLWAIT(0x40, 0x4000), trisc_id)
+
+                    self.inject_instruction(ops.TT_OP_MOVDBGA2D(0, row & 0xF, 0, 0, 0), trisc_id)
+                elif regfile == REGFILE.SRCB:
+                    self.inject_instruction(ops.TT_OP_SETRWC(0, 0, 0, 0, 0, 0xF), trisc_id)
+
+                    self.inject_instruction(ops.TT_OP_SETDVALID(0b10), trisc_id)
+                    self.inject_instruction(ops.TT_OP_CLEARDVALID(0b10, 0), trisc_id)
+
+                    self.inject_instruction(ops.TT_OP_SETDVALID(0b10), trisc_id)
+                    self.inject_instruction(ops.TT_OP_SHIFTXB(7, 0, row_addr), trisc_id)
+                    self.inject_instruction(ops.TT_OP_CLEARDVALID(0b10, 0), trisc_id)
+
+                for i in range(8):
+                    dbg_array_rd_cmd = (row_addr) + (i << 12) + (regfile_id << 16)
+                    write_words_to_device(
+                        self.core_loc,
+                        self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_CMD"),
+                        dbg_array_rd_cmd,
+                        self.device_id,
+                        self.context,
+                    )
+                    rd_data = read_word_from_device(
+                        self.core_loc,
+                        self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_DATA"),
+                        self.device_id,
+                        self.context,
+                    )
+                    data += list(int.to_bytes(rd_data, 4, byteorder="big"))
+
+                if regfile == REGFILE.SRCA:
+                    self.inject_instruction(ops.TT_OP_SFPSTORE(3, 0, 0, 0), trisc_id)
+                    self.inject_instruction(ops.TT_OP_SFPSTORE(3, 0, 0, 2), trisc_id)
+                    if row % 16 == 15:
+                        self.inject_instruction(ops.TT_OP_SETRWC(3, 0, 0, 0, 0, 0xF), trisc_id)
 
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_EN"),
-            0x0,
-            self.device_id,
-            self.context,
-        )
-        write_words_to_device(
-            self.core_loc,
-            self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_CMD"),
-            0x0,
-            self.device_id,
-            self.context,
-        )
-        return data
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_EN"),
+                0x0,
+                self.device_id,
+                self.context,
+            )
+            write_words_to_device(
+                self.core_loc,
+                self.device.get_tensix_register_address("RISCV_DEBUG_REG_DBG_ARRAY_RD_CMD"),
+                0x0,
+                self.device_id,
+                self.context,
+            )
+            return data
 
     def read_regfile(self, regfile: Union[int, str, REGFILE]) -> List[Union[float, int]]:
         """Dumps SRCA/DSTACC register file from the specified core, and parses the data into a list of values.
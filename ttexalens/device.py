@@ -17,7 +17,7 @@ from abc import abstractmethod
 
 from ttexalens.util import DATA_TYPE
 from ttexalens.debug_risc import get_risc_reset_shift, RiscDebug, RiscLoc
-from ttexalens.tt_exalens_lib import read_word_from_device, write_words_to_device
+from ttexalens.tt_exalens_lib import read_from_cores, read_word_from_device, write_words_to_device
 
 
 class TensixInstructions:
@@ -276,6 +276,15 @@ class Device(TTObject):
         """
         return self._block_locations[block_type]
 
+    def get_l1_size(self, block_type="functional_workers") -> int:
+        """
+        Returns size of L1 memory in bytes of blocks of a given type (functional_workers or eth)
+        """
+        key = {"functional_workers": "worker_l1_size", "eth": "eth_l1_size"}.get(block_type)
+        if key is None or key not in self.yaml_file.root:
+            raise util.TTException(f"L1 size of block type {block_type} is not available")
+        return int(self.yaml_file.root[key])
+
     def get_arc_block_location(self) -> OnChipCoordinate:
         """
         Returns OnChipCoordinate of the ARC block
@@ -500,17 +509,32 @@ class Device(TTObject):
         Returns the riscv soft reset status as a string of 4 characters one for each riscv core.
         '-' means the core is in reset, 'R' means the core is running.
         """
-        status_str = ""
-        bt = self.get_block_type(loc)
-        if bt == "functional_workers":
-            for risc_id in range(4):
-                risc_location = RiscLoc(loc, 0, risc_id)
-                risc_debug = RiscDebug(risc_location, self._context)
-                status_str += "-" if risc_debug.is_in_reset() else "R"
-            return status_str
-        if bt == "harvested_workers":
-            return "----"
-        return bt
+        return self.get_riscv_run_statuses([loc])[loc]
+
+    def get_riscv_run_statuses(self, locs: List[OnChipCoordinate]) -> dict:
+        """
+        Returns dictionary that maps every location to its riscv run status (see get_riscv_run_status).
+        Soft reset registers of all functional workers are read with a single request.
+        """
+        statuses = {}
+        worker_locs = []
+        for loc in locs:
+            bt = self.get_block_type(loc)
+            if bt == "functional_workers":
+                worker_locs.append(loc)
+            elif bt == "harvested_workers":
+                statuses[loc] = "----"
+            else:
+                statuses[loc] = bt
+
+        soft_reset_address = self.get_tensix_register_address("RISCV_DEBUG_REG_SOFT_RESET_0")
+        reset_regs = read_from_cores(worker_locs, soft_reset_address, self.id(), 4, self._context)
+        for loc, reset_reg in zip(worker_locs, reset_regs):
+            reset_reg = int.from_bytes(reset_reg, byteorder="little")
+            statuses[loc] = "".join(
+                "-" if (reset_reg >> get_risc_reset_shift(risc_id)) & 1 else "R" for risc_id in range(4)
+            )
+        return statuses
 
     REGISTER_ADDRESSES = {}
 
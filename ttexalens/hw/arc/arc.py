@@ -7,7 +7,7 @@ from ttexalens.util import TTException
 import re
 import os
 
-from ttexalens.tt_exalens_lib_utils import check_context, arc_read, arc_write
+from ttexalens.tt_exalens_lib_utils import check_context, arc_poll, arc_read, arc_write
 from time import sleep
 
 
@@ -33,11 +33,9 @@ def run_arc_core(mask: int, device_id: int = 0, context: Context = None):
     new_value = (current & ~0xF) | (mask & 0xF)
     arc_write(context, device_id, arc_core_loc, reg_addr, new_value)
 
-    # Wait for acknowledgment
-    core_run_ack = 0
-    while core_run_ack & mask != mask:
-        status = arc_read(context, device_id, arc_core_loc, device.get_arc_register_addr("ARC_RESET_ARC_MISC_STATUS"))
-        core_run_ack = status & 0xF  # Read bits 0-3
+    # Wait for acknowledgment in bits 0-3
+    status_addr = device.get_arc_register_addr("ARC_RESET_ARC_MISC_STATUS")
+    arc_poll(context, device_id, arc_core_loc, status_addr, mask & 0xF, mask & 0xF)
 
     # Clear control bits
     current = arc_read(context, device_id, arc_core_loc, reg_addr)
@@ -65,11 +63,9 @@ def halt_arc_core(mask: int, device_id: int = 0, context: Context = None):
     new_value = (current & ~0xF0) | ((mask & 0xF) << 4)
     arc_write(context, device_id, arc_core_loc, reg_addr, new_value)
 
-    # Wait for acknowledgment
-    core_halt_ack = 0
-    while core_halt_ack != mask:
-        status = arc_read(context, device_id, arc_core_loc, device.get_arc_register_addr("ARC_RESET_ARC_MISC_STATUS"))
-        core_halt_ack = (status >> 4) & 0xF  # Read bits 4-7
+    # Wait for acknowledgment in bits 4-7
+    status_addr = device.get_arc_register_addr("ARC_RESET_ARC_MISC_STATUS")
+    arc_poll(context, device_id, arc_core_loc, status_addr, 0xF0, (mask & 0xF) << 4)
 
     # Clear halt bits
     current = arc_read(context, device_id, arc_core_loc, reg_addr)
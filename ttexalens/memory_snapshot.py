@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Binary file with memory of many cores, written by tt_exalens_lib.save_l1_snapshot and read by MemorySnapshot.
+
+File layout (all integers are little endian):
+  header: magic b"TTLXSNAP", format version (uint32), number of index entries (uint32)
+  index:  one entry per core: device_id (uint32), noc0 x (uint8), noc0 y (uint8), block type (uint8), padding (uint8),
+          address (uint64), size (uint64), file offset of data (uint64)
+  data:   memory of every core, starting at page aligned offset, so that it can be memory mapped as uint32 array
+"""
+import mmap
+import struct
+
+from dataclasses import dataclass
+from typing import BinaryIO, List, Tuple, Union
+
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.util import TTException
+
+SNAPSHOT_MAGIC = b"TTLXSNAP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ALIGNMENT = 4096
+
+# Block types that can be stored in snapshot, index in this list is stored in the file
+SNAPSHOT_BLOCK_TYPES = ["functional_workers", "eth"]
+
+_HEADER = struct.Struct("<8sII")
+_INDEX_ENTRY = struct.Struct("<IBBBxQQQ")
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """
+    Index entry of one core: where its memory was read from and where it is stored in the file.
+    """
+
+    device_id: int
+    core: Tuple[int, int]  # noc0 coordinates
+    block_type: str
+    address: int
+    size: int
+    offset: int  # Offset of data in the file
+
+
+def _align(value: int) -> int:
+    return (value + SNAPSHOT_ALIGNMENT - 1) // SNAPSHOT_ALIGNMENT * SNAPSHOT_ALIGNMENT
+
+
+def write_snapshot_index(
+    file: BinaryIO, regions: List[Tuple[int, Tuple[int, int], str, int, int]]
+) -> List[SnapshotEntry]:
+    """
+    Writes header and index for regions, given as (device_id, noc0 core, block_type, address, size) tuples, and
+    reserves space for their data. Returns index entries; data of every entry should be written at its offset.
+    """
+    offset = _align(_HEADER.size + _INDEX_ENTRY.size * len(regions))
+    entries = []
+    for device_id, core, block_type, address, size in regions:
+        entries.append(SnapshotEntry(device_id, tuple(core), block_type, address, size, offset))
+        offset = _align(offset + size)
+
+    file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(entries)))
+    for entry in entries:
+        file.write(
+            _INDEX_ENTRY.pack(
+                entry.device_id,
+                entry.core[0],
+                entry.core[1],
+                SNAPSHOT_BLOCK_TYPES.index(entry.block_type),
+                entry.address,
+                entry.size,
+                entry.offset,
+            )
+        )
+    file.truncate(offset)
+    return entries
+
+
+class MemorySnapshot:
+    """
+    Memory snapshot file opened for reading. File is memory mapped, so data of a core is read from disk only when it
+    is accessed. Arrays and views returned by this class are valid only while snapshot is open.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+        self._file = open(file_name, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.entries = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+        self._index = {(entry.device_id, entry.core): entry for entry in self.entries}
+
+    def _read_index(self) -> List[SnapshotEntry]:
+        if len(self._mmap) < _HEADER.size:
+            raise TTException(f"{self.file_name} is not a memory snapshot.")
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise TTException(f"{self.file_name} is not a memory snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise TTException(f"Unsupported memory snapshot version {version} in {self.file_name}.")
+
+        entries = []
+        for i in range(count):
+            device_id, x, y, block_type, address, size, offset = _INDEX_ENTRY.unpack_from(
+                self._mmap, _HEADER.size + i * _INDEX_ENTRY.size
+            )
+            if offset + size > len(self._mmap):
+                raise TTException(f"Memory snapshot {self.file_name} is truncated.")
+            entries.append(SnapshotEntry(device_id, (x, y), SNAPSHOT_BLOCK_TYPES[block_type], address, size, offset))
+        return entries
+
+    def get_entry(self, device_id: int, core: Union[Tuple[int, int], OnChipCoordinate]) -> SnapshotEntry:
+        """
+        Returns index entry of a core, given as noc0 (x, y) tuple or OnChipCoordinate.
+        """
+        if isinstance(core, OnChipCoordinate):
+            core = core.to("noc0")
+        entry = self._index.get((device_id, tuple(core)))
+        if entry is None:
+            raise TTException(f"Core {core} of device {device_id} is not in memory snapshot {self.file_name}.")
+        return entry
+
+    def read(self, device_id: int, core: Union[Tuple[int, int], OnChipCoordinate]) -> memoryview:
+        """
+        Returns read-only view of memory of a core, given as noc0 (x, y) tuple or OnChipCoordinate.
+        """
+        entry = self.get_entry(device_id, core)
+        return memoryview(self._mmap)[entry.offset : entry.offset + entry.size]
+
+    def as_numpy(
+        self, device_id: int, core: Union[Tuple[int, int], OnChipCoordinate], dtype="uint32"
+    ) -> "numpy.ndarray":
+        """
+        Returns read-only NumPy array over memory of a core, given as noc0 (x, y) tuple or OnChipCoordinate.
+        Data is not copied.
+        """
+        import numpy
+
+        entry = self.get_entry(device_id, core)
+        dtype = numpy.dtype(dtype).newbyteorder("<")
+        return numpy.frombuffer(self._mmap, dtype=dtype, count=entry.size // dtype.itemsize, offset=entry.offset)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MemorySnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class CoreDiff:
+    """
+    Differences in memory of one core between two snapshots. Ranges are (start, end) addresses of consecutive changed
+    words, end is exclusive.
+    """
+
+    device_id: int
+    core: Tuple[int, int]  # noc0 coordinates
+    ranges: List[Tuple[int, int]]
+    changed_words: int
+    total_words: int
+
+
+def diff_memory(old, new, address: int = 0) -> List[Tuple[int, int]]:
+    """
+    Compares two memory images of the same size (bytes, memoryview or NumPy array) that start at address and returns
+    (start, end) address ranges of changed words. Images are compared as uint32 words when their size allows it.
+    """
+    import numpy
+
+    old = numpy.frombuffer(old, dtype=numpy.uint8)
+    new = numpy.frombuffer(new, dtype=numpy.uint8)
+    if old.nbytes != new.nbytes:
+        raise TTException(f"Cannot compare memory images of different sizes ({old.nbytes} and {new.nbytes} bytes).")
+    word_size = 4 if old.nbytes % 4 == 0 else 1
+    if word_size == 4:
+        old = old.view("<u4")
+        new = new.view("<u4")
+
+    changed = numpy.flatnonzero(old ^ new)
+    if len(changed) == 0:
+        return []
+
+    # Split changed word indices into runs of consecutive words
+    breaks = numpy.flatnonzero(numpy.diff(changed) != 1)
+    starts = changed[numpy.concatenate(([0], breaks + 1))]
+    ends = changed[numpy.concatenate((breaks, [len(changed) - 1]))] + 1
+    return [(address + int(start) * word_size, address + int(end) * word_size) for start, end in zip(starts, ends)]
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """
+    Result of comparing two snapshots: differences of changed cores and summary of the comparison.
+    """
+
+    cores: List[CoreDiff]  # Only cores whose memory changed
+    compared_cores: int
+    compared_bytes: int
+    missing_cores: List[Tuple[int, Tuple[int, int]]]  # (device_id, noc0 core) present in only one snapshot
+
+    @property
+    def changed_words(self) -> int:
+        return sum(core.changed_words for core in self.cores)
+
+
+def diff_snapshots(old: MemorySnapshot, new: MemorySnapshot) -> SnapshotDiff:
+    """
+    Compares memory of every core that is in both snapshots. Cores must have been captured from the same address
+    range in both snapshots.
+    """
+    diffs = []
+    compared_bytes = 0
+    for old_entry in old.entries:
+        key = (old_entry.device_id, old_entry.core)
+        new_entry = new._index.get(key)
+        if new_entry is None:
+            continue
+        if (old_entry.address, old_entry.size) != (new_entry.address, new_entry.size):
+            raise TTException(
+                f"Core {old_entry.core} of device {old_entry.device_id} was captured from different memory ranges."
+            )
+
+        compared_bytes += old_entry.size
+        ranges = diff_memory(old.read(*key), new.read(*key), old_entry.address)
+        if ranges:
+            word_size = 4 if old_entry.size % 4 == 0 else 1
+            changed_words = sum(end - start for start, end in ranges) // word_size
+            diffs.append(
+                CoreDiff(old_entry.device_id, old_entry.core, ranges, changed_words, old_entry.size // word_size)
+            )
+
+    missing_cores = sorted(set(old._index) ^ set(new._index))
+    compared_cores = len(set(old._index) & set(new._index))
+    return SnapshotDiff(diffs, compared_cores, compared_bytes, missing_cores)
@@ -17,11 +17,25 @@ void set_ttexalens_implementation(std::unique_ptr<tt::exalens::ttexalens_impleme
 
 std::optional<uint32_t> pci_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address);
 std::optional<uint32_t> pci_write32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address, uint32_t data);
+std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
+                                                         uint64_t address, uint32_t mask, uint32_t expected,
+                                                         uint32_t timeout_ms, uint32_t interval_us);
+std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32_raw(uint8_t chip_id, uint64_t address, uint32_t mask,
+                                                             uint32_t expected, uint32_t timeout_ms,
+                                                             uint32_t interval_us);
+std::optional<pybind11::bytes> pci_sample32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                            uint32_t duration_ms, uint32_t interval_us, uint32_t max_values);
 
 std::optional<pybind11::object> pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                          uint32_t size);
+std::optional<uint32_t> pci_read_into(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                      pybind11::buffer buffer);
+std::optional<pybind11::list> pci_read_gather(uint8_t chip_id, const std::vector<std::tuple<uint8_t, uint8_t>>& cores,
+                                              uint64_t address, uint32_t size);
 std::optional<uint32_t> pci_write(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                   pybind11::buffer data, uint32_t size);
+std::optional<uint32_t> pci_write_scatter(uint8_t chip_id, const std::vector<std::tuple<uint8_t, uint8_t>>& cores,
+                                          uint64_t address, pybind11::buffer data, uint32_t size);
 
 std::optional<uint32_t> pci_read32_raw(uint8_t chip_id, uint64_t address);
 std::optional<uint32_t> pci_write32_raw(uint8_t chip_id, uint64_t address, uint32_t data);
@@ -42,3 +56,5 @@ std::optional<uint32_t> jtag_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_
 std::optional<uint32_t> jtag_write32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address, uint32_t data);
 std::optional<uint32_t> jtag_read32_axi(uint8_t chip_id, uint32_t address);
 std::optional<uint32_t> jtag_write32_axi(uint8_t chip_id, uint64_t address, uint32_t data);
+
+std::optional<pybind11::list> submit_batch(const pybind11::list& operations);
@@ -9,9 +9,17 @@
 #include <ttexalensserver/umd_implementation.h>
 
 #include <fstream>
+#include <mutex>
 #include <optional>
 
-static std::unique_ptr<tt::exalens::ttexalens_implementation> ttexalens_implementation;
+// Device calls release GIL while they are waiting for the device, so that Python threads can access devices in
+// parallel. Python objects must not be touched while GIL is released. Every call copies the pointer while GIL is held,
+// so implementation that is replaced by open_device is destroyed only after calls that still use it return.
+static std::shared_ptr<tt::exalens::ttexalens_implementation> ttexalens_implementation;
+
+// All chips share one JTAG adapter, so JTAG calls are serialized. Mutex is locked after GIL is released, so that a
+// thread waiting for the adapter doesn't block other Python threads.
+static std::mutex jtag_mutex;
 
 class scoped_null_stdout {
    private:
@@ -35,7 +43,8 @@ void set_ttexalens_implementation(std::unique_ptr<tt::exalens::ttexalens_impleme
 bool open_device(const std::string &binary_directory, const std::vector<uint8_t> &wanted_devices, bool init_jtag,
                  bool use_noc1) {
     try {
-        // Since tt::umd::Cluster is printing some output and we don't want to see it in python, we disable std::cout
+        // Since tt::umd::Cluster is printing some output and we don't want to see it in python, we disable std::cout.
+        // GIL is held while global pointer is replaced, so that other threads copy either old or new implementation.
         scoped_null_stdout null_stdout;
 
         if (init_jtag) {
@@ -56,42 +65,128 @@ bool open_device(const std::string &binary_directory, const std::vector<uint8_t>
 }
 
 std::optional<uint32_t> pci_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->pci_read32(chip_id, noc_x, noc_y, address);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_read32(chip_id, noc_x, noc_y, address);
     }
     return {};
 }
 
 std::optional<uint32_t> pci_write32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address, uint32_t data) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->pci_write32(chip_id, noc_x, noc_y, address, data);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_write32(chip_id, noc_x, noc_y, address, data);
+    }
+    return {};
+}
+
+std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
+                                                         uint64_t address, uint32_t mask, uint32_t expected,
+                                                         uint32_t timeout_ms, uint32_t interval_us) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_poll32(chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us);
+    }
+    return {};
+}
+
+std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32_raw(uint8_t chip_id, uint64_t address, uint32_t mask,
+                                                             uint32_t expected, uint32_t timeout_ms,
+                                                             uint32_t interval_us) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_poll32_raw(chip_id, address, mask, expected, timeout_ms, interval_us);
+    }
+    return {};
+}
+
+std::optional<pybind11::bytes> pci_sample32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                            uint32_t duration_ms, uint32_t interval_us, uint32_t max_values) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        std::optional<std::vector<uint8_t>> data;
+        {
+            pybind11::gil_scoped_release release;
+            data = implementation->pci_sample32(chip_id, noc_x, noc_y, address, duration_ms, interval_us, max_values);
+        }
+        if (data) {
+            return pybind11::bytes(reinterpret_cast<const char *>(data->data()), data->size());
+        }
     }
     return {};
 }
 
 std::optional<pybind11::object> pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                          uint32_t size) {
-    if (ttexalens_implementation) {
-        auto data = ttexalens_implementation->pci_read(chip_id, noc_x, noc_y, address, size);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        // Device data is read directly into newly created bytes object to avoid copying.
+        auto bytes = pybind11::reinterpret_steal<pybind11::object>(PyBytes_FromStringAndSize(nullptr, size));
+        if (!bytes) {
+            throw pybind11::error_already_set();
+        }
+        uint8_t *data_ptr = reinterpret_cast<uint8_t *>(PyBytes_AS_STRING(bytes.ptr()));
+        std::optional<uint32_t> bytes_read;
+        {
+            pybind11::gil_scoped_release release;
+            bytes_read = implementation->pci_read_into(chip_id, noc_x, noc_y, address, data_ptr, size);
+        }
+        if (bytes_read) {
+            return bytes;
+        }
+    }
+    return {};
+}
 
-        if (data) {
-            // This is a hacky way to create a bytes object for Python so that we avoid multiple
-            // copying. Pyobject is created manually and then passed to pybind11::reinterpret_steal
-            // to prevent memory leak.
-            // See https://github.com/pybind/pybind11/issues/1236
-            PyBytesObject *bytesObject = nullptr;
+static bool is_c_contiguous(const pybind11::buffer_info &info) {
+    pybind11::ssize_t expected_stride = info.itemsize;
 
-            bytesObject = (PyBytesObject *)PyObject_Malloc(offsetof(PyBytesObject, ob_sval) + size + 1);
+    for (pybind11::ssize_t i = info.ndim - 1; i >= 0; i--) {
+        if (info.shape[i] != 1 && info.strides[i] != expected_stride) {
+            return false;
+        }
+        expected_stride *= info.shape[i];
+    }
+    return true;
+}
 
-            PyObject_INIT_VAR(bytesObject, &PyBytes_Type, size);
-            bytesObject->ob_shash = -1;
-            bytesObject->ob_sval[size] = '\0';
+std::optional<uint32_t> pci_read_into(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                      pybind11::buffer buffer) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::buffer_info info = buffer.request(true);
+        if (!is_c_contiguous(info)) {
+            throw pybind11::value_error("Buffer must be C-contiguous");
+        }
+        uint8_t *data_ptr = static_cast<uint8_t *>(info.ptr);
+        uint32_t size = static_cast<uint32_t>(info.size * info.itemsize);
 
-            for (size_t i = 0; i < size; i++) {
-                bytesObject->ob_sval[i] = data.value()[i];
-            }
+        // Buffer info keeps Python buffer alive, so it is safe to use data while GIL is released
+        pybind11::gil_scoped_release release;
+        return implementation->pci_read_into(chip_id, noc_x, noc_y, address, data_ptr, size);
+    }
+    return {};
+}
 
-            return pybind11::reinterpret_steal<pybind11::object>((PyObject *)bytesObject);
+std::optional<pybind11::list> pci_read_gather(uint8_t chip_id, const std::vector<std::tuple<uint8_t, uint8_t>> &cores,
+                                              uint64_t address, uint32_t size) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        std::optional<std::vector<uint8_t>> data;
+        {
+            pybind11::gil_scoped_release release;
+            data = implementation->pci_read_gather(chip_id, cores, address, size);
+        }
+        if (data && data->size() == static_cast<size_t>(size) * cores.size()) {
+            pybind11::list results;
+            for (size_t i = 0; i < cores.size(); i++) {
+                results.append(pybind11::bytes(reinterpret_cast<const char *>(data->data() + i * size), size));
+            }
+            return results;
         }
     }
     return {};
@@ -99,75 +194,114 @@ std::optional<pybind11::object> pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t
 
 std::optional<uint32_t> pci_write(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                   pybind11::buffer data, uint32_t size) {
-    if (ttexalens_implementation) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::buffer_info info = data.request();
+        uint8_t *data_ptr = static_cast<uint8_t *>(info.ptr);
+
+        // Buffer info keeps Python buffer alive, so it is safe to use data while GIL is released
+        pybind11::gil_scoped_release release;
+        return implementation->pci_write(chip_id, noc_x, noc_y, address, data_ptr, size);
+    }
+    return {};
+}
+
+std::optional<uint32_t> pci_write_scatter(uint8_t chip_id, const std::vector<std::tuple<uint8_t, uint8_t>> &cores,
+                                          uint64_t address, pybind11::buffer data, uint32_t size) {
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
         pybind11::buffer_info info = data.request();
         uint8_t *data_ptr = static_cast<uint8_t *>(info.ptr);
 
-        return ttexalens_implementation->pci_write(chip_id, noc_x, noc_y, address, data_ptr, size);
+        // Buffer info keeps Python buffer alive, so it is safe to use data while GIL is released
+        pybind11::gil_scoped_release release;
+        return implementation->pci_write_scatter(chip_id, cores, address, data_ptr, size);
     }
     return {};
 }
 
 std::optional<uint32_t> pci_read32_raw(uint8_t chip_id, uint64_t address) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->pci_read32_raw(chip_id, address);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_read32_raw(chip_id, address);
     }
     return {};
 }
 
 std::optional<uint32_t> pci_write32_raw(uint8_t chip_id, uint64_t address, uint32_t data) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->pci_write32_raw(chip_id, address, data);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_write32_raw(chip_id, address, data);
     }
     return {};
 }
 
 std::optional<uint32_t> dma_buffer_read32(uint8_t chip_id, uint64_t address, uint32_t channel) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->dma_buffer_read32(chip_id, address, channel);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->dma_buffer_read32(chip_id, address, channel);
     }
     return {};
 }
 
 std::optional<std::string> pci_read_tile(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address, uint32_t size,
                                          uint8_t data_format) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->pci_read_tile(chip_id, noc_x, noc_y, address, size, data_format);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->pci_read_tile(chip_id, noc_x, noc_y, address, size, data_format);
     }
     return {};
 }
 
 std::optional<uint32_t> jtag_read32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->jtag_read32(chip_id, noc_x, noc_y, address);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        std::lock_guard<std::mutex> lock(jtag_mutex);
+        return implementation->jtag_read32(chip_id, noc_x, noc_y, address);
     }
     return {};
 }
 
 std::optional<uint32_t> jtag_write32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address, uint32_t data) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->jtag_write32(chip_id, noc_x, noc_y, address, data);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        std::lock_guard<std::mutex> lock(jtag_mutex);
+        return implementation->jtag_write32(chip_id, noc_x, noc_y, address, data);
     }
     return {};
 }
 
 std::optional<uint32_t> jtag_read32_axi(uint8_t chip_id, uint32_t address) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->jtag_read32_axi(chip_id, address);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        std::lock_guard<std::mutex> lock(jtag_mutex);
+        return implementation->jtag_read32_axi(chip_id, address);
     }
     return {};
 }
 
 std::optional<uint32_t> jtag_write32_axi(uint8_t chip_id, uint64_t address, uint32_t data) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->jtag_write32_axi(chip_id, address, data);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        std::lock_guard<std::mutex> lock(jtag_mutex);
+        return implementation->jtag_write32_axi(chip_id, address, data);
     }
     return {};
 }
 
 std::optional<std::string> get_cluster_description() {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->get_cluster_description();
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->get_cluster_description();
     }
     return {};
 }
@@ -175,41 +309,96 @@ std::optional<std::string> get_cluster_description() {
 std::optional<std::tuple<uint8_t, uint8_t>> convert_from_noc0(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
                                                               const std::string &core_type,
                                                               const std::string &coord_system) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->convert_from_noc0(chip_id, noc_x, noc_y, core_type, coord_system);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->convert_from_noc0(chip_id, noc_x, noc_y, core_type, coord_system);
     }
     return {};
 }
 
 std::optional<std::vector<uint8_t>> get_device_ids() {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->get_device_ids();
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->get_device_ids();
     }
     return {};
 }
 
 std::optional<std::string> get_device_arch(uint8_t chip_id) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->get_device_arch(chip_id);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->get_device_arch(chip_id);
     }
     return {};
 }
 
 std::optional<std::string> get_device_soc_description(uint8_t chip_id) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->get_device_soc_description(chip_id);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->get_device_soc_description(chip_id);
     }
     return {};
 }
 
 std::optional<std::tuple<int, uint32_t, uint32_t>> arc_msg(uint8_t chip_id, uint32_t msg_code, bool wait_for_done,
                                                            uint32_t arg0, uint32_t arg1, int timeout) {
-    if (ttexalens_implementation) {
-        return ttexalens_implementation->arc_msg(chip_id, msg_code, wait_for_done, arg0, arg1, timeout);
+    auto implementation = ttexalens_implementation;
+    if (implementation) {
+        pybind11::gil_scoped_release release;
+        return implementation->arc_msg(chip_id, msg_code, wait_for_done, arg0, arg1, timeout);
     }
     return {};
 }
 
+// Failed operation doesn't fail the whole batch, its result is None
+template <typename T>
+static void append_batch_result(pybind11::list &results, const std::optional<T> &result) {
+    if (result) {
+        results.append(result.value());
+    } else {
+        results.append(pybind11::none());
+    }
+}
+
+std::optional<pybind11::list> submit_batch(const pybind11::list &operations) {
+    if (!ttexalens_implementation) {
+        return {};
+    }
+
+    pybind11::list results;
+    for (const auto &item : operations) {
+        auto operation = item.cast<pybind11::tuple>();
+        auto name = operation[0].cast<std::string>();
+        auto chip_id = operation[1].cast<uint8_t>();
+        auto noc_x = operation[2].cast<uint8_t>();
+        auto noc_y = operation[3].cast<uint8_t>();
+        auto address = operation[4].cast<uint64_t>();
+
+        if (name == "pci_read32") {
+            auto result = pci_read32(chip_id, noc_x, noc_y, address);
+            append_batch_result(results, result);
+        } else if (name == "pci_write32") {
+            auto result = pci_write32(chip_id, noc_x, noc_y, address, operation[5].cast<uint32_t>());
+            append_batch_result(results, result);
+        } else if (name == "pci_read") {
+            auto result = pci_read(chip_id, noc_x, noc_y, address, operation[5].cast<uint32_t>());
+            append_batch_result(results, result);
+        } else if (name == "pci_write") {
+            auto data = operation[5].cast<pybind11::buffer>();
+            auto size = static_cast<uint32_t>(pybind11::len(operation[5]));
+            auto result = pci_write(chip_id, noc_x, noc_y, address, data, size);
+            append_batch_result(results, result);
+        } else {
+            throw pybind11::value_error("Operation " + name + " is not supported in batch");
+        }
+    }
+    return results;
+}
+
 PYBIND11_MODULE(ttexalens_pybind, m) {
     m.def("open_device", &open_device, "Opens tt device. Prints error message if failed.",
           pybind11::arg("binary_directory"), pybind11::arg_v("wanted_devices", std::vector<uint8_t>(), "[]"),
@@ -218,10 +407,27 @@ PYBIND11_MODULE(ttexalens_pybind, m) {
           pybind11::arg("noc_y"), pybind11::arg("address"));
     m.def("pci_write32", &pci_write32, "Writes 4 bytes to PCI address", pybind11::arg("chip_id"),
           pybind11::arg("noc_x"), pybind11::arg("noc_y"), pybind11::arg("address"), pybind11::arg("data"));
+    m.def("pci_poll32", &pci_poll32, "Reads 4 bytes from PCI address until (value & mask) == expected or timeout",
+          pybind11::arg("chip_id"), pybind11::arg("noc_x"), pybind11::arg("noc_y"), pybind11::arg("address"),
+          pybind11::arg("mask"), pybind11::arg("expected"), pybind11::arg("timeout_ms"), pybind11::arg("interval_us"));
+    m.def("pci_poll32_raw", &pci_poll32_raw,
+          "Reads 4 bytes from raw PCI address until (value & mask) == expected or timeout", pybind11::arg("chip_id"),
+          pybind11::arg("address"), pybind11::arg("mask"), pybind11::arg("expected"), pybind11::arg("timeout_ms"),
+          pybind11::arg("interval_us"));
+    m.def("pci_sample32", &pci_sample32, "Reads 4 bytes from PCI address for duration_ms and counts read values",
+          pybind11::arg("chip_id"), pybind11::arg("noc_x"), pybind11::arg("noc_y"), pybind11::arg("address"),
+          pybind11::arg("duration_ms"), pybind11::arg("interval_us"), pybind11::arg("max_values"));
     m.def("pci_read", &pci_read, "Reads data from PCI address", pybind11::arg("chip_id"), pybind11::arg("noc_x"),
           pybind11::arg("noc_y"), pybind11::arg("address"), pybind11::arg("size"));
+    m.def("pci_read_into", &pci_read_into, "Reads data from PCI address into writable buffer", pybind11::arg("chip_id"),
+          pybind11::arg("noc_x"), pybind11::arg("noc_y"), pybind11::arg("address"), pybind11::arg("buffer"));
+    m.def("pci_read_gather", &pci_read_gather, "Reads data from the same PCI address on multiple cores",
+          pybind11::arg("chip_id"), pybind11::arg("cores"), pybind11::arg("address"), pybind11::arg("size"));
     m.def("pci_write", &pci_write, "Writes data to PCI address", pybind11::arg("chip_id"), pybind11::arg("noc_x"),
           pybind11::arg("noc_y"), pybind11::arg("address"), pybind11::arg("data"), pybind11::arg("size"));
+    m.def("pci_write_scatter", &pci_write_scatter, "Writes the same data to the same PCI address on multiple cores",
+          pybind11::arg("chip_id"), pybind11::arg("cores"), pybind11::arg("address"), pybind11::arg("data"),
+          pybind11::arg("size"));
     m.def("pci_read32_raw", &pci_read32_raw, "Reads 4 bytes from PCI address", pybind11::arg("chip_id"),
           pybind11::arg("address"));
     m.def("pci_write32_raw", &pci_write32_raw, "Writes 4 bytes to PCI address", pybind11::arg("chip_id"),
@@ -247,6 +453,10 @@ PYBIND11_MODULE(ttexalens_pybind, m) {
           pybind11::arg("address"));
     m.def("jtag_write32_axi", &jtag_write32_axi, "Writes 4 bytes to AXI address using JTAG", pybind11::arg("chip_id"),
           pybind11::arg("address"), pybind11::arg("data"));
+    m.def("submit_batch", &submit_batch,
+          "Executes list of pci_read32/pci_write32/pci_read/pci_write operations and returns list of their results. "
+          "Result of an operation that failed is None",
+          pybind11::arg("operations"));
 
     // Bind arc_msg with explicit lambda to ensure type resolution
     m.def("arc_msg", &arc_msg, "Send ARC message", pybind11::arg("chip_id"), pybind11::arg("msg_code"),
@@ -21,6 +21,7 @@ struct server_config {
     std::vector<uint8_t> wanted_devices;
     bool init_jtag;
     bool use_noc1;
+    bool single_threaded;
 };
 
 // Make sure that the directory exists
@@ -66,7 +67,7 @@ int run_ttexalens_server(const server_config& config) {
         std::unique_ptr<tt::exalens::server> server;
         try {
             server = std::make_unique<tt::exalens::server>(std::move(implementation));
-            server->start(config.port);
+            server->start(config.port, !config.single_threaded);
             log_info(tt::LogTTExaLens, "Debug server started on {}.", connection_address);
         } catch (...) {
             log_custom(tt::Logger::Level::Error, tt::LogTTExaLens,
@@ -106,6 +107,7 @@ server_config parse_args(int argc, char** argv) {
     config.port = atoi(argv[1]);
     config.init_jtag = false;
     config.use_noc1 = false;
+    config.single_threaded = false;
 
     int i = 2;
     while (i < argc) {
@@ -144,6 +146,9 @@ server_config parse_args(int argc, char** argv) {
         } else if (strcmp(argv[i], "--use-noc1") == 0) {
             config.use_noc1 = true;
             i++;
+        } else if (strcmp(argv[i], "--single-threaded") == 0) {
+            config.single_threaded = true;
+            i++;
         } else {
             log_error("Unknown argument: {}", argv[i]);
             return {};
@@ -157,7 +162,7 @@ int main(int argc, char** argv) {
     if (argc < 2) {
         log_error(
             "Need arguments: <port> [-s <simulation_directory>] [-d <device_id1> [<device_id2> ... "
-            "<device_idN>]] [--jtag] [--background] [--use-noc1]");
+            "<device_idN>]] [--jtag] [--background] [--use-noc1] [--single-threaded]");
         return 1;
     }
 
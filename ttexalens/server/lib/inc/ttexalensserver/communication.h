@@ -3,18 +3,38 @@
 // SPDX-License-Identifier: Apache-2.0
 #pragma once
 
+#include <atomic>
+#include <condition_variable>
+#include <map>
 #include <memory>
+#include <mutex>
+#include <optional>
+#include <queue>
+#include <set>
 #include <string>
 #include <thread>
+#include <vector>
 #include <zmq.hpp>
 
 #include "requests.h"
+#include "statistics.h"
 
 namespace tt::exalens {
 
 // Communication class that implements 0MQ server and parses messages into tt::exalens::request.
+// Server uses ROUTER socket, so it accepts both REQ clients and DEALER clients that pipeline multiple requests.
 // Needs to have implemented function void process(const request&) for processing requests.
 // Current production implementation of it is tt::exalens::server.
+//
+// When started with worker threads, requests are dispatched to per-chip worker queues, so requests to different chips
+// (and from different clients) are processed concurrently. Requests to the same chip are processed in order they were
+// received. Requests that don't target a single chip (or go through shared JTAG adapter) are processed by a general
+// worker while no other request is being processed. Such request is a barrier: it starts only after all requests
+// received before it are done, and requests received after it start only after it is done.
+//
+// Clients can request compression of responses by sending compression_frame with every request; set_compression
+// request lets them check that server supports it. Statistics of processed requests are returned by get_statistics
+// request. Both are handled by communication itself and never reach process function.
 class communication {
    public:
     communication();
@@ -23,10 +43,16 @@ class communication {
     int get_port() const { return port; }
 
     // Starts zmq server and throws if start fails
-    void start(int port);
+    void start(int port, bool use_worker_threads = false);
     void stop();
     bool is_connected() const;
 
+    // Checks that message received from client is a request whose size matches its structure.
+    static bool is_valid_request(const void* data, size_t size);
+
+    // Returns chip that request is targeting, or {} if request can touch multiple chips or shared resources.
+    static std::optional<uint8_t> get_chip_id(const request& request);
+
    protected:
     // Override this function to process requests coming from client.
     virtual void process(const request& request) = 0;
@@ -36,17 +62,60 @@ class communication {
     void respond(const void* data, size_t size);
 
    private:
+    // Request received from client together with its routing envelope.
+    struct job {
+        std::vector<zmq::message_t> envelope;
+        zmq::message_t message;
+        uint64_t sequence;  // Order in which request was received
+        std::optional<compression_frame> compression;
+    };
+
+    // Worker thread with its queue of requests.
+    struct worker {
+        std::unique_ptr<std::thread> thread;
+        std::mutex mutex;
+        std::condition_variable condition;
+        std::queue<job> jobs;
+    };
+
     int port;
-    bool should_stop;
+    std::atomic<bool> should_stop;
+    bool use_worker_threads;
     zmq::context_t zmq_context;
     zmq::socket_t zmq_socket;
+    std::vector<zmq::message_t> envelope;
+    std::optional<compression_frame> compression;  // Compression requested by the last received request
     std::unique_ptr<std::thread> background_thread;
 
+    // Workers are created on demand by background thread. Key is chip id or -1 for general worker.
+    std::map<int, std::unique_ptr<worker>> workers;
+
+    // Sequences of dispatched requests that are not done yet, used to keep order of exclusive requests
+    uint64_t next_sequence;
+    std::mutex order_mutex;
+    std::condition_variable order_condition;
+    std::set<uint64_t> pending_chip_jobs;
+    std::set<uint64_t> pending_exclusive_jobs;
+
+    // Workers send responses over this socket to background thread that forwards them to the clients.
+    zmq::socket_t responses_socket;
+
+    // Counts, sizes and latencies of processed requests.
+    statistics request_statistics;
+
     communication(const communication&) = delete;
 
     friend int communication_loop(tt::exalens::communication* communication);
     friend class yaml_not_implemented_server;
     void request_loop();
+    bool receive(zmq::message_t& message);
+    void dispatch(zmq::message_t&& message);
+    void forward_response();
+    void worker_loop(worker* worker, bool exclusive);
+    bool can_start(uint64_t sequence, bool exclusive) const;
+    void process_and_record(const zmq::message_t& message);
+    void stop_workers();
+    static bool is_valid_batch_request(const batch_request& request);
 };
 
 }  // namespace tt::exalens
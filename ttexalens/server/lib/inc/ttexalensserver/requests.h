@@ -13,6 +13,8 @@ enum class request_type : uint8_t {
     // Basic requests
     invalid = 0,
     ping = 1,
+    set_compression = 2,
+    get_statistics = 3,
 
     // Device requests
     pci_read32 = 10,
@@ -27,6 +29,12 @@ enum class request_type : uint8_t {
     get_device_arch,
     get_device_soc_description,
     arc_msg,
+    batch,
+    pci_read_gather,
+    pci_poll32,
+    pci_write_scatter,
+    pci_sample32,
+    pci_poll32_raw,
 
     // Device requests over jtag
     jtag_read32 = 50,
@@ -52,6 +60,33 @@ struct request {
     request_type type;
 } __attribute__((packed));
 
+// Checks that server can compress responses. Server keeps no per-client compression state: client that wants
+// compressed responses sends compression_frame with every request, between empty delimiter frame and the request.
+// Response to such request is sent as two frames: uint8_t compression_codec followed by payload. Payloads smaller
+// than threshold (or ones that don't shrink) are sent uncompressed. Level 0 disables compression. Server responds "OK"
+// and ignores level and threshold of this request.
+struct set_compression_request : request {
+    uint8_t level;
+    uint32_t threshold;
+} __attribute__((packed));
+
+// Compression settings that client sends in front of every request whose response should be compressed.
+struct compression_frame {
+    uint8_t level;
+    uint32_t threshold;
+} __attribute__((packed));
+
+enum class compression_codec : uint8_t {
+    none = 0,
+    zlib = 1,
+};
+
+// Returns YAML list with statistics of requests processed by the server, grouped by chip and request type. Every entry
+// has request count, bytes received and sent and p50/p99 latency. If reset is set, statistics are cleared afterwards.
+struct get_statistics_request : request {
+    uint8_t reset;
+} __attribute__((packed));
+
 struct pci_read32_request : request {
     uint8_t chip_id;
     uint8_t noc_x;
@@ -167,4 +202,96 @@ struct jtag_write32_axi_request : request {
     uint32_t data;
 } __attribute__((packed));
 
+// Batch request carries list of independent sub-requests that are processed in order and answered with single response.
+// Data contains count sub-requests, each one serialized as uint32_t size followed by request structure.
+// Only pci_read32, pci_write32, pci_read and pci_write sub-requests are allowed.
+// Response contains result of every sub-request, serialized as uint8_t status (batch_status), uint32_t size and data.
+struct batch_request : request {
+    uint32_t count;
+    uint32_t size;
+    uint8_t data[0];
+} __attribute__((packed));
+
+enum class batch_status : uint8_t {
+    ok = 0,
+    not_supported = 1,
+};
+
+// Reads the same address from multiple cores of one chip.
+// Data contains core_count NOC coordinates, each one serialized as uint8_t noc_x followed by uint8_t noc_y.
+// Response contains size bytes read from every core, concatenated in the order of coordinates.
+struct pci_read_gather_request : request {
+    uint8_t chip_id;
+    uint64_t address;
+    uint32_t size;
+    uint32_t core_count;
+    uint8_t data[0];
+} __attribute__((packed));
+
+// Reads 32-bit value until (value & mask) == expected or until timeout_ms expires, waiting interval_us between reads.
+// Response contains uint32_t last read value followed by uint32_t number of reads.
+struct pci_poll32_request : request {
+    uint8_t chip_id;
+    uint8_t noc_x;
+    uint8_t noc_y;
+    uint64_t address;
+    uint32_t mask;
+    uint32_t expected;
+    uint32_t timeout_ms;
+    uint32_t interval_us;
+} __attribute__((packed));
+
+// Same as pci_poll32_request, but reads raw PCI (BAR) address on MMIO capable chip instead of NOC address.
+struct pci_poll32_raw_request : request {
+    uint8_t chip_id;
+    uint32_t address;
+    uint32_t mask;
+    uint32_t expected;
+    uint32_t timeout_ms;
+    uint32_t interval_us;
+} __attribute__((packed));
+
+// Writes the same data to the same address on multiple cores of one chip.
+// Data contains core_count NOC coordinates, each one serialized as uint8_t noc_x followed by uint8_t noc_y, followed by
+// size bytes that are written to every core. Response is uint32_t number of bytes written to each core.
+struct pci_write_scatter_request : request {
+    uint8_t chip_id;
+    uint64_t address;
+    uint32_t size;
+    uint32_t core_count;
+    uint8_t data[0];
+} __attribute__((packed));
+
+// Reads 32-bit value for duration_ms, starting a new read every interval_us (as fast as possible when 0), and counts
+// how many times every value was read. At most max_values different values are tracked, reads of other values are
+// counted as dropped. Response is pci_sample32_response followed by value_count pci_sample32_value entries sorted by
+// value. Timestamps are in microseconds since the first read.
+struct pci_sample32_request : request {
+    uint8_t chip_id;
+    uint8_t noc_x;
+    uint8_t noc_y;
+    uint64_t address;
+    uint32_t duration_ms;
+    uint32_t interval_us;
+    uint32_t max_values;
+} __attribute__((packed));
+
+// Server samples for at most this long in a single pci_sample32 request, so that one request doesn't block other
+// requests to the chip for long. Clients split longer sampling into multiple requests.
+constexpr uint32_t pci_sample32_max_duration_ms = 1000;
+
+struct pci_sample32_response {
+    uint64_t samples;
+    uint64_t elapsed_us;
+    uint64_t dropped;
+    uint32_t value_count;
+} __attribute__((packed));
+
+struct pci_sample32_value {
+    uint32_t value;
+    uint64_t count;
+    uint64_t first_us;
+    uint64_t last_us;
+} __attribute__((packed));
+
 }  // namespace tt::exalens
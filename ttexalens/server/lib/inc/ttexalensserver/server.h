@@ -27,8 +27,13 @@ class server : public communication {
     void respond(std::optional<std::vector<uint8_t>> response);
     void respond(std::optional<std::tuple<uint8_t, uint8_t>> response);
     void respond(std::optional<std::tuple<int, uint32_t, uint32_t>> response);
+    void respond(std::optional<std::tuple<uint32_t, uint32_t>> response);
     void respond_not_supported();
 
+    // Processes all sub-requests of batch request and serializes their results into single response.
+    std::vector<uint8_t> process_batch(const batch_request& request);
+    std::optional<std::vector<uint8_t>> process_batch_operation(const request& request);
+
     virtual std::optional<std::vector<uint8_t>> get_file(const std::string& path);
 
     std::unique_ptr<ttexalens_implementation> implementation;
@@ -0,0 +1,50 @@
+// SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+//
+// SPDX-License-Identifier: Apache-2.0
+#pragma once
+
+#include <array>
+#include <chrono>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <tuple>
+
+#include "requests.h"
+
+namespace tt::exalens {
+
+// Counts requests processed by the server, grouped by chip they target and request type. Latencies are kept in
+// histogram with power of two buckets (in microseconds), so percentiles are reported as upper bound of the bucket.
+// It is safe to record statistics from multiple threads.
+class statistics {
+   public:
+    void record(request_type type, std::optional<uint8_t> chip_id, size_t request_bytes, size_t response_bytes,
+                std::chrono::nanoseconds latency);
+    void reset();
+
+    // Returns YAML list with one entry for every chip and request type that was recorded.
+    std::string to_yaml();
+
+   private:
+    static constexpr size_t latency_buckets = 32;
+
+    struct entry {
+        uint64_t count = 0;
+        uint64_t request_bytes = 0;
+        uint64_t response_bytes = 0;
+        uint64_t total_latency_us = 0;
+        std::array<uint64_t, latency_buckets> latency_histogram{};
+
+        uint64_t latency_percentile_us(double percentile) const;
+    };
+
+    std::mutex mutex;
+
+    // Key is chip id (-1 for requests that don't target single chip) and request type.
+    std::map<std::tuple<int, request_type>, entry> entries;
+};
+
+}  // namespace tt::exalens
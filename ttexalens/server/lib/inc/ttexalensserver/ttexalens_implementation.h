@@ -3,12 +3,18 @@
 // SPDX-License-Identifier: Apache-2.0
 #pragma once
 
+#include <chrono>
 #include <cstdint>
+#include <cstring>
+#include <map>
 #include <optional>
 #include <string>
+#include <thread>
 #include <tuple>
 #include <vector>
 
+#include "requests.h"
+
 namespace tt::exalens {
 
 // Interface that should be implemented for TTExaLens server to process requests.
@@ -31,6 +37,158 @@ class ttexalens_implementation {
                                               const uint8_t* data, uint32_t size) {
         return {};
     }
+
+    // Reads size bytes directly into caller provided buffer and returns number of bytes read.
+    // Default implementation copies result of pci_read, override it to avoid allocation and copying.
+    virtual std::optional<uint32_t> pci_read_into(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                                  uint8_t* data, uint32_t size) {
+        auto result = pci_read(chip_id, noc_x, noc_y, address, size);
+
+        if (!result || result->size() != size) {
+            return {};
+        }
+        memcpy(data, result->data(), size);
+        return size;
+    }
+
+    // Reads size bytes from the same address on every core and returns concatenated results in the order of cores.
+    // Default implementation reads cores one by one, override it if device can read them more efficiently.
+    virtual std::optional<std::vector<uint8_t>> pci_read_gather(uint8_t chip_id,
+                                                                const std::vector<std::tuple<uint8_t, uint8_t>>& cores,
+                                                                uint64_t address, uint32_t size) {
+        std::vector<uint8_t> result(static_cast<size_t>(size) * cores.size());
+
+        for (size_t i = 0; i < cores.size(); i++) {
+            auto [noc_x, noc_y] = cores[i];
+
+            if (!pci_read_into(chip_id, noc_x, noc_y, address, result.data() + i * size, size)) {
+                return {};
+            }
+        }
+        return result;
+    }
+
+    // Writes size bytes of data to the same address on every core and returns number of bytes written to each core.
+    // Default implementation writes cores one by one, override it if device can write them more efficiently.
+    virtual std::optional<uint32_t> pci_write_scatter(uint8_t chip_id,
+                                                      const std::vector<std::tuple<uint8_t, uint8_t>>& cores,
+                                                      uint64_t address, const uint8_t* data, uint32_t size) {
+        for (auto [noc_x, noc_y] : cores) {
+            if (!pci_write(chip_id, noc_x, noc_y, address, data, size)) {
+                return {};
+            }
+        }
+        return size;
+    }
+
+    // Reads 32-bit value until (value & mask) == expected or until timeout_ms expires, waiting interval_us between
+    // reads. Returns last read value and number of reads. Caller detects timeout by checking the condition on returned
+    // value.
+    virtual std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
+                                                                     uint64_t address, uint32_t mask, uint32_t expected,
+                                                                     uint32_t timeout_ms, uint32_t interval_us) {
+        auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+        uint32_t iterations = 0;
+
+        while (true) {
+            auto value = pci_read32(chip_id, noc_x, noc_y, address);
+
+            if (!value) {
+                return {};
+            }
+            iterations++;
+            if ((value.value() & mask) == expected || std::chrono::steady_clock::now() >= deadline) {
+                return std::make_tuple(value.value(), iterations);
+            }
+            if (interval_us > 0) {
+                std::this_thread::sleep_for(std::chrono::microseconds(interval_us));
+            }
+        }
+    }
+
+    // Same as pci_poll32, but reads raw PCI (BAR) address of MMIO capable chip with pci_read32_raw.
+    virtual std::optional<std::tuple<uint32_t, uint32_t>> pci_poll32_raw(uint8_t chip_id, uint64_t address,
+                                                                         uint32_t mask, uint32_t expected,
+                                                                         uint32_t timeout_ms, uint32_t interval_us) {
+        auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+        uint32_t iterations = 0;
+
+        while (true) {
+            auto value = pci_read32_raw(chip_id, address);
+
+            if (!value) {
+                return {};
+            }
+            iterations++;
+            if ((value.value() & mask) == expected || std::chrono::steady_clock::now() >= deadline) {
+                return std::make_tuple(value.value(), iterations);
+            }
+            if (interval_us > 0) {
+                std::this_thread::sleep_for(std::chrono::microseconds(interval_us));
+            }
+        }
+    }
+
+    // Reads 32-bit value for duration_ms and counts how many times every value was read (see pci_sample32_request).
+    // Returns serialized pci_sample32_response followed by pci_sample32_value entries.
+    virtual std::optional<std::vector<uint8_t>> pci_sample32(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
+                                                             uint64_t address, uint32_t duration_ms,
+                                                             uint32_t interval_us, uint32_t max_values) {
+        struct value_statistics {
+            uint64_t count;
+            uint64_t first_us;
+            uint64_t last_us;
+        };
+        std::map<uint32_t, value_statistics> values;
+        uint64_t samples = 0;
+        uint64_t dropped = 0;
+        auto start = std::chrono::steady_clock::now();
+        auto deadline = start + std::chrono::milliseconds(duration_ms);
+        auto next_sample = start;
+        auto now = start;
+
+        do {
+            auto value = pci_read32(chip_id, noc_x, noc_y, address);
+
+            if (!value) {
+                return {};
+            }
+            now = std::chrono::steady_clock::now();
+            uint64_t timestamp_us = std::chrono::duration_cast<std::chrono::microseconds>(now - start).count();
+            samples++;
+
+            auto it = values.find(value.value());
+            if (it != values.end()) {
+                it->second.count++;
+                it->second.last_us = timestamp_us;
+            } else if (values.size() < max_values) {
+                values.emplace(value.value(), value_statistics{1, timestamp_us, timestamp_us});
+            } else {
+                dropped++;
+            }
+
+            // Keep requested rate regardless of how long the read took
+            if (interval_us > 0) {
+                next_sample += std::chrono::microseconds(interval_us);
+                std::this_thread::sleep_until(next_sample);
+                now = std::chrono::steady_clock::now();
+            }
+        } while (now < deadline);
+
+        pci_sample32_response header{
+            samples, static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::microseconds>(now - start).count()),
+            dropped, static_cast<uint32_t>(values.size())};
+        std::vector<uint8_t> result(sizeof(header) + values.size() * sizeof(pci_sample32_value));
+        std::memcpy(result.data(), &header, sizeof(header));
+
+        auto entry = reinterpret_cast<pci_sample32_value*>(result.data() + sizeof(header));
+        for (auto& [value, statistics] : values) {
+            pci_sample32_value sample{value, statistics.count, statistics.first_us, statistics.last_us};
+            std::memcpy(entry++, &sample, sizeof(sample));
+        }
+        return result;
+    }
+
     virtual std::optional<uint32_t> pci_read32_raw(uint8_t chip_id, uint64_t address) { return {}; }
     virtual std::optional<uint32_t> pci_write32_raw(uint8_t chip_id, uint64_t address, uint32_t data) { return {}; }
     virtual std::optional<uint32_t> dma_buffer_read32(uint8_t chip_id, uint64_t address, uint32_t channel) {
@@ -21,6 +21,8 @@ class umd_implementation : public ttexalens_implementation {
                                         uint32_t data) override;
     std::optional<std::vector<uint8_t>> pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                                  uint32_t size) override;
+    std::optional<uint32_t> pci_read_into(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
+                                          uint8_t* data, uint32_t size) override;
     std::optional<uint32_t> pci_write(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
                                       const uint8_t* data, uint32_t size) override;
     std::optional<uint32_t> pci_read32_raw(uint8_t chip_id, uint64_t address) override;
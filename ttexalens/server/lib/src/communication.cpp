@@ -3,6 +3,9 @@
 // SPDX-License-Identifier: Apache-2.0
 #include "ttexalensserver/communication.h"
 
+#include <zlib.h>
+
+#include <cstring>
 #include <memory>
 #include <zmq.hpp>
 
@@ -16,9 +19,21 @@ int communication_loop(tt::exalens::communication* communication) {
     return 0;
 }
 
+// Address of the socket that workers use to send responses to background thread
+constexpr const char* RESPONSES_ADDRESS = "inproc://responses";
+
+// Worker threads send responses over their own socket with the envelope of the request they are processing
+thread_local zmq::socket_t* worker_socket = nullptr;
+thread_local std::vector<zmq::message_t>* worker_envelope = nullptr;
+thread_local std::optional<compression_frame>* worker_compression = nullptr;
+
+// Number of bytes sent as response to the request that current thread is processing
+thread_local size_t response_bytes = 0;
+
 }  // namespace tt::exalens
 
-tt::exalens::communication::communication() : port(-1) {}
+tt::exalens::communication::communication()
+    : port(-1), should_stop(false), use_worker_threads(false), next_sequence(0) {}
 
 tt::exalens::communication::~communication() {
     try {
@@ -35,123 +50,255 @@ void tt::exalens::communication::stop() {
         background_thread->join();
         background_thread = nullptr;
     }
+    stop_workers();
+    responses_socket.close();
     zmq_socket.close();
     zmq_context.close();
 }
 
-void tt::exalens::communication::start(int port) {
+void tt::exalens::communication::start(int port, bool use_worker_threads) {
     stop();
     zmq_context = zmq::context_t();
-    zmq_socket = zmq::socket_t(zmq_context, zmq::socket_type::rep);
+    zmq_socket = zmq::socket_t(zmq_context, zmq::socket_type::router);
     zmq_socket.bind(std::string("tcp://*:") + std::to_string(port));
+    if (use_worker_threads) {
+        responses_socket = zmq::socket_t(zmq_context, zmq::socket_type::pull);
+        responses_socket.bind(RESPONSES_ADDRESS);
+    }
+    this->use_worker_threads = use_worker_threads;
     should_stop = false;
     background_thread = std::make_unique<std::thread>(communication_loop, this);
     this->port = port;
 }
 
+void tt::exalens::communication::stop_workers() {
+    for (auto& [key, worker] : workers) {
+        {
+            // Lock is needed so that worker doesn't miss notification between checking condition and waiting
+            std::lock_guard<std::mutex> lock(worker->mutex);
+        }
+        worker->condition.notify_all();
+    }
+    { std::lock_guard<std::mutex> lock(order_mutex); }
+    order_condition.notify_all();
+    for (auto& [key, worker] : workers) {
+        worker->thread->join();
+    }
+    workers.clear();
+    pending_chip_jobs.clear();
+    pending_exclusive_jobs.clear();
+}
+
+bool tt::exalens::communication::is_valid_request(const void* data, size_t size) {
+    if (size < sizeof(request)) {
+        return false;
+    }
+
+    auto r = static_cast<const request*>(data);
+
+    switch (r->type) {
+        default:
+        case request_type::invalid:
+            return false;
+
+        // Requests with no structure - no input except request type
+        case request_type::ping:
+        case request_type::get_cluster_description:
+        case request_type::get_device_ids:
+            return size == sizeof(request);
+        case request_type::set_compression:
+            return size == sizeof(set_compression_request);
+        case request_type::get_statistics:
+            return size == sizeof(get_statistics_request);
+
+        // Static sized structures
+        case request_type::pci_read32:
+            return size == sizeof(pci_read32_request);
+        case request_type::pci_write32:
+            return size == sizeof(pci_write32_request);
+        case request_type::pci_read:
+            return size == sizeof(pci_read_request);
+        case request_type::pci_read32_raw:
+            return size == sizeof(pci_read32_raw_request);
+        case request_type::pci_write32_raw:
+            return size == sizeof(pci_write32_raw_request);
+        case request_type::dma_buffer_read32:
+            return size == sizeof(dma_buffer_read32_request);
+        case request_type::pci_read_tile:
+            return size == sizeof(pci_read_tile_request);
+        case request_type::get_device_arch:
+            return size == sizeof(get_device_arch_request);
+        case request_type::get_device_soc_description:
+            return size == sizeof(get_device_soc_description_request);
+        case tt::exalens::request_type::arc_msg:
+            return size == sizeof(arc_msg_request);
+        case request_type::pci_poll32:
+            return size == sizeof(pci_poll32_request);
+        case request_type::pci_sample32:
+            return size == sizeof(pci_sample32_request);
+        case request_type::pci_poll32_raw:
+            return size == sizeof(pci_poll32_raw_request);
+
+        case request_type::jtag_read32:
+            return size == sizeof(jtag_read32_request);
+        case request_type::jtag_write32:
+            return size == sizeof(jtag_write32_request);
+        case request_type::jtag_read32_axi:
+            return size == sizeof(jtag_read32_axi_request);
+        case request_type::jtag_write32_axi:
+            return size == sizeof(jtag_write32_axi_request);
+
+        // Dynamic sized structures
+        case request_type::pci_write:
+            return (size >= sizeof(pci_write_request)) &&
+                   (size == sizeof(pci_write_request) + static_cast<const pci_write_request*>(r)->size);
+        case request_type::get_file:
+            return (size >= sizeof(get_file_request)) &&
+                   (size == sizeof(get_file_request) + static_cast<const get_file_request*>(r)->size);
+        case request_type::convert_from_noc0:
+            return (size >= sizeof(convert_from_noc0_request)) &&
+                   (size == sizeof(convert_from_noc0_request) +
+                                static_cast<const convert_from_noc0_request*>(r)->core_type_size +
+                                static_cast<const convert_from_noc0_request*>(r)->coord_system_size);
+        case request_type::batch:
+            return (size >= sizeof(batch_request)) &&
+                   (size == sizeof(batch_request) + static_cast<const batch_request*>(r)->size) &&
+                   is_valid_batch_request(*static_cast<const batch_request*>(r));
+        case request_type::pci_read_gather:
+            return (size >= sizeof(pci_read_gather_request)) &&
+                   (size == sizeof(pci_read_gather_request) +
+                                2 * static_cast<uint64_t>(static_cast<const pci_read_gather_request*>(r)->core_count));
+        case request_type::pci_write_scatter: {
+            if (size < sizeof(pci_write_scatter_request)) {
+                return false;
+            }
+            auto& scatter = *static_cast<const pci_write_scatter_request*>(r);
+            return size == sizeof(pci_write_scatter_request) + 2 * static_cast<uint64_t>(scatter.core_count) +
+                               static_cast<uint64_t>(scatter.size);
+        }
+    }
+}
+
+std::optional<uint8_t> tt::exalens::communication::get_chip_id(const request& request) {
+    switch (request.type) {
+        case request_type::pci_read32:
+        case request_type::pci_write32:
+        case request_type::pci_read:
+        case request_type::pci_write:
+        case request_type::pci_read32_raw:
+        case request_type::pci_write32_raw:
+        case request_type::dma_buffer_read32:
+        case request_type::pci_read_tile:
+        case request_type::get_device_arch:
+        case request_type::get_device_soc_description:
+        case request_type::convert_from_noc0:
+        case request_type::arc_msg:
+        case request_type::pci_read_gather:
+        case request_type::pci_poll32:
+        case request_type::pci_write_scatter:
+        case request_type::pci_sample32:
+        case request_type::pci_poll32_raw:
+            // All of these requests have chip_id as the first field after request type
+            return static_cast<const pci_read32_request&>(request).chip_id;
+        case request_type::batch: {
+            // Batch targets single chip only if all of its sub-requests target the same chip
+            auto& batch = static_cast<const batch_request&>(request);
+            std::optional<uint8_t> chip_id;
+            const uint8_t* data = batch.data;
+
+            for (uint32_t i = 0; i < batch.count; i++) {
+                uint32_t size;
+
+                memcpy(&size, data, sizeof(size));
+                data += sizeof(size);
+                auto sub_request_chip_id = get_chip_id(*reinterpret_cast<const tt::exalens::request*>(data));
+                if (!sub_request_chip_id || (chip_id && chip_id != sub_request_chip_id)) {
+                    return {};
+                }
+                chip_id = sub_request_chip_id;
+                data += size;
+            }
+            return chip_id;
+        }
+        default:
+            return {};
+    }
+}
+
+bool tt::exalens::communication::is_valid_batch_request(const batch_request& request) {
+    const uint8_t* data = request.data;
+    const uint8_t* end = request.data + request.size;
+
+    for (uint32_t i = 0; i < request.count; i++) {
+        uint32_t size;
+
+        if (end - data < static_cast<ptrdiff_t>(sizeof(size))) {
+            return false;
+        }
+        memcpy(&size, data, sizeof(size));
+        data += sizeof(size);
+        if (end - data < static_cast<ptrdiff_t>(size) || size < sizeof(tt::exalens::request)) {
+            return false;
+        }
+
+        // Only device read/write requests are allowed inside of batch
+        switch (reinterpret_cast<const tt::exalens::request*>(data)->type) {
+            case request_type::pci_read32:
+            case request_type::pci_write32:
+            case request_type::pci_read:
+            case request_type::pci_write:
+                break;
+            default:
+                return false;
+        }
+        if (!is_valid_request(data, size)) {
+            return false;
+        }
+        data += size;
+    }
+    return data == end;
+}
+
 void tt::exalens::communication::request_loop() {
     while (!should_stop) {
         try {
+            if (use_worker_threads) {
+                // Wait for either new request from client or response from worker
+                zmq::pollitem_t items[] = {{zmq_socket.handle(), 0, ZMQ_POLLIN, 0},
+                                           {responses_socket.handle(), 0, ZMQ_POLLIN, 0}};
+                zmq::poll(items, 2, std::chrono::milliseconds(-1));
+
+                if (should_stop) break;
+                if (items[1].revents & ZMQ_POLLIN) {
+                    forward_response();
+                }
+                if (!(items[0].revents & ZMQ_POLLIN)) {
+                    continue;
+                }
+            }
+
             // Receive message
-            bool invalid_message = false;
             zmq::message_t message;
-            auto result = zmq_socket.recv(message);
+            auto result = receive(message);
 
             if (should_stop) break;
+            if (!result) continue;
 
-            // Get request type
-            if (message.size() >= sizeof(request)) {
-                auto r = static_cast<const request*>(message.data());
-
-                switch (r->type) {
-                    default:
-                    case request_type::invalid:
-                        invalid_message = true;
-                        break;
-
-                    // Requests with no structure - no input except request type
-                    case request_type::ping:
-                    case request_type::get_cluster_description:
-                    case request_type::get_device_ids:
-                        invalid_message = message.size() != sizeof(request);
-                        break;
-
-                    // Static sized structures
-                    case request_type::pci_read32:
-                        invalid_message = message.size() != sizeof(pci_read32_request);
-                        break;
-                    case request_type::pci_write32:
-                        invalid_message = message.size() != sizeof(pci_write32_request);
-                        break;
-                    case request_type::pci_read:
-                        invalid_message = message.size() != sizeof(pci_read_request);
-                        break;
-                    case request_type::pci_read32_raw:
-                        invalid_message = message.size() != sizeof(pci_read32_raw_request);
-                        break;
-                    case request_type::pci_write32_raw:
-                        invalid_message = message.size() != sizeof(pci_write32_raw_request);
-                        break;
-                    case request_type::dma_buffer_read32:
-                        invalid_message = message.size() != sizeof(dma_buffer_read32_request);
-                        break;
-                    case request_type::pci_read_tile:
-                        invalid_message = message.size() != sizeof(pci_read_tile_request);
-                        break;
-                    case request_type::get_device_arch:
-                        invalid_message = message.size() != sizeof(get_device_arch_request);
-                        break;
-                    case request_type::get_device_soc_description:
-                        invalid_message = message.size() != sizeof(get_device_soc_description_request);
-                        break;
-                    case tt::exalens::request_type::arc_msg:
-                        invalid_message = message.size() != sizeof(arc_msg_request);
-                        break;
-
-                    case request_type::jtag_read32:
-                        invalid_message = message.size() != sizeof(jtag_read32_request);
-                        break;
-                    case request_type::jtag_write32:
-                        invalid_message = message.size() != sizeof(jtag_write32_request);
-                        break;
-                    case request_type::jtag_read32_axi:
-                        invalid_message = message.size() != sizeof(jtag_read32_axi_request);
-                        break;
-                    case request_type::jtag_write32_axi:
-                        invalid_message = message.size() != sizeof(jtag_write32_axi_request);
-                        break;
-
-                    // Dynamic sized structures
-                    case request_type::pci_write:
-                        invalid_message = (message.size() < sizeof(pci_write_request)) ||
-                                          (message.size() !=
-                                           sizeof(pci_write_request) + static_cast<const pci_write_request*>(r)->size);
-                        break;
-                    case request_type::get_file:
-                        invalid_message = (message.size() < sizeof(get_file_request)) ||
-                                          (message.size() !=
-                                           sizeof(get_file_request) + static_cast<const get_file_request*>(r)->size);
-                        break;
-                    case request_type::convert_from_noc0:
-                        invalid_message =
-                            (message.size() < sizeof(convert_from_noc0_request)) ||
-                            (message.size() != sizeof(convert_from_noc0_request) +
-                                                   static_cast<const convert_from_noc0_request*>(r)->core_type_size +
-                                                   static_cast<const convert_from_noc0_request*>(r)->coord_system_size);
-                        break;
-                }
-
-                // Currenly no additional parsing is needed, so we just call process with current request that can be
-                // casted safely to correct type
-                if (!invalid_message) {
-                    process(*r);
+            // Currenly no additional parsing is needed, so we just call process with current request that can be
+            // casted safely to correct type
+            if (!is_valid_request(message.data(), message.size())) {
+                respond("BAD_REQUEST");
+            } else if (static_cast<const request*>(message.data())->type == request_type::set_compression) {
+                respond("OK");
+            } else if (static_cast<const request*>(message.data())->type == request_type::get_statistics) {
+                respond(request_statistics.to_yaml());
+                if (static_cast<const get_statistics_request*>(message.data())->reset) {
+                    request_statistics.reset();
                 }
+            } else if (use_worker_threads) {
+                dispatch(std::move(message));
             } else {
-                invalid_message = true;
-            }
-
-            if (invalid_message) {
-                respond("BAD_REQUEST");
+                process_and_record(message);
             }
         } catch (zmq::error_t) {
             // Something went wrong
@@ -161,10 +308,183 @@ void tt::exalens::communication::request_loop() {
     }
 }
 
+void tt::exalens::communication::dispatch(zmq::message_t&& message) {
+    auto chip_id = get_chip_id(*static_cast<const request*>(message.data()));
+    int key = chip_id ? *chip_id : -1;
+    auto& worker = workers[key];
+
+    if (!worker) {
+        worker = std::make_unique<communication::worker>();
+        worker->thread = std::make_unique<std::thread>(&communication::worker_loop, this, worker.get(), !chip_id);
+    }
+
+    // Job is registered before it is queued, so that jobs received later see it as pending
+    uint64_t sequence = next_sequence++;
+    {
+        std::lock_guard<std::mutex> lock(order_mutex);
+        (chip_id ? pending_chip_jobs : pending_exclusive_jobs).insert(sequence);
+    }
+    {
+        std::lock_guard<std::mutex> lock(worker->mutex);
+        worker->jobs.push(job{std::move(envelope), std::move(message), sequence, compression});
+    }
+    worker->condition.notify_one();
+}
+
+void tt::exalens::communication::forward_response() {
+    while (true) {
+        zmq::message_t part;
+
+        if (!responses_socket.recv(part)) {
+            return;
+        }
+        bool more = part.more();
+        zmq_socket.send(part, more ? zmq::send_flags::sndmore : zmq::send_flags::none);
+        if (!more) {
+            return;
+        }
+    }
+}
+
+void tt::exalens::communication::worker_loop(worker* worker, bool exclusive) {
+    try {
+        zmq::socket_t socket(zmq_context, zmq::socket_type::push);
+        socket.set(zmq::sockopt::linger, 0);
+        socket.connect(RESPONSES_ADDRESS);
+        worker_socket = &socket;
+
+        while (true) {
+            job current_job;
+            {
+                std::unique_lock<std::mutex> lock(worker->mutex);
+                worker->condition.wait(lock, [&] { return should_stop || !worker->jobs.empty(); });
+                if (should_stop) break;
+                current_job = std::move(worker->jobs.front());
+                worker->jobs.pop();
+            }
+
+            // Requests to different chips can run in parallel, while requests that don't target single chip need
+            // exclusive access to devices and must not be reordered with requests to any chip
+            {
+                std::unique_lock<std::mutex> lock(order_mutex);
+                order_condition.wait(lock, [&] { return should_stop || can_start(current_job.sequence, exclusive); });
+                if (should_stop) break;
+            }
+            worker_envelope = &current_job.envelope;
+            worker_compression = &current_job.compression;
+            try {
+                process_and_record(current_job.message);
+            } catch (...) {
+                // We are guarding exceptions stopping our worker thread
+            }
+            worker_envelope = nullptr;
+            worker_compression = nullptr;
+            {
+                std::lock_guard<std::mutex> lock(order_mutex);
+                (exclusive ? pending_exclusive_jobs : pending_chip_jobs).erase(current_job.sequence);
+            }
+            order_condition.notify_all();
+        }
+    } catch (...) {
+        // Socket fails when server is stopping
+    }
+    worker_socket = nullptr;
+    worker_envelope = nullptr;
+    worker_compression = nullptr;
+}
+
+bool tt::exalens::communication::can_start(uint64_t sequence, bool exclusive) const {
+    // Job waits for exclusive jobs received before it; exclusive job also waits for all chip jobs received before it.
+    // Jobs of one worker are queued in order, so the oldest pending job can always start.
+    if (!pending_exclusive_jobs.empty() && *pending_exclusive_jobs.begin() < sequence) {
+        return false;
+    }
+    return !exclusive || pending_chip_jobs.empty() || *pending_chip_jobs.begin() > sequence;
+}
+
+void tt::exalens::communication::process_and_record(const zmq::message_t& message) {
+    auto& request = *static_cast<const tt::exalens::request*>(message.data());
+    auto start = std::chrono::steady_clock::now();
+
+    response_bytes = 0;
+    process(request);
+    request_statistics.record(request.type, get_chip_id(request), message.size(), response_bytes,
+                              std::chrono::steady_clock::now() - start);
+}
+
+bool tt::exalens::communication::receive(zmq::message_t& message) {
+    // ROUTER socket prepends identity of the client to the message. REQ clients add empty delimiter frame and DEALER
+    // clients add request id frame and empty delimiter frame. Everything before the last frame is kept as envelope and
+    // sent back with the response, so that client can match response to the request. Compression frame that client
+    // sent between delimiter and request applies only to this request and is not sent back.
+    envelope.clear();
+    compression.reset();
+    while (true) {
+        zmq::message_t part;
+
+        if (!zmq_socket.recv(part)) {
+            return false;
+        }
+        if (!part.more()) {
+            message = std::move(part);
+            break;
+        }
+        envelope.push_back(std::move(part));
+    }
+
+    auto size = envelope.size();
+    if (size >= 2 && envelope[size - 2].size() == 0 && envelope[size - 1].size() == sizeof(compression_frame)) {
+        auto settings = *envelope[size - 1].data<compression_frame>();
+
+        if (settings.level != 0) {
+            settings.level = std::min<uint8_t>(settings.level, Z_BEST_COMPRESSION);
+            compression = settings;
+        }
+        envelope.pop_back();
+    }
+    return true;
+}
+
+// Compresses data with zlib and returns false if compression failed or didn't make data smaller.
+static bool compress_payload(const void* data, size_t size, int level, std::vector<uint8_t>& compressed) {
+    uLongf compressed_size = compressBound(size);
+
+    compressed.resize(compressed_size);
+    if (compress2(compressed.data(), &compressed_size, static_cast<const Bytef*>(data), size, level) != Z_OK ||
+        compressed_size >= size) {
+        return false;
+    }
+    compressed.resize(compressed_size);
+    return true;
+}
+
 void tt::exalens::communication::respond(const std::string& message) { respond(message.c_str(), message.size()); }
 
 void tt::exalens::communication::respond(const void* data, size_t size) {
-    zmq_socket.send(zmq::const_buffer(data, size));
+    // Worker threads send responses to background thread which forwards them to the clients
+    auto& socket = worker_socket ? *worker_socket : zmq_socket;
+    auto& response_envelope = worker_envelope ? *worker_envelope : envelope;
+    auto& settings = worker_compression ? *worker_compression : compression;
+
+    response_bytes += size;
+    for (auto& part : response_envelope) {
+        socket.send(zmq::const_buffer(part.data(), part.size()), zmq::send_flags::sndmore);
+    }
+    if (settings) {
+        // Client that requested compression receives codec frame in front of payload
+        std::vector<uint8_t> compressed;
+
+        if (size >= settings->threshold && compress_payload(data, size, settings->level, compressed)) {
+            auto codec = compression_codec::zlib;
+            socket.send(zmq::const_buffer(&codec, sizeof(codec)), zmq::send_flags::sndmore);
+            socket.send(zmq::const_buffer(compressed.data(), compressed.size()));
+            return;
+        }
+
+        auto codec = compression_codec::none;
+        socket.send(zmq::const_buffer(&codec, sizeof(codec)), zmq::send_flags::sndmore);
+    }
+    socket.send(zmq::const_buffer(data, size));
 }
 
 bool tt::exalens::communication::is_connected() const { return port != -1; }
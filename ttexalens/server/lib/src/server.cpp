@@ -3,6 +3,8 @@
 // SPDX-License-Identifier: Apache-2.0
 #include "ttexalensserver/server.h"
 
+#include <algorithm>
+#include <cstring>
 #include <fstream>
 
 #include "ttexalensserver/communication.h"
@@ -10,6 +12,9 @@
 void tt::exalens::server::process(const tt::exalens::request& base_request) {
     switch (base_request.type) {
         case tt::exalens::request_type::invalid:
+        // Compression and statistics are handled by communication and never reach processing
+        case tt::exalens::request_type::set_compression:
+        case tt::exalens::request_type::get_statistics:
             respond_not_supported();
             break;
         case tt::exalens::request_type::ping:
@@ -99,6 +104,55 @@ void tt::exalens::server::process(const tt::exalens::request& base_request) {
                                             request.arg1, request.timeout));
             break;
         }
+        case tt::exalens::request_type::batch: {
+            auto& request = static_cast<const tt::exalens::batch_request&>(base_request);
+            auto response = process_batch(request);
+            communication::respond(response.data(), response.size());
+            break;
+        }
+        case tt::exalens::request_type::pci_read_gather: {
+            auto& request = static_cast<const tt::exalens::pci_read_gather_request&>(base_request);
+            std::vector<std::tuple<uint8_t, uint8_t>> cores;
+
+            cores.reserve(request.core_count);
+            for (uint32_t i = 0; i < request.core_count; i++) {
+                cores.emplace_back(request.data[2 * i], request.data[2 * i + 1]);
+            }
+            respond(implementation->pci_read_gather(request.chip_id, cores, request.address, request.size));
+            break;
+        }
+        case tt::exalens::request_type::pci_poll32: {
+            auto& request = static_cast<const tt::exalens::pci_poll32_request&>(base_request);
+            respond(implementation->pci_poll32(request.chip_id, request.noc_x, request.noc_y, request.address,
+                                               request.mask, request.expected, request.timeout_ms,
+                                               request.interval_us));
+            break;
+        }
+        case tt::exalens::request_type::pci_poll32_raw: {
+            auto& request = static_cast<const tt::exalens::pci_poll32_raw_request&>(base_request);
+            respond(implementation->pci_poll32_raw(request.chip_id, request.address, request.mask, request.expected,
+                                                   request.timeout_ms, request.interval_us));
+            break;
+        }
+        case tt::exalens::request_type::pci_sample32: {
+            auto& request = static_cast<const tt::exalens::pci_sample32_request&>(base_request);
+            auto duration_ms = std::min(request.duration_ms, tt::exalens::pci_sample32_max_duration_ms);
+            respond(implementation->pci_sample32(request.chip_id, request.noc_x, request.noc_y, request.address,
+                                                 duration_ms, request.interval_us, request.max_values));
+            break;
+        }
+        case tt::exalens::request_type::pci_write_scatter: {
+            auto& request = static_cast<const tt::exalens::pci_write_scatter_request&>(base_request);
+            std::vector<std::tuple<uint8_t, uint8_t>> cores;
+
+            cores.reserve(request.core_count);
+            for (uint32_t i = 0; i < request.core_count; i++) {
+                cores.emplace_back(request.data[2 * i], request.data[2 * i + 1]);
+            }
+            respond(implementation->pci_write_scatter(request.chip_id, cores, request.address,
+                                                      request.data + 2 * request.core_count, request.size));
+            break;
+        }
 
         case tt::exalens::request_type::jtag_read32: {
             auto& request = static_cast<const tt::exalens::jtag_read32_request&>(base_request);
@@ -180,6 +234,76 @@ void tt::exalens::server::respond(std::optional<std::tuple<int, uint32_t, uint32
     }
 }
 
+void tt::exalens::server::respond(std::optional<std::tuple<uint32_t, uint32_t>> response) {
+    if (!response) {
+        respond_not_supported();
+    } else {
+        uint32_t data[] = {std::get<0>(response.value()), std::get<1>(response.value())};
+        communication::respond(data, sizeof(data));
+    }
+}
+
+static std::optional<std::vector<uint8_t>> to_bytes(std::optional<uint32_t> value) {
+    if (!value) {
+        return {};
+    }
+    std::vector<uint8_t> data(sizeof(uint32_t));
+    memcpy(data.data(), &value.value(), sizeof(uint32_t));
+    return data;
+}
+
+std::vector<uint8_t> tt::exalens::server::process_batch(const tt::exalens::batch_request& request) {
+    std::vector<uint8_t> response;
+    const uint8_t* data = request.data;
+
+    // Communication already validated that all sub-requests are well formed
+    for (uint32_t i = 0; i < request.count; i++) {
+        uint32_t size;
+        memcpy(&size, data, sizeof(size));
+        data += sizeof(size);
+
+        auto result = process_batch_operation(*reinterpret_cast<const tt::exalens::request*>(data));
+        data += size;
+
+        auto status = result ? batch_status::ok : batch_status::not_supported;
+        uint32_t result_size = result ? result->size() : 0;
+        response.push_back(static_cast<uint8_t>(status));
+        response.insert(response.end(), reinterpret_cast<const uint8_t*>(&result_size),
+                        reinterpret_cast<const uint8_t*>(&result_size) + sizeof(result_size));
+        if (result) {
+            response.insert(response.end(), result->begin(), result->end());
+        }
+    }
+    return response;
+}
+
+std::optional<std::vector<uint8_t>> tt::exalens::server::process_batch_operation(
+    const tt::exalens::request& base_request) {
+    switch (base_request.type) {
+        case tt::exalens::request_type::pci_read32: {
+            auto& request = static_cast<const tt::exalens::pci_read32_request&>(base_request);
+            return to_bytes(implementation->pci_read32(request.chip_id, request.noc_x, request.noc_y, request.address));
+        }
+        case tt::exalens::request_type::pci_write32: {
+            auto& request = static_cast<const tt::exalens::pci_write32_request&>(base_request);
+            return to_bytes(implementation->pci_write32(request.chip_id, request.noc_x, request.noc_y, request.address,
+                                                        request.data));
+        }
+        case tt::exalens::request_type::pci_read: {
+            auto& request = static_cast<const tt::exalens::pci_read_request&>(base_request);
+            return implementation->pci_read(request.chip_id, request.noc_x, request.noc_y, request.address,
+                                            request.size);
+        }
+        case tt::exalens::request_type::pci_write: {
+            auto& request = static_cast<const tt::exalens::pci_write_request&>(base_request);
+            return to_bytes(implementation->pci_write(request.chip_id, request.noc_x, request.noc_y, request.address,
+                                                      request.data, request.size));
+        }
+        default:
+            return {};
+    }
+}
+
 std::optional<std::vector<uint8_t>> tt::exalens::server::get_file(const std::string& path) {
     std::ifstream file(path, std::ios::binary);
     if (!file) {
@@ -0,0 +1,75 @@
+// SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+//
+// SPDX-License-Identifier: Apache-2.0
+#include "ttexalensserver/statistics.h"
+
+#include <cmath>
+
+// Bucket 0 holds latencies below 1us, bucket i holds latencies in range [2^(i-1), 2^i) us.
+static size_t latency_bucket(uint64_t latency_us, size_t bucket_count) {
+    size_t bucket = 0;
+
+    while (latency_us > 0 && bucket + 1 < bucket_count) {
+        latency_us >>= 1;
+        bucket++;
+    }
+    return bucket;
+}
+
+void tt::exalens::statistics::record(request_type type, std::optional<uint8_t> chip_id, size_t request_bytes,
+                                     size_t response_bytes, std::chrono::nanoseconds latency) {
+    uint64_t latency_us = std::chrono::duration_cast<std::chrono::microseconds>(latency).count();
+    std::lock_guard<std::mutex> lock(mutex);
+    auto& entry = entries[std::make_tuple(chip_id ? *chip_id : -1, type)];
+
+    entry.count++;
+    entry.request_bytes += request_bytes;
+    entry.response_bytes += response_bytes;
+    entry.total_latency_us += latency_us;
+    entry.latency_histogram[latency_bucket(latency_us, latency_buckets)]++;
+}
+
+void tt::exalens::statistics::reset() {
+    std::lock_guard<std::mutex> lock(mutex);
+
+    entries.clear();
+}
+
+uint64_t tt::exalens::statistics::entry::latency_percentile_us(double percentile) const {
+    uint64_t target = static_cast<uint64_t>(std::ceil(count * percentile));
+    uint64_t seen = 0;
+
+    for (size_t bucket = 0; bucket < latency_histogram.size(); bucket++) {
+        seen += latency_histogram[bucket];
+        if (seen >= target) {
+            return 1ull << bucket;
+        }
+    }
+    return 1ull << (latency_histogram.size() - 1);
+}
+
+std::string tt::exalens::statistics::to_yaml() {
+    std::lock_guard<std::mutex> lock(mutex);
+
+    if (entries.empty()) {
+        return "[]";
+    }
+
+    std::string yaml;
+    for (auto& [key, entry] : entries) {
+        auto& [chip_id, type] = key;
+
+        if (!yaml.empty()) {
+            yaml += "\n";
+        }
+        yaml += "- chip_id: " + std::to_string(chip_id);
+        yaml += "\n  type: " + std::to_string(static_cast<int>(type));
+        yaml += "\n  count: " + std::to_string(entry.count);
+        yaml += "\n  request_bytes: " + std::to_string(entry.request_bytes);
+        yaml += "\n  response_bytes: " + std::to_string(entry.response_bytes);
+        yaml += "\n  total_latency_us: " + std::to_string(entry.total_latency_us);
+        yaml += "\n  p50_latency_us: " + std::to_string(entry.latency_percentile_us(0.5));
+        yaml += "\n  p99_latency_us: " + std::to_string(entry.latency_percentile_us(0.99));
+    }
+    return yaml;
+}
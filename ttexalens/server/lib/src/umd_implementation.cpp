@@ -37,21 +37,28 @@ std::optional<uint32_t> umd_implementation::pci_write32(uint8_t chip_id, uint8_t
 
 std::optional<std::vector<uint8_t>> umd_implementation::pci_read(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
                                                                  uint64_t address, uint32_t size) {
-    tt_cxy_pair target(chip_id, noc_x, noc_y);
     std::vector<uint8_t> result(size);
 
+    pci_read_into(chip_id, noc_x, noc_y, address, result.data(), size);
+    return result;
+}
+
+std::optional<uint32_t> umd_implementation::pci_read_into(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y,
+                                                          uint64_t address, uint8_t* data, uint32_t size) {
+    tt_cxy_pair target(chip_id, noc_x, noc_y);
+
     // TODO #124: Mitigation for UMD bug #77
     if (!is_chip_mmio_capable(chip_id)) {
         for (uint32_t done = 0; done < size;) {
             uint32_t block = std::min(size - done, 1024u);
-            device->read_from_device(result.data() + done, target, address + done, block, REG_TLB_STR);
+            device->read_from_device(data + done, target, address + done, block, REG_TLB_STR);
             done += block;
         }
-        return result;
+        return size;
     }
 
-    device->read_from_device(result.data(), target, address, size, REG_TLB_STR);
-    return result;
+    device->read_from_device(data, target, address, size, REG_TLB_STR);
+    return size;
 }
 
 std::optional<uint32_t> umd_implementation::pci_write(uint8_t chip_id, uint8_t noc_x, uint8_t noc_y, uint64_t address,
@@ -1,22 +1,42 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+from collections import deque
+from concurrent.futures import Future
 from enum import Enum
 import io
 import os
 import sys
 import struct
+import threading
+import time
+from typing import Callable, Iterator
+import yaml
+import zlib
 import zmq
 
 from ttexalens import util as util
 from ttexalens import tt_exalens_ifc_cache as tt_exalens_ifc_cache
-from ttexalens.tt_exalens_ifc_base import TTExaLensCommunicator
+from ttexalens.tt_exalens_ifc_base import (
+    BATCH_OPERATIONS,
+    SAMPLE_MAX_VALUES,
+    STREAM_CHUNK_SIZE,
+    STREAM_WINDOW,
+    SampleResult,
+    TTExaLensCommunicator,
+)
+
+# Longest sampling done by a single pci_sample32 request. Must not be longer than pci_sample32_max_duration_ms of the
+# server, which limits it so that one request doesn't block other requests to the chip for long.
+SAMPLE_REQUEST_MAX_DURATION_MS = 1000
 
 
 class ttexalens_server_request_type(Enum):
     # Basic requests
     invalid = 0
     ping = 1
+    set_compression = 2
+    get_statistics = 3
 
     # Device requests
     pci_read32 = 10
@@ -30,6 +50,12 @@ class ttexalens_server_request_type(Enum):
     get_device_arch = 19
     get_device_soc_description = 20
     arc_msg = 21
+    batch = 22
+    pci_read_gather = 23
+    pci_poll32 = 24
+    pci_write_scatter = 25
+    pci_sample32 = 26
+    pci_poll32_raw = 27
 
     jtag_read32 = 50
     jtag_write32 = 51
@@ -45,6 +71,11 @@ class ttexalens_server_request_type(Enum):
     get_file = 200
 
 
+class ttexalens_server_compression_codec(Enum):
+    none = 0
+    zlib = 1
+
+
 class ttexalens_server_bad_request(Exception):
     pass
 
@@ -53,21 +84,55 @@ class ttexalens_server_not_supported(Exception):
     pass
 
 
+class ttexalens_server_future(Future):
+    """
+    Future returned by pipelined requests. Waiting for the result receives responses from the server until response
+    to this request arrives. Responses to other requests that arrive in the meantime complete their futures.
+    """
+
+    def __init__(self, communication: "ttexalens_server_communication", parse: Callable = None):
+        super().__init__()
+        self._communication = communication
+        self._parse = parse
+
+    def result(self, timeout=None):
+        self._communication._wait(self, timeout)
+        return super().result(0)
+
+    def exception(self, timeout=None):
+        self._communication._wait(self, timeout)
+        return super().exception(0)
+
+
 class ttexalens_server_communication:
     """
     This class handles the communication with the TTExaLens server using ZMQ. It is responsible for sending requests and
     parsing and checking the responses.
+
+    By default REQ socket is used and every request waits for its response. In pipelined mode DEALER socket is used,
+    every request is tagged with request id and multiple requests can be in flight at the same time. Responses are
+    matched to requests by request id, so they can arrive in any order.
+
+    After compression is enabled with set_compression, compression frame is sent in front of every request and server
+    sends codec frame in front of its response payload. Server keeps no compression state, so settings travel with the
+    requests. Responses are decoded by number of frames, so both compressed and uncompressed responses are accepted.
     """
 
     _BAD_REQUEST = b"BAD_REQUEST"
     _NOT_SUPPORTED = b"NOT_SUPPORTED"
+    _POLL_INTERVAL_MS = 10
 
-    def __init__(self, address: str, port: int):
+    def __init__(self, address: str, port: int, pipelined: bool = False):
         self.address = address
         self.port = port
+        self.pipelined = pipelined
         self._context = zmq.Context()
-        self._socket = self._context.socket(zmq.REQ)
+        self._socket = self._context.socket(zmq.DEALER if pipelined else zmq.REQ)
         self._socket.connect(f"tcp://{self.address}:{self.port}")
+        self._lock = threading.Lock()
+        self._next_request_id = 0
+        self._pending_requests: dict[int, ttexalens_server_future] = {}
+        self._compression_frame: list[bytes] = []
 
     def _check(self, response: bytes):
         if response == ttexalens_server_communication._BAD_REQUEST:
@@ -76,72 +141,281 @@ class ttexalens_server_communication:
             raise ttexalens_server_not_supported()
         return response
 
+    @staticmethod
+    def _decode(frames: list):
+        # Single frame is uncompressed response, otherwise first frame is compression codec
+        if len(frames) == 1:
+            return frames[0]
+        codec, payload = frames
+        if codec[0] == ttexalens_server_compression_codec.zlib.value:
+            return zlib.decompress(payload)
+        return payload
+
+    def _request(self, request: bytes):
+        if self.pipelined:
+            return self.request_async(request).result()
+        with self._lock:
+            self._socket.send_multipart([*self._compression_frame, request])
+            return self._check(self._decode(self._socket.recv_multipart()))
+
+    def request_async(self, request: bytes, parse: Callable = None) -> ttexalens_server_future:
+        """
+        Sends request to the server without waiting for the response. Returned future resolves to checked response
+        converted with parse function (if provided). Without pipelining, request is completed before returning.
+        """
+        future = ttexalens_server_future(self, parse)
+        if not self.pipelined:
+            try:
+                self._complete(future, self._request(request))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        with self._lock:
+            request_id = self._next_request_id
+            self._next_request_id = (self._next_request_id + 1) & 0xFFFFFFFF
+            self._pending_requests[request_id] = future
+            self._socket.send_multipart([struct.pack("<I", request_id), b"", *self._compression_frame, request])
+        return future
+
+    def _complete(self, future: ttexalens_server_future, response: bytes):
+        try:
+            response = self._check(response)
+            future.set_result(future._parse(response) if future._parse else response)
+        except Exception as e:
+            future.set_exception(e)
+
+    def _wait(self, future: ttexalens_server_future, timeout=None):
+        remaining_ms = None if timeout is None else timeout * 1000
+        while not future.done():
+            if remaining_ms is not None and remaining_ms <= 0:
+                return
+            with self._lock:
+                if future.done():
+                    return
+                if self._socket.poll(self._POLL_INTERVAL_MS):
+                    # Receive everything that already arrived
+                    while self._socket.poll(0):
+                        request_id, _, *frames = self._socket.recv_multipart()
+                        pending_future = self._pending_requests.pop(struct.unpack("<I", request_id)[0], None)
+                        if pending_future is not None:
+                            self._complete(pending_future, self._decode(frames))
+            if remaining_ms is not None:
+                remaining_ms -= self._POLL_INTERVAL_MS
+
     def ping(self):
-        self._socket.send(bytes([ttexalens_server_request_type.ping.value]))
-        return self._check(self._socket.recv())
+        return self._request(bytes([ttexalens_server_request_type.ping.value]))
 
-    def pci_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
-        self._socket.send(
-            struct.pack(
-                "<BBBBQ",
-                ttexalens_server_request_type.pci_read32.value,
-                chip_id,
-                noc_x,
-                noc_y,
-                address,
-            )
+    def set_compression(self, level: int, threshold: int):
+        response = self._request(
+            struct.pack("<BBI", ttexalens_server_request_type.set_compression.value, level, threshold)
         )
-        return self._check(self._socket.recv())
+        # Server supports compression, so following requests can carry compression frame
+        self._compression_frame = [struct.pack("<BI", level, threshold)] if level > 0 else []
+        return response
 
-    def pci_write32(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
-        self._socket.send(
-            struct.pack(
-                "<BBBBQI",
-                ttexalens_server_request_type.pci_write32.value,
-                chip_id,
-                noc_x,
-                noc_y,
-                address,
-                data,
-            )
+    @staticmethod
+    def pack_pci_read32(chip_id: int, noc_x: int, noc_y: int, address: int):
+        return struct.pack(
+            "<BBBBQ",
+            ttexalens_server_request_type.pci_read32.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
         )
-        return self._check(self._socket.recv())
 
-    def pci_read(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int):
-        self._socket.send(
-            struct.pack(
-                "<BBBBQI",
-                ttexalens_server_request_type.pci_read.value,
-                chip_id,
-                noc_x,
-                noc_y,
-                address,
-                size,
-            )
+    @staticmethod
+    def pack_pci_write32(chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
+        return struct.pack(
+            "<BBBBQI",
+            ttexalens_server_request_type.pci_write32.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
+            data,
+        )
+
+    @staticmethod
+    def pack_pci_read(chip_id: int, noc_x: int, noc_y: int, address: int, size: int):
+        return struct.pack(
+            "<BBBBQI",
+            ttexalens_server_request_type.pci_read.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
+            size,
         )
-        return self._check(self._socket.recv())
+
+    @staticmethod
+    def pack_pci_write(chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
+        return struct.pack(
+            f"<BBBBQI{len(data)}s",
+            ttexalens_server_request_type.pci_write.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
+            len(data),
+            data,
+        )
+
+    @staticmethod
+    def pack_pci_read_gather(chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int):
+        coordinates = bytes(coordinate for core in cores for coordinate in core)
+        return struct.pack(
+            f"<BBQII{len(coordinates)}s",
+            ttexalens_server_request_type.pci_read_gather.value,
+            chip_id,
+            address,
+            size,
+            len(cores),
+            coordinates,
+        )
+
+    @staticmethod
+    def pack_pci_write_scatter(chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes):
+        coordinates = bytes(coordinate for core in cores for coordinate in core)
+        return struct.pack(
+            f"<BBQII{len(coordinates)}s{len(data)}s",
+            ttexalens_server_request_type.pci_write_scatter.value,
+            chip_id,
+            address,
+            len(data),
+            len(cores),
+            coordinates,
+            data,
+        )
+
+    @staticmethod
+    def pack_pci_poll32(
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        mask: int,
+        expected: int,
+        timeout_ms: int,
+        interval_us: int,
+    ):
+        return struct.pack(
+            "<BBBBQIIII",
+            ttexalens_server_request_type.pci_poll32.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
+            mask,
+            expected,
+            timeout_ms,
+            interval_us,
+        )
+
+    @staticmethod
+    def pack_pci_poll32_raw(chip_id: int, address: int, mask: int, expected: int, timeout_ms: int, interval_us: int):
+        return struct.pack(
+            "<BBIIIII",
+            ttexalens_server_request_type.pci_poll32_raw.value,
+            chip_id,
+            address,
+            mask,
+            expected,
+            timeout_ms,
+            interval_us,
+        )
+
+    @staticmethod
+    def pack_pci_sample32(
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        duration_ms: int,
+        interval_us: int,
+        max_values: int,
+    ):
+        return struct.pack(
+            "<BBBBQIII",
+            ttexalens_server_request_type.pci_sample32.value,
+            chip_id,
+            noc_x,
+            noc_y,
+            address,
+            duration_ms,
+            interval_us,
+            max_values,
+        )
+
+    def get_statistics(self, reset: bool):
+        return self._request(struct.pack("<BB", ttexalens_server_request_type.get_statistics.value, reset))
+
+    def pci_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
+        return self._request(self.pack_pci_read32(chip_id, noc_x, noc_y, address))
+
+    def pci_write32(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
+        return self._request(self.pack_pci_write32(chip_id, noc_x, noc_y, address, data))
+
+    def pci_read(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int):
+        return self._request(self.pack_pci_read(chip_id, noc_x, noc_y, address, size))
 
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
-        self._socket.send(
-            struct.pack(
-                f"<BBBBQI{len(data)}s",
-                ttexalens_server_request_type.pci_write.value,
-                chip_id,
-                noc_x,
-                noc_y,
-                address,
-                len(data),
-                data,
-            )
+        return self._request(self.pack_pci_write(chip_id, noc_x, noc_y, address, data))
+
+    def pci_read_gather(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int):
+        return self._request(self.pack_pci_read_gather(chip_id, cores, address, size))
+
+    def pci_write_scatter(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes):
+        return self._request(self.pack_pci_write_scatter(chip_id, cores, address, data))
+
+    def pci_poll32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        mask: int,
+        expected: int,
+        timeout_ms: int,
+        interval_us: int,
+    ):
+        return self._request(
+            self.pack_pci_poll32(chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us)
+        )
+
+    def pci_poll32_raw(self, chip_id: int, address: int, mask: int, expected: int, timeout_ms: int, interval_us: int):
+        return self._request(self.pack_pci_poll32_raw(chip_id, address, mask, expected, timeout_ms, interval_us))
+
+    def pci_sample32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        duration_ms: int,
+        interval_us: int,
+        max_values: int,
+    ):
+        return self._request(
+            self.pack_pci_sample32(chip_id, noc_x, noc_y, address, duration_ms, interval_us, max_values)
         )
-        return self._check(self._socket.recv())
+
+    def pci_read_view(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> memoryview:
+        # Returns memoryview of received ZMQ frame, so that data is not copied into bytes object
+        request = self.pack_pci_read(chip_id, noc_x, noc_y, address, size)
+        if self.pipelined:
+            return memoryview(self._request(request))
+        with self._lock:
+            self._socket.send_multipart([*self._compression_frame, request])
+            frames = [frame.buffer for frame in self._socket.recv_multipart(copy=False)]
+            response = self._decode(frames)
+            return self._check(response if isinstance(response, memoryview) else memoryview(response))
 
     def pci_read32_raw(self, chip_id: int, address: int):
-        self._socket.send(struct.pack("<BBI", ttexalens_server_request_type.pci_read32_raw.value, chip_id, address))
-        return self._check(self._socket.recv())
+        return self._request(struct.pack("<BBI", ttexalens_server_request_type.pci_read32_raw.value, chip_id, address))
 
     def pci_write32_raw(self, chip_id: int, address: int, data: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBII",
                 ttexalens_server_request_type.pci_write32_raw.value,
@@ -150,10 +424,9 @@ class ttexalens_server_communication:
                 data,
             )
         )
-        return self._check(self._socket.recv())
 
     def dma_buffer_read32(self, chip_id: int, address: int, channel: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBQH",
                 ttexalens_server_request_type.dma_buffer_read32.value,
@@ -162,7 +435,6 @@ class ttexalens_server_communication:
                 channel,
             )
         )
-        return self._check(self._socket.recv())
 
     def pci_read_tile(
         self,
@@ -173,7 +445,7 @@ class ttexalens_server_communication:
         size: int,
         data_format: int,
     ):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBBBQIB",
                 ttexalens_server_request_type.pci_read_tile.value,
@@ -185,17 +457,15 @@ class ttexalens_server_communication:
                 data_format,
             )
         )
-        return self._check(self._socket.recv())
 
     def get_cluster_description(self):
-        self._socket.send(bytes([ttexalens_server_request_type.get_cluster_description.value]))
-        return self._check(self._socket.recv())
+        return self._request(bytes([ttexalens_server_request_type.get_cluster_description.value]))
 
     def convert_from_noc0(self, chip_id, noc_x, noc_y, core_type, coord_system):
         core_type = core_type.encode()
         coord_system = coord_system.encode()
         data = core_type + coord_system
-        self._socket.send(
+        bytes = self._request(
             struct.pack(
                 f"<BBBBII{len(data)}s",
                 ttexalens_server_request_type.convert_from_noc0.value,
@@ -207,38 +477,34 @@ class ttexalens_server_communication:
                 data,
             )
         )
-        bytes = self._check(self._socket.recv())
         if len(bytes) == 2:
             return (bytes[0], bytes[1])
         return bytes
 
     def get_device_ids(self):
-        self._socket.send(bytes([ttexalens_server_request_type.get_device_ids.value]))
-        return self._check(self._socket.recv())
+        return self._request(bytes([ttexalens_server_request_type.get_device_ids.value]))
 
     def get_device_arch(self, chip_id: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BB",
                 ttexalens_server_request_type.get_device_arch.value,
                 chip_id,
             )
         )
-        return self._check(self._socket.recv())
 
     def get_device_soc_description(self, chip_id: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BB",
                 ttexalens_server_request_type.get_device_soc_description.value,
                 chip_id,
             )
         )
-        return self._check(self._socket.recv())
 
     def get_file(self, path: str):
         encoded_path = path.encode()
-        self._socket.send(
+        return self._request(
             struct.pack(
                 f"<BI{len(encoded_path)}s",
                 ttexalens_server_request_type.get_file.value,
@@ -246,10 +512,9 @@ class ttexalens_server_communication:
                 encoded_path,
             )
         )
-        return self._check(self._socket.recv())
 
     def arc_msg(self, device_id: int, msg_code: int, wait_for_done: bool, arg0: int, arg1: int, timeout: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBBIIIIB",
                 ttexalens_server_request_type.arc_msg.value,
@@ -261,10 +526,9 @@ class ttexalens_server_communication:
                 timeout,
             )
         )
-        return self._check(self._socket.recv())
 
     def jtag_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBBBQ",
                 ttexalens_server_request_type.jtag_read32.value,
@@ -274,10 +538,9 @@ class ttexalens_server_communication:
                 address,
             )
         )
-        return self._check(self._socket.recv())
 
     def jtag_write32(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBBBQI",
                 ttexalens_server_request_type.jtag_write32.value,
@@ -288,10 +551,9 @@ class ttexalens_server_communication:
                 data,
             )
         )
-        return self._check(self._socket.recv())
 
     def jtag_read32_axi(self, chip_id: int, address: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBI",
                 ttexalens_server_request_type.jtag_read32_axi.value,
@@ -299,10 +561,9 @@ class ttexalens_server_communication:
                 address,
             )
         )
-        return self._check(self._socket.recv())
 
     def jtag_write32_axi(self, chip_id: int, address: int, data: int):
-        self._socket.send(
+        return self._request(
             struct.pack(
                 "<BBII",
                 ttexalens_server_request_type.jtag_write32_axi.value,
@@ -311,19 +572,42 @@ class ttexalens_server_communication:
                 data,
             )
         )
-        return self._check(self._socket.recv())
+
+    @staticmethod
+    def pack_batch(requests: "list[bytes]"):
+        data = b"".join(struct.pack("<I", len(request)) + request for request in requests)
+        return struct.pack(
+            f"<BII{len(data)}s",
+            ttexalens_server_request_type.batch.value,
+            len(requests),
+            len(data),
+            data,
+        )
+
+    def batch(self, requests: "list[bytes]"):
+        return self._request(self.pack_batch(requests))
 
 
 class ttexalens_client(TTExaLensCommunicator):
-    def __init__(self, address: str, port: int):
+    # Compression is meant for slow links, so fastest level is used and small responses are not compressed
+    COMPRESSION_LEVEL = 1
+    COMPRESSION_THRESHOLD = 1024
+
+    def __init__(self, address: str, port: int, pipelined: bool = False, compression: bool = False):
         super().__init__()
-        self._communication = ttexalens_server_communication(address, port)
+        self._communication = ttexalens_server_communication(address, port, pipelined)
 
         # Check ping/pong to verify it is TTExaLens server on the other end
         pong = self._communication.ping()
         if pong != b"PONG":
             raise ConnectionError()
 
+        if compression:
+            try:
+                self._communication.set_compression(self.COMPRESSION_LEVEL, self.COMPRESSION_THRESHOLD)
+            except ttexalens_server_bad_request:
+                util.WARN("TTExaLens server doesn't support compression. Continuing without compression.")
+
     def parse_uint32_t(self, buffer: bytes):
         if len(buffer) != 4:
             raise ConnectionError()
@@ -332,27 +616,155 @@ class ttexalens_client(TTExaLensCommunicator):
     def parse_string(self, buffer: bytes):
         return buffer.decode()
 
+    def parse_bytes_written(self, buffer: bytes, expected_size: int):
+        bytes_written = self.parse_uint32_t(buffer)
+        if bytes_written != expected_size:
+            raise ValueError(f"Expected {expected_size} bytes written, but {bytes_written} were written")
+        return bytes_written
+
+    def parse_bytes_read(self, buffer: bytes, expected_size: int):
+        if len(buffer) != expected_size:
+            raise ValueError(f"Expected {expected_size} bytes read, but {len(buffer)} were read")
+        return buffer
+
+    def parse_poll32(self, buffer: bytes):
+        # Response contains last read value and number of reads
+        if len(buffer) != 8:
+            raise ConnectionError()
+        return struct.unpack("<II", buffer)
+
+    def parse_gather(self, buffer: bytes, count: int, size: int):
+        # Response contains results of all cores concatenated in order of requested cores
+        self.parse_bytes_read(buffer, count * size)
+        return [buffer[i * size : (i + 1) * size] for i in range(count)]
+
     def pci_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
-        return self.parse_uint32_t(self._communication.pci_read32(chip_id, noc_x, noc_y, address))
+        return self.pci_read32_async(chip_id, noc_x, noc_y, address).result()
 
     def pci_write32(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
-        buffer = self._communication.pci_write32(chip_id, noc_x, noc_y, address, data)
-        bytes_written = self.parse_uint32_t(buffer)
-        if bytes_written != 4:
-            raise ValueError(f"Expected 4 bytes written, but {bytes_written} were written")
-        return bytes_written
+        return self.pci_write32_async(chip_id, noc_x, noc_y, address, data).result()
 
     def pci_read(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int):
-        buffer = self._communication.pci_read(chip_id, noc_x, noc_y, address, size)
-        if len(buffer) != size:
-            raise ValueError(f"Expected {size} bytes read, but {len(buffer)} were read")
-        return buffer
+        return self.pci_read_async(chip_id, noc_x, noc_y, address, size).result()
 
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
-        bytes_written = self.parse_uint32_t(self._communication.pci_write(chip_id, noc_x, noc_y, address, data))
-        if bytes_written != len(data):
-            raise ValueError(f"Expected {len(data)} bytes written, but {bytes_written} were written")
-        return bytes_written
+        return self.pci_write_async(chip_id, noc_x, noc_y, address, data).result()
+
+    def pci_read_into(self, chip_id: int, noc_x: int, noc_y: int, address: int, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        view[:] = self.parse_bytes_read(
+            self._communication.pci_read_view(chip_id, noc_x, noc_y, address, view.nbytes), view.nbytes
+        )
+        return view.nbytes
+
+    def pci_read_stream(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        size: int,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        window: int = STREAM_WINDOW,
+    ) -> Iterator[bytes]:
+        # Keeps at most window chunk requests in flight, so memory used on both sides is bounded by window * chunk_size
+        # no matter how big the read is. Without pipelining every chunk is completed before the next one is requested.
+        pending = deque()
+        offset = 0
+        try:
+            while offset < size or pending:
+                while offset < size and len(pending) < window:
+                    chunk = min(chunk_size, size - offset)
+                    pending.append(self.pci_read_async(chip_id, noc_x, noc_y, address + offset, chunk))
+                    offset += chunk
+                yield pending.popleft().result()
+        finally:
+            # Drain chunks that were requested but not consumed, so that their responses don't stay in the socket
+            for future in pending:
+                future.exception()
+
+    def pci_read_gather(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int) -> "list[bytes]":
+        return self.pci_read_gather_async(chip_id, cores, address, size).result()
+
+    def pci_write_scatter(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes) -> int:
+        return self.pci_write_scatter_async(chip_id, cores, address, data).result()
+
+    def pci_poll32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        mask: int,
+        expected: int,
+        timeout_ms: int,
+        interval_us: int = 0,
+    ) -> "tuple[int, int]":
+        return self.parse_poll32(
+            self._communication.pci_poll32(chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us)
+        )
+
+    def pci_poll32_raw(
+        self, chip_id: int, address: int, mask: int, expected: int, timeout_ms: int, interval_us: int = 0
+    ) -> "tuple[int, int]":
+        return self.parse_poll32(
+            self._communication.pci_poll32_raw(chip_id, address, mask, expected, timeout_ms, interval_us)
+        )
+
+    def pci_sample32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        duration_ms: int,
+        interval_us: int = 0,
+        max_values: int = SAMPLE_MAX_VALUES,
+    ) -> SampleResult:
+        # Long sampling is split into multiple requests, so that other requests to the chip are served in between
+        start = time.monotonic()
+        result = None
+        remaining_ms = duration_ms
+        while result is None or remaining_ms > 0:
+            request_ms = min(remaining_ms, SAMPLE_REQUEST_MAX_DURATION_MS)
+            offset_us = int((time.monotonic() - start) * 1000000)
+            sample = SampleResult.parse(
+                self._communication.pci_sample32(chip_id, noc_x, noc_y, address, request_ms, interval_us, max_values)
+            )
+            if result is None:
+                result = sample
+            else:
+                result.extend(sample, offset_us, max_values)
+            remaining_ms -= request_ms
+        return result
+
+    # Async versions of device requests return futures. When client is created with pipelined=True, multiple requests
+    # can be in flight at the same time and latency of the connection is paid only once for all of them.
+    def pci_read32_async(self, chip_id: int, noc_x: int, noc_y: int, address: int) -> Future:
+        request = self._communication.pack_pci_read32(chip_id, noc_x, noc_y, address)
+        return self._communication.request_async(request, self.parse_uint32_t)
+
+    def pci_write32_async(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int) -> Future:
+        request = self._communication.pack_pci_write32(chip_id, noc_x, noc_y, address, data)
+        return self._communication.request_async(request, lambda buffer: self.parse_bytes_written(buffer, 4))
+
+    def pci_read_async(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> Future:
+        request = self._communication.pack_pci_read(chip_id, noc_x, noc_y, address, size)
+        return self._communication.request_async(request, lambda buffer: self.parse_bytes_read(buffer, size))
+
+    def pci_write_async(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes) -> Future:
+        request = self._communication.pack_pci_write(chip_id, noc_x, noc_y, address, data)
+        return self._communication.request_async(request, lambda buffer: self.parse_bytes_written(buffer, len(data)))
+
+    def pci_read_gather_async(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int) -> Future:
+        request = self._communication.pack_pci_read_gather(chip_id, cores, address, size)
+        return self._communication.request_async(request, lambda buffer: self.parse_gather(buffer, len(cores), size))
+
+    def pci_write_scatter_async(
+        self, chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes
+    ) -> Future:
+        request = self._communication.pack_pci_write_scatter(chip_id, cores, address, data)
+        return self._communication.request_async(request, lambda buffer: self.parse_bytes_written(buffer, len(data)))
 
     def pci_read32_raw(self, chip_id: int, address: int):
         return self.parse_uint32_t(self._communication.pci_read32_raw(chip_id, address))
@@ -399,6 +811,9 @@ class ttexalens_client(TTExaLensCommunicator):
         binary_content = self._communication.get_file(binary_path)
         return io.BytesIO(binary_content)
 
+    def get_server_statistics(self, reset: bool = False) -> "list[dict]":
+        return yaml.safe_load(self.parse_string(self._communication.get_statistics(reset)))
+
     def arc_msg(self, device_id: int, msg_code: int, wait_for_done: bool, arg0: int, arg1: int, timeout: int):
         return self.parse_uint32_t(self._communication.arc_msg(device_id, msg_code, wait_for_done, arg0, arg1, timeout))
 
@@ -414,6 +829,41 @@ class ttexalens_client(TTExaLensCommunicator):
     def jtag_write32_axi(self, chip_id: int, address: int, data: int):
         return self.parse_uint32_t(self._communication.jtag_write32_axi(chip_id, address, data))
 
+    def submit_batch(self, operations: list) -> list:
+        return self.submit_batch_async(operations).result()
+
+    def submit_batch_async(self, operations: list) -> Future:
+        requests = []
+        for operation in operations:
+            if operation[0] not in BATCH_OPERATIONS:
+                raise ValueError(f"Operation {operation[0]} is not supported in batch")
+            requests.append(getattr(self._communication, f"pack_{operation[0]}")(*operation[1:]))
+        request = self._communication.pack_batch(requests)
+        return self._communication.request_async(request, lambda buffer: self.parse_batch(operations, buffer))
+
+    def parse_batch(self, operations: list, buffer: bytes):
+        # Response contains status, size and data of every operation; result of failed operation is None
+        results = []
+        offset = 0
+        for operation in operations:
+            if len(buffer) < offset + 5:
+                raise ConnectionError()
+            status, size = struct.unpack_from("<BI", buffer, offset)
+            offset += 5
+            data = buffer[offset : offset + size]
+            offset += size
+            if status != 0:
+                results.append(None)
+            elif operation[0] == "pci_read":
+                results.append(self.parse_bytes_read(data, operation[5]))
+            elif operation[0] == "pci_read32":
+                results.append(self.parse_uint32_t(data))
+            elif operation[0] == "pci_write32":
+                results.append(self.parse_bytes_written(data, 4))
+            else:
+                results.append(self.parse_bytes_written(data, len(operation[5])))
+        return results
+
 
 ttexalens_pybind_path = util.application_path() + "/../build/lib"
 binary_path = util.application_path() + "/../build/bin"
@@ -450,6 +900,53 @@ class TTExaLensPybind(TTExaLensCommunicator):
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
         return self._check_result(ttexalens_pybind.pci_write(chip_id, noc_x, noc_y, address, data, len(data)))
 
+    def pci_read_into(self, chip_id: int, noc_x: int, noc_y: int, address: int, buffer) -> int:
+        return self._check_result(ttexalens_pybind.pci_read_into(chip_id, noc_x, noc_y, address, buffer))
+
+    def pci_read_gather(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int) -> "list[bytes]":
+        return self._check_result(ttexalens_pybind.pci_read_gather(chip_id, cores, address, size))
+
+    def pci_write_scatter(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes) -> int:
+        return self._check_result(ttexalens_pybind.pci_write_scatter(chip_id, cores, address, data, len(data)))
+
+    def pci_poll32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        mask: int,
+        expected: int,
+        timeout_ms: int,
+        interval_us: int = 0,
+    ) -> "tuple[int, int]":
+        return self._check_result(
+            ttexalens_pybind.pci_poll32(chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us)
+        )
+
+    def pci_poll32_raw(
+        self, chip_id: int, address: int, mask: int, expected: int, timeout_ms: int, interval_us: int = 0
+    ) -> "tuple[int, int]":
+        return self._check_result(
+            ttexalens_pybind.pci_poll32_raw(chip_id, address, mask, expected, timeout_ms, interval_us)
+        )
+
+    def pci_sample32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        duration_ms: int,
+        interval_us: int = 0,
+        max_values: int = SAMPLE_MAX_VALUES,
+    ) -> SampleResult:
+        return SampleResult.parse(
+            self._check_result(
+                ttexalens_pybind.pci_sample32(chip_id, noc_x, noc_y, address, duration_ms, interval_us, max_values)
+            )
+        )
+
     def pci_read32_raw(self, chip_id: int, address: int):
         return self._check_result(ttexalens_pybind.pci_read32_raw(chip_id, address))
 
@@ -505,6 +1002,9 @@ class TTExaLensPybind(TTExaLensCommunicator):
             raise Exception("Unaligned access in jtag_write32_axi")
         return self._check_result(ttexalens_pybind.jtag_write32_axi(chip_id, address, data))
 
+    def submit_batch(self, operations: list) -> list:
+        return self._check_result(ttexalens_pybind.submit_batch(operations))
+
     def get_file(self, file_path: str) -> str:
         content = None
         with open(file_path, "r") as f:
@@ -528,12 +1028,12 @@ def init_pybind(wanted_devices=None, init_jtag=False, use_noc1=False):
 
 
 # Spawns ttexalens-server and initializes the communication
-def connect_to_server(ip="localhost", port=5555):
+def connect_to_server(ip="localhost", port=5555, pipelined=False, compression=False):
     ttexalens_stub_address = f"tcp://{ip}:{port}"
     util.VERBOSE(f"Connecting to ttexalens-server at {ttexalens_stub_address}...")
 
     try:
-        communicator = ttexalens_client(ip, port)
+        communicator = ttexalens_client(ip, port, pipelined, compression)
         util.VERBOSE("Connected to ttexalens-server.")
     except:
         raise util.TTFatalException("Failed to connect to TTExaLens server.")
@@ -2,15 +2,250 @@
 
 # SPDX-License-Identifier: Apache-2.0
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import functools
 import io
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Iterator
+
+# Operations that can be submitted in a batch with TTExaLensCommunicator.submit_batch
+BATCH_OPERATIONS = ("pci_read32", "pci_write32", "pci_read", "pci_write")
+
+# Default size of one chunk and number of chunks in flight for TTExaLensCommunicator.pci_read_stream
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_WINDOW = 4
+
+# Methods whose calls are counted by TransactionStatistics when implemented by TTExaLensCommunicator subclass
+TRANSACTION_METHODS = (
+    "pci_read32",
+    "pci_write32",
+    "pci_read",
+    "pci_write",
+    "pci_read_into",
+    "pci_read_gather",
+    "pci_write_scatter",
+    "pci_poll32",
+    "pci_poll32_raw",
+    "pci_sample32",
+    "pci_read32_raw",
+    "pci_write32_raw",
+    "dma_buffer_read32",
+    "pci_read_tile",
+    "jtag_read32",
+    "jtag_write32",
+    "jtag_read32_axi",
+    "jtag_write32_axi",
+    "arc_msg",
+    "submit_batch",
+)
+
+
+# Maximum number of different values counted by pci_sample32 when caller doesn't specify it
+SAMPLE_MAX_VALUES = 65536
+
+
+@dataclass
+class SampleResult:
+    """
+    Result of sampling a 32-bit value. Values is list of (value, count, first_us, last_us) tuples sorted by value,
+    where timestamps are in microseconds since the first read. Dropped is number of reads of values that were not
+    counted because max_values different values were already seen.
+    """
+
+    samples: int
+    elapsed_us: int
+    dropped: int
+    values: "list[tuple[int, int, int, int]]"
+
+    _HEADER = struct.Struct("<QQQI")
+    _VALUE = struct.Struct("<IQQQ")
+
+    @staticmethod
+    def parse(buffer: bytes) -> "SampleResult":
+        # Buffer contains header followed by value entries, same layout as server response to pci_sample32 request
+        header = SampleResult._HEADER
+        if len(buffer) < header.size:
+            raise ConnectionError()
+        samples, elapsed_us, dropped, count = header.unpack_from(buffer)
+        if len(buffer) != header.size + count * SampleResult._VALUE.size:
+            raise ConnectionError()
+        values = list(SampleResult._VALUE.iter_unpack(memoryview(buffer)[header.size :]))
+        return SampleResult(samples, elapsed_us, dropped, values)
+
+    def extend(self, other: "SampleResult", offset_us: int, max_values: int) -> None:
+        """
+        Adds reads of other sampling that started offset_us after this one. Reads of new values are counted as dropped
+        when max_values different values were already seen.
+        """
+        values = {value: [count, first_us, last_us] for value, count, first_us, last_us in self.values}
+        for value, count, first_us, last_us in other.values:
+            if value in values:
+                values[value][0] += count
+                values[value][2] = offset_us + last_us
+            elif len(values) < max_values:
+                values[value] = [count, offset_us + first_us, offset_us + last_us]
+            else:
+                self.dropped += count
+        self.samples += other.samples
+        self.dropped += other.dropped
+        self.elapsed_us = offset_us + other.elapsed_us
+        self.values = [(value, *statistics) for value, statistics in sorted(values.items())]
+
+    @staticmethod
+    def sample(read: Callable[[], int], duration_ms: int, interval_us: int, max_values: int) -> "SampleResult":
+        """
+        Calls read for duration_ms, starting a new read every interval_us (as fast as possible when 0), and counts
+        read values.
+        """
+        values: "dict[int, list[int]]" = {}
+        samples = 0
+        dropped = 0
+        start = time.monotonic()
+        deadline = start + duration_ms / 1000
+        next_sample = start
+        while True:
+            value = read()
+            now = time.monotonic()
+            timestamp_us = int((now - start) * 1000000)
+            samples += 1
+            if value in values:
+                values[value][0] += 1
+                values[value][2] = timestamp_us
+            elif len(values) < max_values:
+                values[value] = [1, timestamp_us, timestamp_us]
+            else:
+                dropped += 1
+            if interval_us > 0:
+                next_sample += interval_us / 1000000
+                time.sleep(max(0, next_sample - now))
+                now = time.monotonic()
+            if now >= deadline:
+                break
+        values_list = [(value, *statistics) for value, statistics in sorted(values.items())]
+        return SampleResult(samples, int((now - start) * 1000000), dropped, values_list)
+
+
+class TransactionStatistics:
+    """
+    Counts transactions issued through a communicator, grouped by tt_exalens_lib function that issued them and by
+    operation. Transactions issued outside of tt_exalens_lib are attributed to OTHER_CALLER. Calls that communicator
+    makes to itself while executing transaction are not counted again. Counting is disabled by default, since finding
+    the caller requires walking the stack.
+    """
+
+    LIB_MODULE = "ttexalens.tt_exalens_lib"
+    OTHER_CALLER = "<other>"
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters: "dict[tuple[str, str], list]" = {}
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+
+    def snapshot(self) -> "list[dict]":
+        """
+        Returns list of counters sorted by caller and operation. Every counter is dictionary with caller, operation,
+        count, bytes and time (in seconds) keys.
+        """
+        with self._lock:
+            return [
+                {"caller": caller, "operation": operation, "count": count, "bytes": size, "time": elapsed}
+                for (caller, operation), (count, size, elapsed) in sorted(self._counters.items())
+            ]
+
+    def record(self, caller: str, operation: str, size: int, elapsed: float):
+        with self._lock:
+            counter = self._counters.setdefault((caller, operation), [0, 0, 0.0])
+            counter[0] += 1
+            counter[1] += size
+            counter[2] += elapsed
+
+    def find_caller(self) -> str:
+        # Outermost tt_exalens_lib function on the stack is the one that user called
+        caller = self.OTHER_CALLER
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_globals.get("__name__") == self.LIB_MODULE:
+                caller = frame.f_code.co_name
+            frame = frame.f_back
+        return caller
+
+    @staticmethod
+    def transaction_size(operation: str, args: tuple, result) -> int:
+        # Number of data bytes moved by transaction
+        if isinstance(result, (bytes, bytearray, memoryview)):
+            return memoryview(result).nbytes
+        if operation == "pci_read_into":
+            return result
+        if operation == "pci_read_gather":
+            return sum(len(data) for data in result)
+        if operation == "pci_write":
+            return len(args[4])
+        if operation == "pci_write_scatter":
+            return len(args[3]) * len(args[1])
+        if operation == "pci_read_tile":
+            return args[4]
+        if operation == "pci_sample32":
+            return 4 * result.samples
+        if "32" in operation:
+            return 4
+        return 0
+
+    def count(self, operation: str, method, communicator, args: tuple, kwargs: dict):
+        depth = getattr(self._local, "depth", 0)
+        if depth > 0:
+            return method(communicator, *args, **kwargs)
+        caller = self.find_caller()
+        result = None
+        start = time.perf_counter()
+        self._local.depth = depth + 1
+        try:
+            result = method(communicator, *args, **kwargs)
+            return result
+        finally:
+            self._local.depth = depth
+            try:
+                size = self.transaction_size(operation, args, result) if result is not None else 0
+            except (IndexError, TypeError):
+                size = 0
+            self.record(caller, operation, size, time.perf_counter() - start)
+
+
+def _count_transactions(operation: str, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        statistics = getattr(self, "statistics", None)
+        if statistics is None or not statistics.enabled:
+            return method(self, *args, **kwargs)
+        return statistics.count(operation, method, self, args, kwargs)
+
+    return wrapper
 
 
 class TTExaLensCommunicator(ABC):
     """
     Base class for the TTExaLens interfaces. It defines the high-level methods that must be implemented for TTExaLens to
     communicate with the target device. They are later derived to communicate with server, use pybind or read from cache.
+
+    Transaction methods implemented by derived classes are counted by statistics object, once it is enabled.
     """
 
+    def __init__(self):
+        self.statistics = TransactionStatistics()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for operation in TRANSACTION_METHODS:
+            if operation in cls.__dict__:
+                setattr(cls, operation, _count_transactions(operation, cls.__dict__[operation]))
+
     @abstractmethod
     def pci_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
         pass
@@ -27,6 +262,111 @@ class TTExaLensCommunicator(ABC):
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
         pass
 
+    def pci_read_stream(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        size: int,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        window: int = STREAM_WINDOW,
+    ) -> Iterator[bytes]:
+        """
+        Reads size bytes in chunks of at most chunk_size bytes and yields them in order, so that large reads never hold
+        the whole result in memory. Window is the number of chunks that may be requested before the consumer reads
+        them. It is used only by communicators that can have multiple requests in flight.
+        """
+        for offset in range(0, size, chunk_size):
+            yield self.pci_read(chip_id, noc_x, noc_y, address + offset, min(chunk_size, size - offset))
+
+    def pci_poll32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        mask: int,
+        expected: int,
+        timeout_ms: int,
+        interval_us: int = 0,
+    ) -> "tuple[int, int]":
+        """
+        Reads 32-bit value until (value & mask) == expected or until timeout_ms expires, waiting interval_us between
+        reads. Returns tuple of last read value and number of reads. Caller detects timeout by checking the condition on
+        returned value. Communicators that can poll next to the device should override this method.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        iterations = 0
+        while True:
+            value = self.pci_read32(chip_id, noc_x, noc_y, address)
+            iterations += 1
+            if (value & mask) == expected or time.monotonic() >= deadline:
+                return value, iterations
+            if interval_us > 0:
+                time.sleep(interval_us / 1000000)
+
+    def pci_poll32_raw(
+        self, chip_id: int, address: int, mask: int, expected: int, timeout_ms: int, interval_us: int = 0
+    ) -> "tuple[int, int]":
+        """
+        Same as pci_poll32, but reads raw PCI (BAR) address of MMIO capable chip with pci_read32_raw. Communicators that
+        can poll next to the device should override this method.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        iterations = 0
+        while True:
+            value = self.pci_read32_raw(chip_id, address)
+            iterations += 1
+            if (value & mask) == expected or time.monotonic() >= deadline:
+                return value, iterations
+            if interval_us > 0:
+                time.sleep(interval_us / 1000000)
+
+    def pci_sample32(
+        self,
+        chip_id: int,
+        noc_x: int,
+        noc_y: int,
+        address: int,
+        duration_ms: int,
+        interval_us: int = 0,
+        max_values: int = SAMPLE_MAX_VALUES,
+    ) -> SampleResult:
+        """
+        Reads 32-bit value for duration_ms, starting a new read every interval_us (as fast as possible when 0), and
+        counts how many times every value was read. Communicators that can sample next to the device should override
+        this method.
+        """
+        return SampleResult.sample(
+            lambda: self.pci_read32(chip_id, noc_x, noc_y, address), duration_ms, interval_us, max_values
+        )
+
+    def pci_read_into(self, chip_id: int, noc_x: int, noc_y: int, address: int, buffer) -> int:
+        """
+        Reads len(buffer) bytes into caller provided writable buffer (bytearray, memoryview, numpy array...) and returns
+        number of bytes read. Communicators that can read directly into the buffer should override this method.
+        """
+        view = memoryview(buffer).cast("B")
+        view[:] = self.pci_read(chip_id, noc_x, noc_y, address, view.nbytes)
+        return view.nbytes
+
+    def pci_read_gather(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, size: int) -> "list[bytes]":
+        """
+        Reads size bytes from the same address on every core in cores (list of (noc_x, noc_y) tuples) and returns list
+        of results in the same order. Communicators that can read all cores in a single call should override this method.
+        """
+        return [self.pci_read(chip_id, noc_x, noc_y, address, size) for noc_x, noc_y in cores]
+
+    def pci_write_scatter(self, chip_id: int, cores: "list[tuple[int, int]]", address: int, data: bytes) -> int:
+        """
+        Writes data to the same address on every core in cores (list of (noc_x, noc_y) tuples) and returns number of
+        bytes written to each core. Communicators that can write all cores in a single call should override this method.
+        """
+        for noc_x, noc_y in cores:
+            self.pci_write(chip_id, noc_x, noc_y, address, data)
+        return len(data)
+
     @abstractmethod
     def pci_read32_raw(self, chip_id: int, address: int):
         pass
@@ -87,5 +427,33 @@ class TTExaLensCommunicator(ABC):
     def jtag_write32_axi(self, chip_id: int, address: int, data: int):
         pass
 
+    def submit_batch(self, operations: list) -> list:
+        """
+        Executes a list of independent operations and returns the list of their results. Every operation is a tuple
+        whose first element is the name of the method (one of BATCH_OPERATIONS) followed by its arguments, e.g.
+        ("pci_read32", chip_id, noc_x, noc_y, address). Communicators that have a per-call overhead should override
+        this method to execute all operations at once. Result of every operation that failed is None, so that results
+        of other operations are still available.
+        """
+        for operation in operations:
+            if operation[0] not in BATCH_OPERATIONS:
+                raise ValueError(f"Operation {operation[0]} is not supported in batch")
+        results = []
+        for operation in operations:
+            try:
+                results.append(getattr(self, operation[0])(*operation[1:]))
+            except Exception:
+                results.append(None)
+        return results
+
+    def get_server_statistics(self, reset: bool = False) -> "list[dict] | None":
+        """
+        Returns statistics of requests processed by TTExaLens server, one dictionary for every chip and request type
+        with chip_id (-1 if request doesn't target single chip), type, count, request_bytes, response_bytes,
+        total_latency_us, p50_latency_us and p99_latency_us keys. If reset is True, server statistics are cleared.
+        Communicators that don't talk to the server return None.
+        """
+        return None
+
     def using_cache(self) -> bool:
         return False
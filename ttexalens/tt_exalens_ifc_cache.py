@@ -2,49 +2,706 @@
 
 # SPDX-License-Identifier: Apache-2.0
 import atexit
+import functools
+import hashlib
 import io
+import mmap
 import os
 import pickle
+import struct
+import threading
+import time
+import zlib
 
-from ttexalens.tt_exalens_ifc_base import TTExaLensCommunicator
+from collections import OrderedDict
+
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ttexalens.tt_exalens_ifc_base import SAMPLE_MAX_VALUES, TTExaLensCommunicator
 from ttexalens import util as util
 
 
 """
 This module provides a cache for the TTExaLens interface. It can be used to store the results of device communications,
 or load state from the previous run. This is useful when the device is not available.
+
+Cache file is an append-only log of records, so recording uses constant memory and survives a crash of the recording
+process. Index file next to it (cache file path + ".idx") maps hash of every key to its record, so reader can look up
+records in memory mapped files without loading the whole cache. Results of pci_read and pci_read32 are also indexed by
+address range, so reader can serve any read of data covered by recorded reads.
+
+Large bytes and str results (files, binaries, bulk reads) are stored as blobs: data is compressed and stored only once,
+under its hash, and every record with the same data refers to that blob.
+
+When timing is recorded, every result record is followed by a timing record with the time when the call was made and
+how long the device took to return the result. Reader can replay calls with the recorded latency, so that commands can
+be benchmarked without the device.
+
+Layout (all integers are little endian):
+  cache file: magic b"TTLXCACH", format version (uint32), records
+  record:     kind (uint8), key size (uint32), value size (uint32), key, value
+              kind 0 (value):     key is pickled (function name, arguments), value is pickled result
+              kind 1 (blob):      key is hash of data, value is zlib compressed data
+              kind 2 (bytes ref): key is pickled (function name, arguments), value is hash of blob with bytes result
+              kind 3 (str ref):   key is pickled (function name, arguments), value is hash of blob with utf-8 str result
+              kind 4 (timing):    key is empty, value is time of the call since recording started and its latency, in
+                                  seconds (two doubles), of the preceding record
+  index file: magic b"TTLXCIDX", index version (uint32), number of key entries (uint32), size of cache file covered by
+              index (uint64), number of range entries (uint32), size of the largest range (uint64), number of blobs
+              (uint32),
+              key entries (results and blobs) sorted by hash: key hash (uint64), record offset (uint64),
+              range entries sorted by core and address: chip id, noc x, noc y (uint32), address, size, record offset
+              (uint64)
+Old cache files that contain a single pickled dictionary can still be read.
 """
 
+CACHE_MAGIC = b"TTLXCACH"
+CACHE_INDEX_MAGIC = b"TTLXCIDX"
+CACHE_VERSION = 3
+CACHE_INDEX_VERSION = 3
+
+# bytes and str results of at least this size are stored as blobs
+CACHE_BLOB_MIN_SIZE = 4096
+
+# Fast compression level, because blobs are compressed while device is being accessed
+CACHE_BLOB_COMPRESSION_LEVEL = 1
+
+# Pickle protocol is fixed, so that keys pickled by different Python versions are equal
+_PICKLE_PROTOCOL = 4
+
+# Cached reads are indexed by pages of this size, so that writes find reads they overlap without checking all of them
+_READ_CACHE_PAGE_SIZE = 4096
+
+# Debug, NOC and overlay registers of every core start at this address. Some of them change by themselves and some
+# select what others return (e.g. debug bus and configuration register reads), so they are never cached.
+_REGISTER_SPACE_START = 0xFFB00000
+_REGISTER_SPACE_END = 0x100000000
+
+_RECORD_VALUE = 0
+_RECORD_BLOB = 1
+_RECORD_BYTES_REF = 2
+_RECORD_STR_REF = 3
+_RECORD_TIMING = 4
+
+_HEADER = struct.Struct("<8sI")
+_RECORD_HEADER = struct.Struct("<BII")
+_INDEX_HEADER = struct.Struct("<8sIIQIQI")
+_INDEX_ENTRY = struct.Struct("<QQ")
+_RANGE_ENTRY = struct.Struct("<IIIQQQ")
+_TIMING = struct.Struct("<dd")
+
+
+def _key_bytes(key: Tuple) -> bytes:
+    return pickle.dumps(key, protocol=_PICKLE_PROTOCOL)
+
+
+def _key_hash(key_bytes: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+def _blob_hash(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def _read_range(key: Tuple) -> Optional[Tuple[int, int, int, int, int]]:
+    # Returns (chip_id, noc_x, noc_y, address, size) of memory read by the call, or None if call is not a read
+    name, args = key
+    if name == "pci_read" and len(args) == 5:
+        return tuple(args)
+    if name == "pci_read32" and len(args) == 4:
+        return (*args, 4)
+    return None
+
+
+def _overlaps(read_range: Tuple[int, int], address: int, size: int) -> bool:
+    # True if (address, size) read range overlaps [address, address + size)
+    return read_range[0] < address + size and address < read_range[0] + read_range[1]
+
+
+def _read_data(key: Tuple, value: Any) -> bytes:
+    # Returns memory read by the call, as bytes
+    if key[0] == "pci_read32":
+        return value.to_bytes(4, "little")
+    return bytes(value)
+
+
+def _build_index(
+    offsets: Dict[bytes, int], ranges: List[Tuple[int, int, int, int, int, int]]
+) -> Tuple[bytes, bytes, int]:
+    # Returns packed key entries, packed range entries and size of the largest range
+    entries = sorted((_key_hash(key_bytes), offset) for key_bytes, offset in offsets.items())
+    ranges = sorted(ranges)
+    max_range_size = max((entry[4] for entry in ranges), default=0)
+    return (
+        b"".join(_INDEX_ENTRY.pack(key_hash, offset) for key_hash, offset in entries),
+        b"".join(_RANGE_ENTRY.pack(*entry) for entry in ranges),
+        max_range_size,
+    )
+
+
+def _write_index(
+    index_path: str,
+    offsets: Dict[bytes, int],
+    ranges: List[Tuple[int, int, int, int, int, int]],
+    blob_count: int,
+    log_size: int,
+) -> None:
+    entries, ranges, max_range_size = _build_index(offsets, ranges)
+    with open(index_path, "wb") as f:
+        f.write(
+            _INDEX_HEADER.pack(
+                CACHE_INDEX_MAGIC,
+                CACHE_INDEX_VERSION,
+                len(entries) // _INDEX_ENTRY.size,
+                log_size,
+                len(ranges) // _RANGE_ENTRY.size,
+                max_range_size,
+                blob_count,
+            )
+        )
+        f.write(entries)
+        f.write(ranges)
+
+
+class CacheLogWriter:
+    """
+    Appends records to cache file. Every record is flushed to the file as soon as it is added. Index is written when
+    writer is closed; if recording process crashes, reader rebuilds it from the records.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._file = open(filepath, "wb")
+        self._file.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION))
+        self._offsets: Dict[bytes, int] = {}  # Pickled key or blob hash => offset of its last record
+        self._ranges: List[Tuple[int, int, int, int, int, int]] = []  # Read range and offset of every read record
+        self._blob_count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - self._blob_count
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _write_record(self, kind: int, key: bytes, value: bytes) -> int:
+        offset = self._file.tell()
+        self._file.write(_RECORD_HEADER.pack(kind, len(key), len(value)))
+        self._file.write(key)
+        self._file.write(value)
+        self._offsets[key] = offset
+        return offset
+
+    def _write_timing(self, timing: Optional[Tuple[float, float]]) -> None:
+        # Timing record belongs to the record written before it, so it is not indexed
+        if timing is not None:
+            self._file.write(_RECORD_HEADER.pack(_RECORD_TIMING, 0, _TIMING.size))
+            self._file.write(_TIMING.pack(*timing))
+
+    def append(self, key: Tuple, value: Any, timing: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Appends result of a call. Timing is optional (timestamp, latency) of the call, in seconds.
+        """
+        key_bytes = _key_bytes(key)
+        read_range = _read_range(key)
+        if isinstance(value, (bytes, bytearray, str)) and len(value) >= CACHE_BLOB_MIN_SIZE:
+            kind = _RECORD_STR_REF if isinstance(value, str) else _RECORD_BYTES_REF
+            data = value.encode() if isinstance(value, str) else bytes(value)
+            blob_hash = _blob_hash(data)
+            with self._lock:
+                if blob_hash not in self._offsets:
+                    self._write_record(_RECORD_BLOB, blob_hash, zlib.compress(data, CACHE_BLOB_COMPRESSION_LEVEL))
+                    self._blob_count += 1
+                offset = self._write_record(kind, key_bytes, blob_hash)
+                self._write_timing(timing)
+                self._file.flush()
+                if read_range is not None:
+                    self._ranges.append((*read_range, offset))
+            return
+
+        value_bytes = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+        with self._lock:
+            offset = self._write_record(_RECORD_VALUE, key_bytes, value_bytes)
+            self._write_timing(timing)
+            self._file.flush()
+            if read_range is not None:
+                self._ranges.append((*read_range, offset))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            log_size = self._file.tell()
+            self._file.close()
+            _write_index(self.filepath + ".idx", self._offsets, self._ranges, self._blob_count, log_size)
+
+
+class CacheLogReader:
+    """
+    Looks up records of a cache file through its index. Both files are memory mapped, so only records that are looked
+    up are read from disk. Supports 'key in reader' and 'reader[key]', like the dictionary of old cache files.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._file = open(filepath, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version = _HEADER.unpack_from(self._mmap, 0)
+            if magic != CACHE_MAGIC:
+                raise util.TTException(f"{filepath} is not a TTExaLens cache file.")
+            if version != CACHE_VERSION:
+                raise util.TTException(f"Unsupported cache file version {version} in {filepath}.")
+            self._load_index()
+        except Exception:
+            self._file.close()
+            raise
+
+        # Decompressed blobs are kept for a while, since the same data is often read many times in a row
+        self._read_blob = functools.lru_cache(maxsize=8)(self._load_blob)
+
+    @staticmethod
+    def is_cache_log(filepath: str) -> bool:
+        with open(filepath, "rb") as f:
+            return f.read(len(CACHE_MAGIC)) == CACHE_MAGIC
+
+    def _load_index(self) -> None:
+        index_path = self.filepath + ".idx"
+        self._index_mmap = None
+        try:
+            with open(index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, log_size, range_count, max_range_size, blob_count = _INDEX_HEADER.unpack_from(
+                index, 0
+            )
+            if (
+                magic == CACHE_INDEX_MAGIC
+                and version == CACHE_INDEX_VERSION
+                and log_size == len(self._mmap)
+                and len(index) == _INDEX_HEADER.size + count * _INDEX_ENTRY.size + range_count * _RANGE_ENTRY.size
+            ):
+                self._index_mmap = index
+                self._set_index(memoryview(index)[_INDEX_HEADER.size :], count, range_count, max_range_size)
+                self._blob_count = blob_count
+                return
+            index.close()
+        except (OSError, ValueError, struct.error):
+            pass
+
+        # Index is missing, written by older version or doesn't cover all records (e.g. recording process crashed),
+        # so it is rebuilt
+        util.WARN(f"Rebuilding index of cache file {self.filepath}")
+        offsets, ranges, blob_count, log_size = self._scan_records()
+        if log_size != len(self._mmap):
+            util.WARN(f"Ignoring incomplete record at the end of cache file {self.filepath}")
+        try:
+            _write_index(index_path, offsets, ranges, blob_count, len(self._mmap))
+        except OSError:
+            util.WARN(f"Cannot write index file {index_path}")
+        entries, ranges, max_range_size = _build_index(offsets, ranges)
+        self._set_index(
+            memoryview(entries + ranges),
+            len(entries) // _INDEX_ENTRY.size,
+            len(ranges) // _RANGE_ENTRY.size,
+            max_range_size,
+        )
+        self._blob_count = blob_count
+
+    def _set_index(self, index: memoryview, count: int, range_count: int, max_range_size: int) -> None:
+        self._index = index[: count * _INDEX_ENTRY.size]
+        self._ranges = index[count * _INDEX_ENTRY.size :]
+        self._count = count
+        self._range_count = range_count
+        self._max_range_size = max_range_size
+
+    def _scan_records(self) -> Tuple[Dict[bytes, int], List[Tuple[int, int, int, int, int, int]], int, int]:
+        # Returns offset of the last record of every key, ranges of read records, number of blobs and size of
+        # complete records
+        offsets: Dict[bytes, int] = {}
+        ranges = []
+        blob_count = 0
+        offset = _HEADER.size
+        while offset + _RECORD_HEADER.size <= len(self._mmap):
+            kind, key_size, value_size = _RECORD_HEADER.unpack_from(self._mmap, offset)
+            end = offset + _RECORD_HEADER.size + key_size + value_size
+            if end > len(self._mmap):
+                break
+            key_start = offset + _RECORD_HEADER.size
+            key_bytes = self._mmap[key_start : key_start + key_size]
+            if kind == _RECORD_TIMING:
+                offset = end
+                continue
+            offsets[key_bytes] = offset
+            if kind == _RECORD_BLOB:
+                blob_count += 1
+            else:
+                read_range = _read_range(pickle.loads(key_bytes))
+                if read_range is not None:
+                    ranges.append((*read_range, offset))
+            offset = end
+        return offsets, ranges, blob_count, offset
+
+    def _find(self, key_bytes: bytes) -> int:
+        # Returns offset of the record with key, or -1 if key is not in the cache
+        key_hash = _key_hash(key_bytes)
+
+        # Binary search for the first entry with key hash
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _INDEX_ENTRY.unpack_from(self._index, middle * _INDEX_ENTRY.size)[0] < key_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        # Different keys can have the same hash, so keys of all entries with that hash are compared
+        while low < self._count:
+            entry_hash, offset = _INDEX_ENTRY.unpack_from(self._index, low * _INDEX_ENTRY.size)
+            if entry_hash != key_hash:
+                break
+            _, key_size, _ = _RECORD_HEADER.unpack_from(self._mmap, offset)
+            key_start = offset + _RECORD_HEADER.size
+            if self._mmap[key_start : key_start + key_size] == key_bytes:
+                return offset
+            low += 1
+        return -1
+
+    def _load_blob(self, blob_hash: bytes) -> bytes:
+        offset = self._find(blob_hash)
+        if offset < 0:
+            raise util.TTException(f"Cache file {self.filepath} is missing blob {blob_hash.hex()}.")
+        _, key_size, value_size = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        value_start = offset + _RECORD_HEADER.size + key_size
+        return zlib.decompress(self._mmap[value_start : value_start + value_size])
+
+    def _read_record(self, offset: int) -> Tuple[Tuple, Any]:
+        kind, key_size, value_size = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        key_start = offset + _RECORD_HEADER.size
+        value_start = key_start + key_size
+        key = pickle.loads(self._mmap[key_start:value_start])
+        value = self._mmap[value_start : value_start + value_size]
+        if kind == _RECORD_BYTES_REF:
+            return key, self._read_blob(value)
+        if kind == _RECORD_STR_REF:
+            return key, self._read_blob(value).decode()
+        return key, pickle.loads(value)
+
+    def _read_timing(self, offset: int) -> Optional[Tuple[float, float]]:
+        # Returns (timestamp, latency) from timing record that follows record at offset, if there is one
+        _, key_size, value_size = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        offset += _RECORD_HEADER.size + key_size + value_size
+        if offset + _RECORD_HEADER.size + _TIMING.size > len(self._mmap):
+            return None
+        kind, _, _ = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        if kind != _RECORD_TIMING:
+            return None
+        return _TIMING.unpack_from(self._mmap, offset + _RECORD_HEADER.size)
+
+    def lookup(self, key: Tuple) -> Tuple[Any, Optional[Tuple[float, float]]]:
+        """
+        Returns the last recorded result of a call and its (timestamp, latency), or None instead of timing if it was
+        not recorded. Raises KeyError if call is not in the cache.
+        """
+        offset = self._find(_key_bytes(key))
+        if offset < 0:
+            raise KeyError(key)
+        return self._read_record(offset)[1], self._read_timing(offset)
+
+    def timings(self) -> Iterator[Tuple[Tuple, float, float]]:
+        """
+        Yields (key, timestamp, latency) of every call with recorded timing, in the order calls were made.
+        """
+        offset = _HEADER.size
+        previous = None
+        while offset + _RECORD_HEADER.size <= len(self._mmap):
+            kind, key_size, value_size = _RECORD_HEADER.unpack_from(self._mmap, offset)
+            end = offset + _RECORD_HEADER.size + key_size + value_size
+            if end > len(self._mmap):
+                break
+            if kind == _RECORD_TIMING and previous is not None:
+                key_start = previous + _RECORD_HEADER.size
+                _, previous_key_size, _ = _RECORD_HEADER.unpack_from(self._mmap, previous)
+                key = pickle.loads(self._mmap[key_start : key_start + previous_key_size])
+                yield (key, *_TIMING.unpack_from(self._mmap, offset + _RECORD_HEADER.size))
+            previous = offset if kind in (_RECORD_VALUE, _RECORD_BYTES_REF, _RECORD_STR_REF) else None
+            offset = end
+
+    def read_memory(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> Optional[bytes]:
+        """
+        Returns memory of a core assembled from recorded reads that cover [address, address + size), or None if some
+        of the bytes were never read. Where recorded reads overlap, data of the latest one is used.
+        """
+        core = (chip_id, noc_x, noc_y)
+        end = address + size
+
+        # Binary search for the first range of the core that can overlap requested memory
+        start_key = (*core, max(0, address - self._max_range_size))
+        low, high = 0, self._range_count
+        while low < high:
+            middle = (low + high) // 2
+            if _RANGE_ENTRY.unpack_from(self._ranges, middle * _RANGE_ENTRY.size)[:4] < start_key:
+                low = middle + 1
+            else:
+                high = middle
+
+        pieces = []
+        while low < self._range_count:
+            entry = _RANGE_ENTRY.unpack_from(self._ranges, low * _RANGE_ENTRY.size)
+            if entry[:3] != core or entry[3] >= end:
+                break
+            if entry[3] + entry[4] > address:
+                pieces.append((entry[5], entry[3], entry[4]))
+            low += 1
+
+        # Check that pieces cover the whole range before reading any of them
+        covered_to = address
+        for _, piece_address, piece_size in sorted(pieces, key=lambda piece: piece[1]):
+            if piece_address > covered_to:
+                break
+            covered_to = max(covered_to, piece_address + piece_size)
+        if covered_to < end:
+            return None
+
+        # Pieces are applied in recording order, so later reads overwrite earlier ones
+        data = bytearray(size)
+        for offset, piece_address, piece_size in sorted(pieces):
+            key, value = self._read_record(offset)
+            piece = _read_data(key, value)
+            start = max(address, piece_address)
+            stop = min(end, piece_address + piece_size)
+            data[start - address : stop - address] = piece[start - piece_address : stop - piece_address]
+        return bytes(data)
+
+    def __len__(self) -> int:
+        return self._count - self._blob_count
+
+    def __contains__(self, key: Tuple) -> bool:
+        return self._find(_key_bytes(key)) >= 0
+
+    def __getitem__(self, key: Tuple) -> Any:
+        return self.lookup(key)[0]
+
+    def close(self) -> None:
+        self._index.release()
+        self._ranges.release()
+        if self._index_mmap is not None:
+            self._index_mmap.close()
+        self._mmap.close()
+        self._file.close()
+
+
+class ReadCache:
+    """
+    Results of pci_read and pci_read32 kept in memory, so that repeated reads are served without the device. Every
+    write invalidates cached reads that overlap its address range. Only reads that fit in a memory region (plain L1 or
+    DRAM memory, see add_memory_region) are cached. Reads that overlap a volatile region (register space of every core,
+    mailboxes, anything the device changes by itself) are never cached. Least recently used reads are dropped when
+    cached data exceeds max_size bytes.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        self.max_size = max_size
+        self._reads: "OrderedDict[Tuple, Tuple[Tuple[int, int, int, int, int], Any]]" = OrderedDict()
+        self._pages: Dict[Tuple[int, int, int, int], Set[Tuple]] = {}  # (chip, x, y, page) => keys of cached reads
+        self._size = 0
+        self._memory_regions: Dict[Optional[Tuple[int, int, int]], List[Tuple[int, int]]] = {}
+        self._volatile_regions: List[Tuple[Optional[Tuple[int, int, int]], int, int]] = [
+            (None, _REGISTER_SPACE_START, _REGISTER_SPACE_END - _REGISTER_SPACE_START)
+        ]
+        self._generation = 0  # Incremented on every invalidation
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._reads)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def add_memory_region(self, address: int, size: int, core: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Marks [address, address + size) of a core, given as (chip_id, noc_x, noc_y), or of every core if core is
+        None, as plain memory whose reads can be cached.
+        """
+        with self._lock:
+            regions = self._memory_regions.setdefault(core, [])
+            if (address, size) not in regions:
+                regions.append((address, size))
+
+    def is_memory(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> bool:
+        for core in ((chip_id, noc_x, noc_y), None):
+            for region_address, region_size in self._memory_regions.get(core, ()):
+                if region_address <= address and address + size <= region_address + region_size:
+                    return True
+        return False
+
+    def add_volatile_region(self, address: int, size: int, core: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Marks [address, address + size) of a core, given as (chip_id, noc_x, noc_y), or of every core if core is
+        None, as never cached, even if it is in a memory region. Cached reads of the region are dropped.
+        """
+        with self._lock:
+            if (core, address, size) in self._volatile_regions:
+                return
+            self._volatile_regions.append((core, address, size))
+            self._invalidate(core, address, size)
+
+    def is_volatile(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> bool:
+        for core, region_address, region_size in self._volatile_regions:
+            if (
+                (core is None or core == (chip_id, noc_x, noc_y))
+                and address < region_address + region_size
+                and region_address < address + size
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _range_pages(read_range: Tuple[int, int, int, int, int]) -> range:
+        address, size = read_range[3:]
+        return range(address // _READ_CACHE_PAGE_SIZE, (address + max(size, 1) - 1) // _READ_CACHE_PAGE_SIZE + 1)
+
+    def get(self, key: Tuple) -> Any:
+        """
+        Returns cached result of a read, or raises KeyError if it is not cached.
+        """
+        with self._lock:
+            _, value = self._reads[key]
+            self._reads.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple, value: Any, generation: int) -> None:
+        """
+        Caches result of a read that was started when cache was at generation. Result is dropped if anything was
+        invalidated since, because it could be older than the write.
+        """
+        read_range = _read_range(key)
+        size = read_range[4]
+        if size > self.max_size or not self.is_memory(*read_range) or self.is_volatile(*read_range):
+            return
+        with self._lock:
+            if generation != self._generation or key in self._reads:
+                return
+            self._reads[key] = (read_range, value)
+            self._size += size
+            for page in self._range_pages(read_range):
+                self._pages.setdefault((*read_range[:3], page), set()).add(key)
+            while self._size > self.max_size:
+                self._remove(next(iter(self._reads)))
+
+    def _remove(self, key: Tuple) -> None:
+        read_range, _ = self._reads.pop(key)
+        self._size -= read_range[4]
+        for page in self._range_pages(read_range):
+            page_key = (*read_range[:3], page)
+            keys = self._pages[page_key]
+            keys.discard(key)
+            if not keys:
+                del self._pages[page_key]
+
+    def _invalidate(self, core: Optional[Tuple[int, int, int]], address: int, size: int) -> None:
+        self._generation += 1
+        if core is None:
+            keys = [key for key, (read_range, _) in self._reads.items() if _overlaps(read_range[3:], address, size)]
+        else:
+            keys = set()
+            for page in self._range_pages((*core, address, size)):
+                for key in self._pages.get((*core, page), ()):
+                    if _overlaps(self._reads[key][0][3:], address, size):
+                        keys.add(key)
+        for key in keys:
+            self._remove(key)
+
+    def invalidate(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> None:
+        """
+        Drops cached reads that overlap [address, address + size) of a core. Write to register space can start cores
+        (e.g. soft reset release or debug continue), which then change memory of any core, so it drops all cached reads.
+        """
+        with self._lock:
+            if _overlaps((_REGISTER_SPACE_START, _REGISTER_SPACE_END - _REGISTER_SPACE_START), address, size):
+                self._clear()
+            else:
+                self._invalidate((chip_id, noc_x, noc_y), address, size)
+
+    def _clear(self) -> None:
+        self._generation += 1
+        self._reads.clear()
+        self._pages.clear()
+        self._size = 0
+
+    def clear(self) -> None:
+        """
+        Drops all cached reads, e.g. after the device was running and could have changed its memory.
+        """
+        with self._lock:
+            self._clear()
+
 
 class TTExaLensCache(TTExaLensCommunicator):
     """
-    Base caching class that provides cache dictionary and a function to save the cache to a file.
+    Base caching class. Cache maps (function name, arguments) of a call to its result.
     """
 
     def __init__(self):
         super().__init__()
         self.cache = {}
 
-    def save(self):
-        util.INFO(f"Saving server cache to file {self.filepath}")
-        with open(self.filepath, "wb") as f:
-            pickle.dump(self.cache, f)
-            util.INFO(f"  Saved {len(self.cache)} entries")
-
 
 class TTExaLensCacheThrough(TTExaLensCache):
     """
     A class for caching the return values or device calls. Caching is implemented using a decorator.
+    Every result is appended to the cache file as soon as the call returns, so results are not kept in memory.
 
     Args:
         communicator (TTExaLensCommunicator): The interface that contacts the device.
-        filepath (str): The path to save the cache file. Default is "ttexalens_cache.pkl".
+        filepath (str, optional): The path to save the cache file. If None, nothing is recorded and only reads are
+            cached in memory (requires cache_reads). Default is "ttexalens_cache.pkl".
+        record_timing (bool): If True, time and latency of every call are recorded, so that reader can replay calls
+            with the same latency. Default is False.
+        cache_reads (bool): If True, repeated pci_read and pci_read32 calls of memory regions are served from memory
+            until a write overlaps them (see ReadCache). Memory regions must be added with add_memory_region, memory
+            that the device changes by itself must be marked with add_volatile_region or dropped with invalidate_reads.
+            Default is False.
     """
 
-    def __init__(self, communicator, filepath="ttexalens_cache.pkl"):
+    def __init__(self, communicator, filepath="ttexalens_cache.pkl", record_timing=False, cache_reads=False):
         super().__init__()
         self.communicator = communicator
         self.filepath = filepath
+        self.record_timing = record_timing
+        self.cache = CacheLogWriter(filepath) if filepath is not None else None
+        self.read_cache = ReadCache() if cache_reads else None
+        self._start_time = time.perf_counter()
+
+    def add_memory_region(self, address: int, size: int, core: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Marks [address, address + size) of a core, given as (chip_id, noc_x, noc_y), or of every core if core is
+        None, as plain memory whose reads are served from the read cache.
+        """
+        if self.read_cache is not None:
+            self.read_cache.add_memory_region(address, size, core)
+
+    def add_volatile_region(self, address: int, size: int, core: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Marks [address, address + size) of a core, given as (chip_id, noc_x, noc_y), or of every core if core is
+        None, as never served from the read cache.
+        """
+        if self.read_cache is not None:
+            self.read_cache.add_volatile_region(address, size, core)
+
+    def invalidate_reads(self) -> None:
+        """
+        Drops all reads cached in memory. Should be called after the device could have changed its memory.
+        """
+        if self.read_cache is not None:
+            self.read_cache.clear()
+
+    def save(self):
+        if self.cache is None or self.cache.closed:
+            return
+        self.cache.close()
+        util.INFO(f"Saved {len(self.cache)} entries to server cache file {self.filepath}")
 
     """
     This class uses a decorator wrapped around the regular interface functions to perform caching.
@@ -52,34 +709,83 @@ class TTExaLensCacheThrough(TTExaLensCache):
 
     def cache_decorator(func):
         def wrapper(self, *args, **kwargs):
-            key = (func.__name__, args)
-            self.cache[key] = func(self, *args, **kwargs)
-            return self.cache[key]
+            start = time.perf_counter()
+            retval = func(self, *args, **kwargs)
+            self._record((func.__name__, args), retval, start)
+            return retval
 
         return wrapper
 
     def cache_binary_decorator(func):
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            data = func(self, *args, **kwargs).read()
+            self._record((func.__name__, args), data, start)
+            return io.BytesIO(data)
+
+        return wrapper
+
+    def cache_memory_decorator(func):
         def wrapper(self, *args, **kwargs):
             key = (func.__name__, args)
+            if self.read_cache is None:
+                generation = None
+            else:
+                try:
+                    return self.read_cache.get(key)
+                except KeyError:
+                    generation = self.read_cache.generation
+
+            start = time.perf_counter()
             retval = func(self, *args, **kwargs)
-            self.cache[key] = retval.read()
+            self._record(key, retval, start)
+            if generation is not None:
+                self.read_cache.put(key, retval, generation)
             return retval
 
         return wrapper
 
-    @cache_decorator
+    def _invalidate(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> None:
+        # Must be called after write is done, so that reads started before it are not cached
+        if self.read_cache is not None:
+            self.read_cache.invalidate(chip_id, noc_x, noc_y, address, size)
+
+    def _timing(self, start: float) -> Optional[Tuple[float, float]]:
+        # Returns (timestamp, latency) of a call that started at start, if timing is recorded
+        if not self.record_timing:
+            return None
+        return (start - self._start_time, time.perf_counter() - start)
+
+    def _record(self, key: Tuple, value: Any, start: float) -> None:
+        if self.cache is not None:
+            self.cache.append(key, value, self._timing(start))
+
+    @cache_memory_decorator
     def pci_read32(self, chip_id: int, noc_x: int, noc_y: int, address: int):
         return self.communicator.pci_read32(chip_id, noc_x, noc_y, address)
 
+    def pci_poll32(self, chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us=0):
+        # Polled value is changed by the device, so it must never be served from the read cache
+        self.add_volatile_region(address, 4, (chip_id, noc_x, noc_y))
+        return super().pci_poll32(chip_id, noc_x, noc_y, address, mask, expected, timeout_ms, interval_us)
+
+    def pci_sample32(self, chip_id, noc_x, noc_y, address, duration_ms, interval_us=0, max_values=SAMPLE_MAX_VALUES):
+        self.add_volatile_region(address, 4, (chip_id, noc_x, noc_y))
+        return super().pci_sample32(chip_id, noc_x, noc_y, address, duration_ms, interval_us, max_values)
+
     def pci_write32(self, chip_id, noc_x, noc_y, reg_addr, data):
-        return self.communicator.pci_write32(chip_id, noc_x, noc_y, reg_addr, data)
+        retval = self.communicator.pci_write32(chip_id, noc_x, noc_y, reg_addr, data)
+        self._invalidate(chip_id, noc_x, noc_y, reg_addr, 4)
+        return retval
 
-    @cache_decorator
-    def pci_read(self, chip_id, x, y, noc_id, reg_addr, size):
-        return self.communicator.pci_read(chip_id, x, y, noc_id, reg_addr, size)
+    @cache_memory_decorator
+    def pci_read(self, chip_id: int, noc_x: int, noc_y: int, address: int, size: int):
+        return self.communicator.pci_read(chip_id, noc_x, noc_y, address, size)
 
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
-        return self.communicator.pci_write(chip_id, noc_x, noc_y, address, data)
+        retval = self.communicator.pci_write(chip_id, noc_x, noc_y, address, data)
+        self._invalidate(chip_id, noc_x, noc_y, address, len(data))
+        return retval
 
     @cache_decorator
     def dma_buffer_read32(self, chip_id, dram_addr, dram_chan):
@@ -94,7 +800,10 @@ class TTExaLensCacheThrough(TTExaLensCache):
         return self.communicator.pci_read32_raw(chip_id, reg_addr)
 
     def pci_write32_raw(self, chip_id, reg_addr, data):
-        return self.communicator.pci_write32_raw(chip_id, reg_addr, data)
+        retval = self.communicator.pci_write32_raw(chip_id, reg_addr, data)
+        # Raw register writes can change anything on the device (e.g. reset cores)
+        self.invalidate_reads()
+        return retval
 
     @cache_decorator
     def get_cluster_description(self):
@@ -129,14 +838,22 @@ class TTExaLensCacheThrough(TTExaLensCache):
         return self.communicator.jtag_read32(chip_id, noc_x, noc_y, address)
 
     def jtag_write32(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: int):
-        return self.communicator.jtag_write32(chip_id, noc_x, noc_y, address, data)
+        retval = self.communicator.jtag_write32(chip_id, noc_x, noc_y, address, data)
+        self._invalidate(chip_id, noc_x, noc_y, address, 4)
+        return retval
 
     @cache_decorator
     def jtag_read32_axi(self, chip_id: int, address: int):
         return self.communicator.jtag_read32_axi(chip_id, address)
 
     def jtag_write32_axi(self, chip_id: int, address: int, data: int):
-        return self.communicator.jtag_write32_axi(chip_id, address, data)
+        retval = self.communicator.jtag_write32_axi(chip_id, address, data)
+        # AXI address doesn't tell which core memory is written
+        self.invalidate_reads()
+        return retval
+
+    def get_server_statistics(self, reset: bool = False) -> "list[dict] | None":
+        return self.communicator.get_server_statistics(reset)
 
     def using_cache(self) -> bool:
         return True
@@ -146,20 +863,35 @@ class TTExaLensCacheReader(TTExaLensCache):
     """
     A class for reading the cache file. It imitates the high-level interface used to communicate with the device.
     Reading is implemented using a decorator.
+
+    Calls are replayed at full speed, unless replay_latency is True: then every call that has recorded timing takes as
+    long as it took on the device. Either way, recorded latency of replayed calls is summed in device_time, so time
+    spent in Python can be separated from time spent waiting for the device.
+
+    Args:
+        filepath (str): The path of the cache file. Default is "ttexalens_cache.pkl".
+        replay_latency (bool): If True, recorded latency of every call is injected. Default is False.
     """
 
-    def __init__(self, filepath="ttexalens_cache.pkl"):
+    def __init__(self, filepath="ttexalens_cache.pkl", replay_latency=False):
         super().__init__()
         self.filepath = filepath
+        self.replay_latency = replay_latency
+        self.replayed_calls = 0  # Number of replayed calls with recorded timing
+        self.device_time = 0.0  # Sum of recorded latencies of replayed calls, in seconds
 
         self.load()
 
     def load(self):
         if os.path.exists(self.filepath):
             util.INFO(f"Loading server cache from file {self.filepath}")
-            with open(self.filepath, "rb") as f:
-                self.cache = pickle.load(f)
-                util.INFO(f"  Loaded {len(self.cache)} entries")
+            if CacheLogReader.is_cache_log(self.filepath):
+                self.cache = CacheLogReader(self.filepath)
+            else:
+                # Cache file written by older version, which pickled the whole dictionary
+                with open(self.filepath, "rb") as f:
+                    self.cache = pickle.load(f)
+            util.INFO(f"  Loaded {len(self.cache)} entries")
         else:
             util.ERROR(f"Cache file {self.filepath} does not exist")
 
@@ -167,15 +899,34 @@ class TTExaLensCacheReader(TTExaLensCache):
     The decorator performs all the work of reading from the cache. The functions just provide the correct interface.
     """
 
+    def _lookup(self, key: Tuple) -> Any:
+        # Returns cached result of a call, waiting for its recorded latency if needed. Raises KeyError on cache miss.
+        if not isinstance(self.cache, CacheLogReader):
+            return self.cache[key]
+
+        value, timing = self.cache.lookup(key)
+        if timing is not None:
+            latency = timing[1]
+            self.replayed_calls += 1
+            self.device_time += latency
+            if self.replay_latency:
+                deadline = time.perf_counter() + latency
+                # Sleeping is not precise enough for short latencies, so the rest of the wait is busy waiting
+                if latency > 0.002:
+                    time.sleep(latency - 0.001)
+                while time.perf_counter() < deadline:
+                    pass
+        return value
+
     def read_decorator(func):
         def wrapper(self, *args, **kwargs):
             key = (func.__name__, args)
 
-            if key not in self.cache:
+            try:
+                return self._lookup(key)
+            except KeyError:
                 util.ERROR(f"Cache miss for {func.__name__}.")
-                raise util.TTException(f"Cache miss for {func.__name__}.")
-
-            return self.cache[key]
+                raise util.TTException(f"Cache miss for {func.__name__}.") from None
 
         return wrapper
 
@@ -183,24 +934,45 @@ class TTExaLensCacheReader(TTExaLensCache):
         def wrapper(self, *args, **kwargs):
             key = (func.__name__, args)
 
-            if key not in self.cache:
+            try:
+                return io.BytesIO(self._lookup(key))
+            except KeyError:
                 util.ERROR(f"Cache miss for {func.__name__}.")
-                raise util.TTException(f"Cache miss for {func.__name__}.")
+                raise util.TTException(f"Cache miss for {func.__name__}.") from None
+
+        return wrapper
+
+    def read_memory_decorator(func):
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__, args)
 
-            return io.BytesIO(self.cache[key])
+            try:
+                return self._lookup(key)
+            except KeyError:
+                # Read was not recorded with the same arguments, but recorded reads can still cover its memory
+                return func(self, *args, **kwargs)
 
         return wrapper
 
-    @read_decorator
+    def _read_memory(self, func_name: str, chip_id: int, noc_x: int, noc_y: int, address: int, size: int) -> bytes:
+        data = None
+        if isinstance(self.cache, CacheLogReader):
+            data = self.cache.read_memory(chip_id, noc_x, noc_y, address, size)
+        if data is None:
+            util.ERROR(f"Cache miss for {func_name}.")
+            raise util.TTException(f"Cache miss for {func_name}.")
+        return data
+
+    @read_memory_decorator
     def pci_read32(self, chip_id, noc_x, noc_y, reg_addr):
-        pass
+        return int.from_bytes(self._read_memory("pci_read32", chip_id, noc_x, noc_y, reg_addr, 4), "little")
 
     def pci_write32(self, chip_id, noc_x, noc_y, reg_addr, data):
         raise util.TTException("Device not available, cannot write to cache.")
 
-    @read_decorator
+    @read_memory_decorator
     def pci_read(self, chip_id, noc_x, noc_y, reg_addr, size):
-        pass
+        return self._read_memory("pci_read", chip_id, noc_x, noc_y, reg_addr, size)
 
     def pci_write(self, chip_id: int, noc_x: int, noc_y: int, address: int, data: bytes):
         raise util.TTException("Device not available, cannot write to cache.")
@@ -266,12 +1038,17 @@ class TTExaLensCacheReader(TTExaLensCache):
         return True
 
 
-def init_cache_writer(original_communicator, filepath="ttexalens_cache.pkl"):
-    communicator = TTExaLensCacheThrough(original_communicator, filepath)
+def init_cache_writer(original_communicator, filepath="ttexalens_cache.pkl", record_timing=False, cache_reads=False):
+    communicator = TTExaLensCacheThrough(original_communicator, filepath, record_timing, cache_reads)
     atexit.register(communicator.save)
     return communicator
 
 
-def init_cache_reader(filepath="ttexalens_cache.pkl"):
-    communicator = TTExaLensCacheReader(filepath)
+def init_read_cache(original_communicator):
+    # Serves repeated reads from memory without writing a cache file
+    return TTExaLensCacheThrough(original_communicator, None, cache_reads=True)
+
+
+def init_cache_reader(filepath="ttexalens_cache.pkl", replay_latency=False):
+    communicator = TTExaLensCacheReader(filepath, replay_latency)
     return communicator
@@ -24,6 +24,9 @@ def init_ttexalens(
     cache_path: str = None,
     init_jtag: bool = False,
     use_noc1: bool = False,
+    record_timing: bool = False,
+    cache_reads: bool = False,
+    volatile_regions: list = None,
 ) -> Context:
     """Initializes TTExaLens internals by creating the device interface and TTExaLens context.
     Interfacing device is local, through pybind.
@@ -31,6 +34,9 @@ def init_ttexalens(
     Args:
             wanted_devices (list, optional): List of device IDs we want to connect to. If None, connect to all available devices.
             caching_path (str, optional): Path to the cache file to write. If None, caching is disabled.
+            record_timing (bool): If True, cache file also records time and latency of every device call. Default is False.
+            cache_reads (bool): If True, repeated reads of L1 memory are served from memory until a write overlaps them, with or without cache_path. Default is False.
+            volatile_regions (list, optional): List of (address, size) tuples of L1 memory of every core (e.g. firmware mailboxes) that cache_reads never caches.
 
     Returns:
             Context: TTExaLens context object.
@@ -38,7 +44,12 @@ def init_ttexalens(
 
     lens_ifc = tt_exalens_ifc.init_pybind(wanted_devices, init_jtag, use_noc1)
     if cache_path:
-        lens_ifc = tt_exalens_ifc_cache.init_cache_writer(lens_ifc, cache_path)
+        lens_ifc = tt_exalens_ifc_cache.init_cache_writer(lens_ifc, cache_path, record_timing, cache_reads)
+    elif cache_reads:
+        lens_ifc = tt_exalens_ifc_cache.init_read_cache(lens_ifc)
+    if cache_reads:
+        for address, size in volatile_regions or []:
+            lens_ifc.add_volatile_region(address, size)
 
     return load_context(lens_ifc, use_noc1)
 
@@ -47,6 +58,11 @@ def init_ttexalens_remote(
     ip_address: str = "localhost",
     port: int = 5555,
     cache_path: str = None,
+    pipelined: bool = False,
+    compression: bool = False,
+    record_timing: bool = False,
+    cache_reads: bool = False,
+    volatile_regions: list = None,
 ) -> Context:
     """Initializes TTExaLens internals by creating the device interface and TTExaLens context.
     Interfacing device is done remotely through TTExaLens client.
@@ -55,26 +71,38 @@ def init_ttexalens_remote(
             ip_address (str): IP address of the TTExaLens server. Default is 'localhost'.
             port (int): Port number of the TTExaLens server interface. Default is 5555.
             cache_path (str, optional): Path to the cache file to write. If None, caching is disabled.
+            pipelined (bool): If True, client can have multiple requests in flight. Default is False.
+            compression (bool): If True, server is asked to compress large responses. Default is False.
+            record_timing (bool): If True, cache file also records time and latency of every device call. Default is False.
+            cache_reads (bool): If True, repeated reads of L1 memory are served from memory until a write overlaps them, with or without cache_path. Default is False.
+            volatile_regions (list, optional): List of (address, size) tuples of L1 memory of every core (e.g. firmware mailboxes) that cache_reads never caches.
 
     Returns:
             Context: TTExaLens context object.
     """
 
-    lens_ifc = tt_exalens_ifc.connect_to_server(ip_address, port)
+    lens_ifc = tt_exalens_ifc.connect_to_server(ip_address, port, pipelined, compression)
     if cache_path:
-        lens_ifc = tt_exalens_ifc_cache.init_cache_writer(lens_ifc, cache_path)
+        lens_ifc = tt_exalens_ifc_cache.init_cache_writer(lens_ifc, cache_path, record_timing, cache_reads)
+    elif cache_reads:
+        lens_ifc = tt_exalens_ifc_cache.init_read_cache(lens_ifc)
+    if cache_reads:
+        for address, size in volatile_regions or []:
+            lens_ifc.add_volatile_region(address, size)
 
     return load_context(lens_ifc, use_noc1=False)  # TODO: Unsupported!
 
 
 def init_ttexalens_cached(
     cache_path: str,
+    replay_latency: bool = False,
 ):
     """Initializes TTExaLens internals by reading cached session data. There is no connection to the device.
     Only cached commands are available.
 
     Args:
             cache_path (str): Path to the cache file.
+            replay_latency (bool): If True, every cached call with recorded timing takes as long as recorded. Default is False.
 
     Returns:
             Context: TTExaLens context object.
@@ -82,7 +110,7 @@ def init_ttexalens_cached(
     if not os.path.exists(cache_path) or not os.path.isfile(cache_path):
         raise util.TTFatalException(f"Error: Cache file at {cache_path} does not exist.")
 
-    lens_ifc = tt_exalens_ifc_cache.init_cache_reader(cache_path)
+    lens_ifc = tt_exalens_ifc_cache.init_cache_reader(cache_path, replay_latency)
 
     return load_context(lens_ifc)
 
@@ -102,6 +130,8 @@ def get_cluster_desc_yaml(lens_ifc: tt_exalens_ifc.TTExaLensCommunicator) -> "tu
 def load_context(server_ifc: tt_exalens_ifc.TTExaLensCommunicator, use_noc1: bool = False) -> Context:
     """Load the TTExaLens context object with specified parameters."""
     context = LimitedContext(server_ifc, get_cluster_desc_yaml(server_ifc), use_noc1)
+    if isinstance(server_ifc, tt_exalens_ifc_cache.TTExaLensCacheThrough) and server_ifc.read_cache is not None:
+        add_read_cache_memory_regions(context)
 
     global GLOBAL_CONTEXT
     GLOBAL_CONTEXT = context
@@ -109,6 +139,21 @@ def load_context(server_ifc: tt_exalens_ifc.TTExaLensCommunicator, use_noc1: boo
     return context
 
 
+def add_read_cache_memory_regions(context: Context) -> None:
+    """Marks L1 memory of worker and ethernet cores as memory whose reads can be cached. DRAM is not added, because
+    every DRAM channel is reachable through multiple NOC endpoints and write through one of them wouldn't invalidate
+    reads through the others."""
+    for device_id, device in context.devices.items():
+        for block_type in ["functional_workers", "eth"]:
+            try:
+                l1_size = device.get_l1_size(block_type)
+            except util.TTException:
+                continue
+            for core_loc in device.get_block_locations(block_type):
+                core = (device_id, *context.convert_loc_to_umd(core_loc))
+                context.server_ifc.add_memory_region(0, l1_size, core)
+
+
 def set_active_context(context: Context) -> None:
     """
     Set the active TTExaLens context object.
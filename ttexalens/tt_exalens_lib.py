@@ -4,15 +4,21 @@
 import os
 import re
 import struct
+import time
 
-from typing import Union, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Iterator, Union, List
 
 from ttexalens import tt_exalens_init
 
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.context import Context
+from ttexalens.tt_exalens_ifc_base import SampleResult
 from ttexalens.util import TTException
 
+# Maximum number of cores that load_elf and run_elf set up concurrently
+ELF_LOAD_WORKERS = 8
+
 
 def read_word_from_device(
     core_loc: Union[str, OnChipCoordinate], addr: int, device_id: int = 0, context: Context = None
@@ -35,6 +41,7 @@ def read_word_from_device(
 
     if not isinstance(core_loc, OnChipCoordinate):
         core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, 4)
     if context.devices[device_id]._has_jtag:
         word = context.server_ifc.jtag_read32(device_id, *core_loc.to("noc0"), addr)
     else:
@@ -43,8 +50,13 @@ def read_word_from_device(
 
 
 def read_words_from_device(
-    core_loc: Union[str, OnChipCoordinate], addr: int, device_id: int = 0, word_count: int = 1, context: Context = None
-) -> "List[int]":
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    device_id: int = 0,
+    word_count: int = 1,
+    context: Context = None,
+    as_numpy: bool = False,
+) -> "List[int] | numpy.ndarray":
     """Reads word_count four-byte words of data, starting from address 'addr' at core <x-y>.
 
     Args:
@@ -53,9 +65,10 @@ def read_words_from_device(
             device_id (int, default 0):	ID number of device to read from.
             word_count (int, default 1): Number of 4-byte words to read.
             context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentailly initialized.
+            as_numpy (bool, default False): If True, words are returned as numpy uint32 array. Requires numpy to be installed.
 
     Returns:
-            List[int]: Data read from the device.
+            List[int] | numpy.ndarray: Data read from the device.
     """
     context = check_context(context)
 
@@ -66,14 +79,29 @@ def read_words_from_device(
 
     if not isinstance(core_loc, OnChipCoordinate):
         core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
-    data = []
-    for i in range(word_count):
-        if context.devices[device_id]._has_jtag:
-            word = context.server_ifc.jtag_read32(device_id, *core_loc.to("noc0"), addr + 4 * i)
-        else:
-            word = context.server_ifc.pci_read32(device_id, *context.convert_loc_to_umd(core_loc), addr + 4 * i)
-        data.append(word)
-    return data
+    _flush_overlapping_writes(context, device_id, core_loc, addr, 4 * word_count)
+
+    if context.devices[device_id]._has_jtag:
+        data = [
+            context.server_ifc.jtag_read32(device_id, *core_loc.to("noc0"), addr + 4 * i) for i in range(word_count)
+        ]
+        if as_numpy:
+            import numpy
+
+            return numpy.array(data, dtype=numpy.uint32)
+        return data
+
+    # Whole range is fetched with a single bulk read instead of one round trip per word
+    noc_x, noc_y = context.convert_loc_to_umd(core_loc)
+    if as_numpy:
+        import numpy
+
+        data = numpy.empty(word_count, dtype=numpy.uint32)
+        context.server_ifc.pci_read_into(device_id, noc_x, noc_y, addr, data)
+        return data
+    return list(
+        struct.unpack(f"<{word_count}I", context.server_ifc.pci_read(device_id, noc_x, noc_y, addr, 4 * word_count))
+    )
 
 
 def read_from_device(
@@ -100,6 +128,7 @@ def read_from_device(
 
     if not isinstance(core_loc, OnChipCoordinate):
         core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, num_bytes)
 
     if context.devices[device_id]._has_jtag:
         int_array = read_words_from_device(core_loc, addr, device_id, num_bytes // 4 + (num_bytes % 4 > 0), context)
@@ -108,10 +137,366 @@ def read_from_device(
     return context.server_ifc.pci_read(device_id, *context.convert_loc_to_umd(core_loc), addr, num_bytes)
 
 
+def read_from_device_async(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    device_id: int = 0,
+    num_bytes: int = 4,
+    context: Context = None,
+) -> Future:
+    """Asynchronous version of read_from_device. Read is executed on the context executor, so caller can do other work
+    (e.g. decode previously read data) while waiting for the device. Exceptions are raised when calling result().
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            device_id (int, default 0): ID number of device to read from.
+            num_bytes (int, default 4): Number of bytes to read.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            Future: Future whose result is data read from the device, same as returned by read_from_device.
+    """
+    context = check_context(context)
+    _flush_write_batch(context)
+    return context.executor.submit(read_from_device, core_loc, addr, device_id, num_bytes, context)
+
+
+def read_from_device_into(
+    core_loc: Union[str, OnChipCoordinate], addr: int, buffer, device_id: int = 0, context: Context = None
+) -> int:
+    """Reads data starting from address 'addr' at core <x-y> into writable buffer. Number of bytes read is equal to
+    the size of the buffer. Data is read directly into the buffer, so large reads don't allocate memory on every call.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            buffer (bytearray | memoryview | numpy.ndarray): Writable C-contiguous buffer that receives the data.
+            device_id (int, default 0): ID number of device to read from.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            int: Number of bytes read.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+    view = memoryview(buffer).cast("B")
+    if view.nbytes <= 0:
+        raise TTException("buffer must not be empty.")
+
+    if not isinstance(core_loc, OnChipCoordinate):
+        core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, view.nbytes)
+
+    if context.devices[device_id]._has_jtag:
+        view[:] = read_from_device(core_loc, addr, device_id, view.nbytes, context)
+        return view.nbytes
+
+    return context.server_ifc.pci_read_into(device_id, *context.convert_loc_to_umd(core_loc), addr, view)
+
+
+def read_from_device_stream(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    num_bytes: int,
+    device_id: int = 0,
+    chunk_size: int = 1048576,
+    context: Context = None,
+) -> Iterator[bytes]:
+    """Reads num_bytes of data starting from address 'addr' at core <x-y> as a sequence of chunks. Only a few chunks
+    are kept in memory at any time, so arbitrarily large regions (e.g. whole DRAM channel) can be processed while
+    they are still being read.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            num_bytes (int): Number of bytes to read.
+            device_id (int, default 0): ID number of device to read from.
+            chunk_size (int, default 1MB): Maximum number of bytes in one chunk.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            Iterator[bytes]: Chunks of data read from the device, in order of addresses.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+    if num_bytes <= 0:
+        raise TTException("num_bytes must be greater than 0.")
+    if chunk_size <= 0:
+        raise TTException("chunk_size must be greater than 0.")
+
+    if not isinstance(core_loc, OnChipCoordinate):
+        core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, num_bytes)
+
+    if context.devices[device_id]._has_jtag:
+        return (
+            read_from_device(core_loc, addr + offset, device_id, min(chunk_size, num_bytes - offset), context)
+            for offset in range(0, num_bytes, chunk_size)
+        )
+
+    return context.server_ifc.pci_read_stream(
+        device_id, *context.convert_loc_to_umd(core_loc), addr, num_bytes, chunk_size
+    )
+
+
+def read_from_device_to_file(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    num_bytes: int,
+    file: Union[str, BinaryIO],
+    device_id: int = 0,
+    chunk_size: int = 1048576,
+    context: Context = None,
+) -> int:
+    """Reads num_bytes of data starting from address 'addr' at core <x-y> and writes it to file. Data is written while
+    it is being read, so memory usage doesn't depend on num_bytes.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            num_bytes (int): Number of bytes to read.
+            file (str | BinaryIO): Path of the output file or file object opened in binary mode.
+            device_id (int, default 0): ID number of device to read from.
+            chunk_size (int, default 1MB): Maximum number of bytes read with one request.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            int: Number of bytes written to file.
+    """
+    chunks = read_from_device_stream(core_loc, addr, num_bytes, device_id, chunk_size, context)
+    if isinstance(file, str):
+        with open(file, "wb") as f:
+            return sum(f.write(chunk) for chunk in chunks)
+    return sum(file.write(chunk) for chunk in chunks)
+
+
+def read_from_cores(
+    core_locs: List[Union[str, OnChipCoordinate]],
+    addr: int,
+    device_id: int = 0,
+    num_bytes: int = 4,
+    context: Context = None,
+) -> List[bytes]:
+    """Reads num_bytes of data starting from address 'addr' on every core in core_locs. All cores are read with a single
+    request, which is much faster than reading them one by one when connected to a remote server.
+
+    Args:
+            core_locs (List[str | OnChipCoordinate]): List of core locations. Each one is either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            device_id (int, default 0): ID number of device to read from.
+            num_bytes (int, default 4): Number of bytes to read from every core.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            List[bytes]: Data read from every core, in the same order as core_locs.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+    if num_bytes <= 0:
+        raise TTException("num_bytes must be greater than 0.")
+
+    core_locs = [
+        core_loc
+        if isinstance(core_loc, OnChipCoordinate)
+        else OnChipCoordinate.create(core_loc, context.devices[device_id])
+        for core_loc in core_locs
+    ]
+    if len(core_locs) == 0:
+        return []
+    for core_loc in core_locs:
+        _flush_overlapping_writes(context, device_id, core_loc, addr, num_bytes)
+
+    if context.devices[device_id]._has_jtag:
+        return [read_from_device(core_loc, addr, device_id, num_bytes, context) for core_loc in core_locs]
+
+    cores = [context.convert_loc_to_umd(core_loc) for core_loc in core_locs]
+    return context.server_ifc.pci_read_gather(device_id, cores, addr, num_bytes)
+
+
+def save_l1_snapshot(
+    file_name: str,
+    device_ids: List[int] = None,
+    include_eth: bool = True,
+    context: Context = None,
+) -> "MemorySnapshot":
+    """Captures L1 memory of every Tensix core, and optionally every Ethernet core, of the given devices into a single
+    binary file. File starts with an index of (device, core) to file offset, followed by memory of every core read
+    with bulk reads. Use load_l1_snapshot to open it.
+
+    Args:
+            file_name (str): Path of the output file.
+            device_ids (List[int], optional): IDs of devices to capture. If None, all devices are captured.
+            include_eth (bool, default True): Whether L1 of Ethernet cores is captured as well.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            MemorySnapshot: Snapshot opened for reading.
+    """
+    from ttexalens.memory_snapshot import write_snapshot_index
+
+    context = check_context(context)
+
+    if device_ids is None:
+        device_ids = sorted(context.device_ids)
+    block_types = ["functional_workers", "eth"] if include_eth else ["functional_workers"]
+
+    regions = []
+    core_locs = []
+    for device_id in device_ids:
+        validate_device_id(device_id, context)
+        device = context.devices[device_id]
+        for block_type in block_types:
+            l1_size = device.get_l1_size(block_type)
+            for core_loc in device.get_block_locations(block_type):
+                regions.append((device_id, core_loc.to("noc0"), block_type, 0, l1_size))
+                core_locs.append(core_loc)
+
+    with open(file_name, "wb") as file:
+        for entry, core_loc in zip(write_snapshot_index(file, regions), core_locs):
+            file.seek(entry.offset)
+            read_from_device_to_file(core_loc, entry.address, entry.size, file, entry.device_id, context=context)
+
+    return load_l1_snapshot(file_name)
+
+
+def load_l1_snapshot(file_name: str) -> "MemorySnapshot":
+    """Opens memory snapshot file written by save_l1_snapshot. File is memory mapped, so only data that is accessed is
+    read from disk. Memory of a core is available as memoryview (read) or NumPy array (as_numpy).
+
+    Args:
+            file_name (str): Path of the snapshot file.
+
+    Returns:
+            MemorySnapshot: Snapshot opened for reading. Call close() when done.
+    """
+    from ttexalens.memory_snapshot import MemorySnapshot
+
+    return MemorySnapshot(file_name)
+
+
+def poll_word_from_device(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    mask: int,
+    expected: int,
+    device_id: int = 0,
+    timeout_ms: int = 1000,
+    interval_us: int = 0,
+    context: Context = None,
+) -> int:
+    """Reads word from address 'addr' at core <x-y> until (word & mask) == expected. Polling is done next to the device,
+    so waiting doesn't cost one round trip per read when connected to a remote server.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            mask (int): Mask applied to the word before comparing it to expected value.
+            expected (int): Expected value of masked word.
+            device_id (int, default 0): ID number of device to read from.
+            timeout_ms (int, default 1000): Time in milliseconds after which polling stops.
+            interval_us (int, default 0): Time in microseconds to wait between two reads.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            int: Last word read from the device.
+
+    Raises:
+            TTException: If condition is not met before timeout expires.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+    if timeout_ms < 0 or interval_us < 0:
+        raise TTException("timeout_ms and interval_us must not be negative.")
+
+    if not isinstance(core_loc, OnChipCoordinate):
+        core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, 4)
+
+    if context.devices[device_id]._has_jtag:
+        deadline = time.monotonic() + timeout_ms / 1000
+        iterations = 0
+        while True:
+            word = context.server_ifc.jtag_read32(device_id, *core_loc.to("noc0"), addr)
+            iterations += 1
+            if (word & mask) == expected or time.monotonic() >= deadline:
+                break
+            if interval_us > 0:
+                time.sleep(interval_us / 1000000)
+    else:
+        word, iterations = context.server_ifc.pci_poll32(
+            device_id, *context.convert_loc_to_umd(core_loc), addr, mask, expected, timeout_ms, interval_us
+        )
+
+    if (word & mask) != expected:
+        raise TTException(
+            f"Timeout after {timeout_ms} ms ({iterations} reads) while polling address 0x{addr:08x} on {core_loc}: "
+            f"(0x{word:08x} & 0x{mask:08x}) != 0x{expected:08x}."
+        )
+    return word
+
+
+def sample_word_from_device(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    device_id: int = 0,
+    duration_ms: int = 1000,
+    interval_us: int = 0,
+    max_values: int = 65536,
+    context: Context = None,
+) -> SampleResult:
+    """Reads word from address 'addr' at core <x-y> for duration_ms and counts how many times every value was read.
+    Sampling is done next to the device and the whole histogram is returned in a single reply, so sampling rate is not
+    limited by round trip latency when connected to a remote server.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to read from.
+            device_id (int, default 0): ID number of device to read from.
+            duration_ms (int, default 1000): Time in milliseconds to sample for.
+            interval_us (int, default 0): Time in microseconds between starts of two reads. If 0, word is read as fast as possible.
+            max_values (int, default 65536): Maximum number of different values that are counted. Reads of other values are counted as dropped.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            SampleResult: Number of reads, sampling time, number of dropped reads and list of (value, count, first_us, last_us) tuples sorted by value.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+    if duration_ms < 0 or interval_us < 0:
+        raise TTException("duration_ms and interval_us must not be negative.")
+    if max_values <= 0:
+        raise TTException("max_values must be greater than 0.")
+
+    if not isinstance(core_loc, OnChipCoordinate):
+        core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+    _flush_overlapping_writes(context, device_id, core_loc, addr, 4)
+
+    if context.devices[device_id]._has_jtag:
+        noc_x, noc_y = core_loc.to("noc0")
+        return SampleResult.sample(
+            lambda: context.server_ifc.jtag_read32(device_id, noc_x, noc_y, addr), duration_ms, interval_us, max_values
+        )
+
+    return context.server_ifc.pci_sample32(
+        device_id, *context.convert_loc_to_umd(core_loc), addr, duration_ms, interval_us, max_values
+    )
+
+
 def write_words_to_device(
     core_loc: Union[str, OnChipCoordinate],
     addr: int,
-    data: Union[int, List[int]],
+    data: "Union[int, List[int], numpy.ndarray]",
     device_id: int = 0,
     context: Context = None,
 ) -> int:
@@ -120,12 +505,12 @@ def write_words_to_device(
     Args:
             core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
             addr (int): Memory address to write to. If multiple words are to be written, the address is the starting address.
-            data (int | List[int]): 4-byte integer word to be written, or a list of them.
+            data (int | List[int] | numpy.ndarray): 4-byte integer word to be written, or a list (or numpy array) of them.
             device_id (int, default 0): ID number of device to write to.
             context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentailly initialized.
 
     Returns:
-            int: If the execution is successful, return value should be 4 (number of bytes written).
+            int: If the execution is successful, return value should be number of bytes written (4 per word).
     """
     context = check_context(context)
 
@@ -138,15 +523,26 @@ def write_words_to_device(
     if isinstance(data, int):
         data = [data]
 
-    bytes_written = 0
-    for i, word in enumerate(data):
-        if context.devices[device_id]._has_jtag:
-            bytes_written += context.server_ifc.jtag_write32(device_id, *core_loc.to("noc0"), addr + i * 4, word)
-        else:
-            bytes_written += context.server_ifc.pci_write32(
-                device_id, *context.convert_loc_to_umd(core_loc), addr + i * 4, word
-            )
-    return bytes_written
+    batch = context.active_write_batch
+
+    # JTAG can only write one word at a time
+    if context.devices[device_id]._has_jtag and batch is None:
+        bytes_written = 0
+        for i, word in enumerate(data):
+            bytes_written += context.server_ifc.jtag_write32(device_id, *core_loc.to("noc0"), addr + i * 4, int(word))
+        return bytes_written
+
+    # All words are packed once and written with a single bulk write
+    if hasattr(data, "astype"):
+        data = data.astype("<u4", copy=False).tobytes()
+    else:
+        data = struct.pack(f"<{len(data)}I", *data)
+    if len(data) == 0:
+        return 0
+    if batch is not None:
+        batch.write(device_id, core_loc, addr, data)
+        return len(data)
+    return context.server_ifc.pci_write(device_id, *context.convert_loc_to_umd(core_loc), addr, data)
 
 
 def write_to_device(
@@ -186,13 +582,215 @@ def write_to_device(
         assert (
             len(data) % 4 == 0
         ), "Data length must be a multiple of 4 bytes as JTAG currently does not support unaligned access."
-        for i in range(0, len(data), 4):
-            write_words_to_device(core_loc, addr + i, struct.unpack("<I", data[i : i + 4])[0], device_id, context)
+
+    batch = context.active_write_batch
+    if batch is not None:
+        batch.write(device_id, core_loc, addr, data)
+        return len(data)
+
+    return _write_to_device(context, device_id, core_loc, addr, data)
+
+
+def _write_to_device(context: Context, device_id: int, core_loc: OnChipCoordinate, addr: int, data: bytes) -> int:
+    # Writes data to the device, bypassing write batch. Arguments must already be validated.
+    if context.devices[device_id]._has_jtag:
+        words = struct.unpack(f"<{len(data) // 4}I", data)
+        for i, word in enumerate(words):
+            context.server_ifc.jtag_write32(device_id, *core_loc.to("noc0"), addr + i * 4, word)
         return len(data)
 
     return context.server_ifc.pci_write(device_id, *context.convert_loc_to_umd(core_loc), addr, data)
 
 
+def _flush_write_batch(context: Context) -> None:
+    # Executor threads don't see write batch of the calling thread, so buffered writes must reach the device first
+    batch = context.active_write_batch
+    if batch is not None:
+        batch.flush()
+
+
+def _flush_overlapping_writes(
+    context: Context, device_id: int, core_loc: OnChipCoordinate, addr: int, num_bytes: int
+) -> None:
+    # Data written in active write batch must reach the device before it is read back
+    batch = context.active_write_batch
+    if batch is not None:
+        batch.flush_overlapping(device_id, core_loc, addr, num_bytes)
+
+
+def write_to_device_async(
+    core_loc: Union[str, OnChipCoordinate],
+    addr: int,
+    data: "Union[List[int], bytes]",
+    device_id: int = 0,
+    context: Context = None,
+) -> Future:
+    """Asynchronous version of write_to_device. Write is executed on the context executor, so caller can do other work
+    while waiting for the device. Exceptions are raised when calling result(). Writes issued from the same thread are
+    not guaranteed to complete in order, so wait for the future before reading data back.
+
+    Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to write to.
+            data (List[int] | bytes): Data to be written. Lists are converted to bytes before writing, each element a byte. Elements must be between 0 and 255.
+            device_id (int, default 0): ID number of device to write to.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            Future: Future whose result is number of bytes written, same as returned by write_to_device.
+    """
+    context = check_context(context)
+    _flush_write_batch(context)
+    return context.executor.submit(write_to_device, core_loc, addr, data, device_id, context)
+
+
+def write_to_cores(
+    core_locs: List[Union[str, OnChipCoordinate]],
+    addr: int,
+    data: "Union[List[int], bytes]",
+    device_id: int = 0,
+    context: Context = None,
+) -> int:
+    """Writes the same data to address 'addr' on every core in core_locs. All cores are written with a single request,
+    which is much faster than writing them one by one when connected to a remote server.
+
+    Args:
+            core_locs (List[str | OnChipCoordinate]): List of core locations. Each one is either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            addr (int): Memory address to write to.
+            data (List[int] | bytes): Data to be written. Lists are converted to bytes before writing, each element a byte. Elements must be between 0 and 255.
+            device_id (int, default 0): ID number of device to write to.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+            int: If the execution is successful, return value should be number of bytes written to every core.
+    """
+    context = check_context(context)
+
+    validate_addr(addr)
+    validate_device_id(device_id, context)
+
+    if isinstance(data, list):
+        data = bytes(data)
+
+    if len(data) == 0:
+        raise TTException("Data to write must not be empty.")
+
+    core_locs = [
+        core_loc
+        if isinstance(core_loc, OnChipCoordinate)
+        else OnChipCoordinate.create(core_loc, context.devices[device_id])
+        for core_loc in core_locs
+    ]
+    if len(core_locs) == 0:
+        return 0
+    for core_loc in core_locs:
+        _flush_overlapping_writes(context, device_id, core_loc, addr, len(data))
+
+    if context.devices[device_id]._has_jtag:
+        for core_loc in core_locs:
+            write_to_device(core_loc, addr, data, device_id, context)
+        return len(data)
+
+    cores = [context.convert_loc_to_umd(core_loc) for core_loc in core_locs]
+    return context.server_ifc.pci_write_scatter(device_id, cores, addr, data)
+
+
+class CoreHandle:
+    """
+    Core location resolved once for fast repeated access. Context, device id and location are checked and converted
+    to device coordinates when handle is created, so read and write methods go straight to the device interface
+    without any per-call validation. Use it in hot loops (e.g. polling a mailbox) instead of read_word_from_device
+    and similar functions.
+    """
+
+    def __init__(self, core_loc: Union[str, OnChipCoordinate], device_id: int = 0, context: Context = None) -> None:
+        """
+        Resolves core location on the device.
+
+        Args:
+            core_loc (str | OnChipCoordinate): Either X-Y (noc0/translated) or X,Y (logical) location of a core in string format, dram channel (e.g. ch3), or OnChipCoordinate object.
+            device_id (int, default 0): ID number of device that core belongs to.
+            context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        """
+        context = check_context(context)
+        validate_device_id(device_id, context)
+
+        if not isinstance(core_loc, OnChipCoordinate):
+            core_loc = OnChipCoordinate.create(core_loc, device=context.devices[device_id])
+
+        self.context = context
+        self.device_id = device_id
+        self.core_loc = core_loc
+        self._server_ifc = context.server_ifc
+        self._has_jtag = context.devices[device_id]._has_jtag
+        if self._has_jtag:
+            self._noc_x, self._noc_y = core_loc.to("noc0")
+        else:
+            self._noc_x, self._noc_y = context.convert_loc_to_umd(core_loc)
+
+    def read32(self, addr: int) -> int:
+        """
+        Reads one word from address 'addr'.
+
+        Args:
+            addr (int): Memory address to read from.
+
+        Returns:
+            int: Data read from the device.
+        """
+        if self._has_jtag:
+            return self._server_ifc.jtag_read32(self.device_id, self._noc_x, self._noc_y, addr)
+        return self._server_ifc.pci_read32(self.device_id, self._noc_x, self._noc_y, addr)
+
+    def write32(self, addr: int, value: int) -> int:
+        """
+        Writes one word to address 'addr'.
+
+        Args:
+            addr (int): Memory address to write to.
+            value (int): 4-byte integer word to be written.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        if self._has_jtag:
+            return self._server_ifc.jtag_write32(self.device_id, self._noc_x, self._noc_y, addr, value)
+        return self._server_ifc.pci_write32(self.device_id, self._noc_x, self._noc_y, addr, value)
+
+    def read(self, addr: int, num_bytes: int) -> bytes:
+        """
+        Reads num_bytes of data starting from address 'addr'.
+
+        Args:
+            addr (int): Memory address to read from.
+            num_bytes (int): Number of bytes to read.
+
+        Returns:
+            bytes: Data read from the device.
+        """
+        if self._has_jtag:
+            words = [self.read32(addr + offset) for offset in range(0, num_bytes, 4)]
+            return struct.pack(f"<{len(words)}I", *words)[:num_bytes]
+        return self._server_ifc.pci_read(self.device_id, self._noc_x, self._noc_y, addr, num_bytes)
+
+    def write(self, addr: int, data: bytes) -> int:
+        """
+        Writes data starting at address 'addr'.
+
+        Args:
+            addr (int): Memory address to write to.
+            data (bytes): Data to be written. JTAG devices require length to be a multiple of 4 bytes.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        if self._has_jtag:
+            for i, word in enumerate(struct.unpack(f"<{len(data) // 4}I", data)):
+                self.write32(addr + i * 4, word)
+            return len(data)
+        return self._server_ifc.pci_write(self.device_id, self._noc_x, self._noc_y, addr, data)
+
+
 def load_elf(
     elf_file: os.PathLike,
     core_loc: Union[str, OnChipCoordinate, List[Union[str, OnChipCoordinate]]],
@@ -213,8 +811,6 @@ def load_elf(
             device_id (int, default 0):	ID number of device to run ELF on.
             context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
     """
-    from ttexalens.debug_risc import RiscLoader, RiscDebug, RiscLoc
-
     context = check_context(context)
 
     validate_device_id(device_id, context)
@@ -242,10 +838,7 @@ def load_elf(
         raise TTException(f"ELF file {elf_file} does not exist.")
 
     assert locs, "No valid core locations provided."
-    for loc in locs:
-        rdbg = RiscDebug(RiscLoc(loc, 0, risc_id), context, False)
-        rloader = RiscLoader(rdbg, context, False)
-        rloader.load_elf(elf_file)
+    _load_elf_on_cores(elf_file, locs, risc_id, context, run=False)
 
 
 def run_elf(
@@ -268,8 +861,6 @@ def run_elf(
             device_id (int, default 0):	ID number of device to run ELF on.
             context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
     """
-    from ttexalens.debug_risc import RiscLoader, RiscDebug, RiscLoc
-
     context = check_context(context)
 
     validate_device_id(device_id, context)
@@ -297,10 +888,44 @@ def run_elf(
         raise TTException(f"ELF file {elf_file} does not exist.")
 
     assert locs, "No valid core locations provided."
-    for loc in locs:
-        rdbg = RiscDebug(RiscLoc(loc, 0, risc_id), context, False)
-        rloader = RiscLoader(rdbg, context, False)
-        rloader.run_elf(elf_file)
+    _load_elf_on_cores(elf_file, locs, risc_id, context, run=True)
+
+
+def _load_elf_on_cores(
+    elf_file: os.PathLike, locs: List[OnChipCoordinate], risc_id: int, context: Context, run: bool
+) -> None:
+    from ttexalens.debug_risc import RiscLoader, RiscDebug, RiscLoc
+
+    loaders = [RiscLoader(RiscDebug(RiscLoc(loc, 0, risc_id), context, False), context, False) for loc in locs]
+    for rloader in loaders:
+        if not run:
+            assert rloader.risc_debug.is_in_reset(), f"RISC at location {rloader.risc_debug.location} is not in reset."
+        elif not rloader.risc_debug.is_in_reset():
+            rloader.risc_debug.set_reset_signal(1)
+
+    # ELF is parsed once and sections accessible through NOC, which are the same on every core, are written to all
+    # cores at once. Private sections and start address are then set up on every core in parallel.
+    load_plan = RiscLoader.create_load_plan(elf_file, context)
+    noc_sections_written = len(locs) > 1
+    if noc_sections_written:
+        RiscLoader.write_load_plan_to_cores(load_plan, locs, context)
+
+    def load(rloader):
+        if run:
+            rloader.run_elf(elf_file, noc_sections_written, load_plan)
+        else:
+            rloader.load_elf(elf_file, noc_sections_written, load_plan)
+
+    # JTAG requests are not issued concurrently
+    max_workers = 1 if locs[0]._device._has_jtag else ELF_LOAD_WORKERS
+    if max_workers == 1 or len(loaders) == 1:
+        for rloader in loaders:
+            load(rloader)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(loaders))) as executor:
+            # Iterating over results re-raises the first exception raised while loading
+            for _ in executor.map(load, loaders):
+                pass
 
 
 def check_context(context: Context = None) -> Context:
@@ -49,3 +49,31 @@ def arc_write(context: Context, device_id: int, core_loc: tuple, reg_addr: int,
         context.server_ifc.pci_write32_raw(device_id, reg_addr, value)
     else:
         context.server_ifc.pci_write32(device_id, *context.convert_loc_to_umd(core_loc), reg_addr, value)
+
+
+def arc_poll(
+    context: Context,
+    device_id: int,
+    core_loc: tuple,
+    reg_addr: int,
+    mask: int,
+    expected: int,
+    timeout_ms: int = 1000,
+) -> int:
+    """
+    Reads a 32-bit value from an ARC address space until (value & mask) == expected and returns the last read value.
+    Raises TTException if condition is not met before timeout expires.
+    """
+    if context.devices[device_id]._has_mmio:
+        # ARC registers of MMIO device are read directly over PCI (BAR), not over NOC
+        read_val, iterations = context.server_ifc.pci_poll32_raw(device_id, reg_addr, mask, expected, timeout_ms)
+    else:
+        read_val, iterations = context.server_ifc.pci_poll32(
+            device_id, *context.convert_loc_to_umd(core_loc), reg_addr, mask, expected, timeout_ms
+        )
+    if (read_val & mask) != expected:
+        raise TTException(
+            f"Timeout after {timeout_ms} ms ({iterations} reads) while polling ARC register 0x{reg_addr:08x}: "
+            f"(0x{read_val:08x} & 0x{mask:08x}) != 0x{expected:08x}."
+        )
+    return read_val
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Write-combining buffer used by Context.write_batch. Register programming sequences are usually many small writes to
+contiguous addresses; buffering them turns every run of such writes into a single bulk write.
+"""
+from typing import List, Tuple
+
+from ttexalens.coordinate import OnChipCoordinate
+
+
+class BufferedWrite:
+    """
+    Data waiting to be written to [address, address + len(data)) of one core.
+    """
+
+    def __init__(self, device_id: int, core_loc: OnChipCoordinate, address: int, data: bytes) -> None:
+        self.device_id = device_id
+        self.core_loc = core_loc
+        self.core: Tuple[int, int] = core_loc.to("noc0")
+        self.address = address
+        self.data = bytearray(data)
+
+    @property
+    def end(self) -> int:
+        return self.address + len(self.data)
+
+    def touches(self, device_id: int, core: Tuple[int, int], address: int, size: int) -> bool:
+        # True if range is adjacent to or overlaps this write
+        return (
+            self.device_id == device_id and self.core == core and address <= self.end and self.address <= address + size
+        )
+
+    def overlaps(self, device_id: int, core: Tuple[int, int], address: int, size: int) -> bool:
+        return (
+            self.device_id == device_id and self.core == core and address < self.end and self.address < address + size
+        )
+
+    def merge(self, address: int, data: bytes) -> None:
+        # Range of data must touch this write; data written later wins where they overlap
+        if address < self.address:
+            self.data[0:0] = bytes(self.address - address)
+            self.address = address
+        if address + len(data) > self.end:
+            self.data.extend(bytes(address + len(data) - self.end))
+        offset = address - self.address
+        self.data[offset : offset + len(data)] = data
+
+
+class WriteBatch:
+    """
+    Writes buffered by Context.write_batch. A write that is adjacent to or overlaps the previous buffered write to the
+    same core is merged into it; any other write starts a new bulk write. Bulk writes are flushed in the order they
+    were started, so writes to different addresses are never reordered relative to each other.
+
+    Only tt_exalens_lib functions take part in batching. Writes through server interface or CoreHandle go directly to
+    the device and don't flush the batch.
+    """
+
+    def __init__(self, context) -> None:
+        self.context = context
+        self.writes: List[BufferedWrite] = []
+
+    def write(self, device_id: int, core_loc: OnChipCoordinate, address: int, data: bytes) -> None:
+        if self.writes:
+            last = self.writes[-1]
+            if last.touches(device_id, core_loc.to("noc0"), address, len(data)):
+                last.merge(address, data)
+                return
+        self.writes.append(BufferedWrite(device_id, core_loc, address, data))
+
+    def flush(self) -> None:
+        """
+        Writes all buffered data to the device.
+        """
+        if not self.writes:
+            return
+
+        from ttexalens.tt_exalens_lib import _write_to_device
+
+        writes, self.writes = self.writes, []
+        for write in writes:
+            _write_to_device(self.context, write.device_id, write.core_loc, write.address, bytes(write.data))
+
+    def flush_overlapping(self, device_id: int, core_loc: OnChipCoordinate, address: int, size: int) -> None:
+        """
+        Flushes all buffered writes if any of them overlaps [address, address + size) of the core, so that the
+        following read returns data that was written.
+        """
+        if self.writes:
+            core = core_loc.to("noc0")
+            if any(write.overlaps(device_id, core, address, size) for write in self.writes):
+                self.flush()